@@ -22,6 +22,8 @@ from app.core.exceptions import (
     ValidationError,
     AuthenticationError,
     ExternalServiceError,
+    CircuitOpenError,
+    DeadlineExceededError,
     RepositoryError,
     ServiceError
 )
@@ -64,6 +66,8 @@ __all__ = [
     "ValidationError",
     "AuthenticationError",
     "ExternalServiceError",
+    "CircuitOpenError",
+    "DeadlineExceededError",
     "RepositoryError",
     "ServiceError",
     # Utilities
@@ -1,5 +1,7 @@
 """Application configuration and setup."""
 
+import asyncio
+from contextlib import asynccontextmanager, suppress
 from pathlib import Path
 from typing import Optional
 from fastapi import FastAPI, Request
@@ -12,6 +14,7 @@ from app.core.error_handler import global_exception_handler
 from app.core.exceptions import BaseApplicationException
 from app.core.middleware import SessionCookieMiddleware
 from app.core.constants import ROUTES
+from app.infrastructure.http_pool import get_transport_registry
 
 
 async def not_found_handler(request: Request, exc: StarletteHTTPException):
@@ -37,6 +40,20 @@ async def not_found_handler(request: Request, exc: StarletteHTTPException):
     )
 
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Own the pooled Jira transports for the lifetime of the application."""
+    registry = get_transport_registry()
+    reaper = asyncio.create_task(registry.run_reaper())
+    try:
+        yield
+    finally:
+        reaper.cancel()
+        with suppress(asyncio.CancelledError):
+            await reaper
+        await registry.aclose()
+
+
 def configure_exception_handlers(app: FastAPI) -> None:
     """Configure global exception handlers."""
     app.add_exception_handler(StarletteHTTPException, not_found_handler)
@@ -59,6 +76,7 @@ def configure_static_files(app: FastAPI, base_dir: Path) -> None:
 def configure_routes(app: FastAPI) -> None:
     """Configure application routes."""
     from app.presentation.api.v1.worklogs import router as worklogs_router
+    from app.presentation.api.v1.metrics import router as metrics_router
     from app.presentation.web.worklogs import router as ui_router
     from app.presentation.web.auth import router as auth_router
     
@@ -67,6 +85,7 @@ def configure_routes(app: FastAPI) -> None:
         return RedirectResponse(url=ROUTES["UI_WORKLOGS"])
     
     app.include_router(worklogs_router)
+    app.include_router(metrics_router)
     app.include_router(auth_router)
     app.include_router(ui_router)
 
@@ -81,7 +100,8 @@ def create_app(environment: Optional[str] = None) -> FastAPI:
         title="Jira Worklog Summary API",
         version="1.0.0",
         docs_url="/docs" if environment != "production" else None,
-        redoc_url="/redoc" if environment != "production" else None
+        redoc_url="/redoc" if environment != "production" else None,
+        lifespan=lifespan
     )
     
     base_dir = Path(__file__).resolve().parent.parent.parent
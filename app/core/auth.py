@@ -10,8 +10,11 @@ from app.core.config import (
     JIRA_OAUTH_AUTHORIZE_URL,
     JIRA_OAUTH_TOKEN_URL,
     JIRA_API_BASE_URL,
-    JIRA_DOMAIN
+    JIRA_DOMAIN,
+    AUTH_CACHE_TTL,
+    AUTH_CACHE_MAX_SIZE
 )
+from app.core.cache import TTLCache, token_fingerprint
 from app.core.logging import get_logger
 from app.core.exceptions import AuthenticationError, ExternalServiceError
 
@@ -20,6 +23,9 @@ OAUTH_SCOPES = "read:jira-work read:jira-user offline_access"
 
 _oauth_session = None
 
+_cloud_id_cache = TTLCache(max_size=AUTH_CACHE_MAX_SIZE, ttl=AUTH_CACHE_TTL, name="cloud_id")
+_user_info_cache = TTLCache(max_size=AUTH_CACHE_MAX_SIZE, ttl=AUTH_CACHE_TTL, name="user_info")
+
 
 def _get_oauth_session() -> requests.Session:
     """Get or create shared OAuth session with connection pooling."""
@@ -148,18 +154,31 @@ def get_accessible_resources(access_token: str) -> list:
 
 
 def get_cloud_id(access_token: str) -> str:
+    cache_key = token_fingerprint(access_token)
+    cloud_id = _cloud_id_cache.get(cache_key)
+    if cloud_id:
+        return cloud_id
+
     resources = get_accessible_resources(access_token)
     if not resources:
         raise AuthenticationError("No accessible Jira sites found for this account")
     
+    cloud_id = resources[0]["id"]
     for resource in resources:
         if JIRA_DOMAIN and JIRA_DOMAIN in resource.get("url", ""):
-            return resource["id"]
+            cloud_id = resource["id"]
+            break
     
-    return resources[0]["id"]
+    _cloud_id_cache.set(cache_key, cloud_id)
+    return cloud_id
 
 
 def get_user_info(access_token: str) -> dict:
+    cache_key = token_fingerprint(access_token)
+    cached = _user_info_cache.get(cache_key)
+    if cached:
+        return dict(cached)
+
     headers = {
         "Accept": "application/json",
         "Authorization": f"Bearer {access_token}"
@@ -176,6 +195,7 @@ def get_user_info(access_token: str) -> dict:
         
         user_data = response.json()
         user_data["cloudId"] = cloud_id
+        _user_info_cache.set(cache_key, dict(user_data))
         return user_data
     except (AuthenticationError, ExternalServiceError):
         raise
@@ -199,3 +219,10 @@ def get_user_info(access_token: str) -> dict:
     finally:
         if response:
             response.close()
+
+
+def get_auth_cache_stats() -> dict:
+    return {
+        "cloudId": _cloud_id_cache.stats(),
+        "userInfo": _user_info_cache.stats()
+    }
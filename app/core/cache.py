@@ -0,0 +1,140 @@
+"""In-memory caching utilities."""
+
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+
+class TTLCache:
+    """Thread-safe LRU cache whose entries expire after a fixed time-to-live.
+
+    Once ``max_size`` entries are stored, the least recently used entry is
+    evicted to make room for a new one. With ``max_bytes``, entries are also
+    evicted while the sizes reported by ``sizeof`` add up to more than it,
+    and a value larger than ``max_bytes`` on its own is not stored. Expired
+    entries are kept for a further ``max_stale`` seconds so ``get_stale``
+    can serve them as a fallback when the source of truth is unavailable.
+    """
+
+    def __init__(
+        self,
+        max_size: int,
+        ttl: float,
+        name: str = "cache",
+        max_stale: float = 0,
+        max_bytes: int = 0,
+        sizeof: Optional[Callable[[Any], int]] = None
+    ):
+        self._max_size = max(1, max_size)
+        self._ttl = ttl
+        self._max_stale = max(0, max_stale)
+        self._max_bytes = max(0, max_bytes)
+        self._sizeof = sizeof if self._max_bytes else None
+        self._name = name
+        self._entries: "OrderedDict[Hashable, tuple]" = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._expirations = 0
+        self._stale_hits = 0
+        self._oversized = 0
+
+    @property
+    def ttl(self) -> float:
+        return self._ttl
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Return the cached value for ``key``, or ``None`` if missing or expired."""
+        entry = self.get_entry(key)
+        return entry[0] if entry is not None else None
+
+    def get_entry(self, key: Hashable) -> Optional[Tuple[Any, float]]:
+        """Return ``(value, age_seconds)`` for ``key``, or ``None`` if missing or expired."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._misses += 1
+                return None
+
+            value, stored_at, _ = entry
+            age = time.monotonic() - stored_at
+            if age >= self._ttl:
+                if age >= self._ttl + self._max_stale:
+                    self._remove(key)
+                self._expirations += 1
+                self._misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return value, age
+
+    def get_stale(self, key: Hashable) -> Optional[Tuple[Any, float]]:
+        """Return ``(value, age_seconds)`` for ``key`` even if expired, within the ``max_stale`` allowance."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            value, stored_at, _ = entry
+            age = time.monotonic() - stored_at
+            if age >= self._ttl + self._max_stale:
+                self._remove(key)
+                return None
+            self._stale_hits += 1
+            return value, age
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """Store ``value`` under ``key``, evicting least recently used entries if full."""
+        size = self._sizeof(value) if self._sizeof is not None else 0
+        with self._lock:
+            self._remove(key)
+            if size > self._max_bytes > 0:
+                self._oversized += 1
+                return
+            self._entries[key] = (value, time.monotonic(), size)
+            self._bytes += size
+            while len(self._entries) > self._max_size or (self._max_bytes and self._bytes > self._max_bytes):
+                _, (_, _, evicted_size) = self._entries.popitem(last=False)
+                self._bytes -= evicted_size
+                self._evictions += 1
+
+    def delete(self, key: Hashable) -> None:
+        with self._lock:
+            self._remove(key)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def _remove(self, key: Hashable) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._bytes -= entry[2]
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "name": self._name,
+                "size": len(self._entries),
+                "maxSize": self._max_size,
+                "bytes": self._bytes,
+                "maxBytes": self._max_bytes,
+                "ttlSeconds": self._ttl,
+                "maxStaleSeconds": self._max_stale,
+                "hits": self._hits,
+                "misses": self._misses,
+                "evictions": self._evictions,
+                "expirations": self._expirations,
+                "staleHits": self._stale_hits,
+                "oversized": self._oversized
+            }
+
+
+def token_fingerprint(token: str) -> str:
+    """Return a stable, non-reversible cache key for an access token."""
+    return hashlib.sha256(token.encode("utf-8")).hexdigest()
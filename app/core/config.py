@@ -22,6 +22,42 @@ JIRA_API_BASE_URL = os.getenv(
     "https://api.atlassian.com"
 )
 
+JIRA_WORKLOG_FETCH_WORKERS = int(os.getenv("JIRA_WORKLOG_FETCH_WORKERS", "8"))
+JIRA_WORKLOG_FETCH_STRATEGY = os.getenv("JIRA_WORKLOG_FETCH_STRATEGY", "per_issue")
+
+JIRA_HTTP_POOL_SIZE = int(os.getenv("JIRA_HTTP_POOL_SIZE", "20"))
+JIRA_HTTP_KEEPALIVE_EXPIRY = float(os.getenv("JIRA_HTTP_KEEPALIVE_EXPIRY", "30"))
+JIRA_HTTP_IDLE_TIMEOUT = float(os.getenv("JIRA_HTTP_IDLE_TIMEOUT", "300"))
+
+JIRA_RATE_LIMIT_PER_SECOND = float(os.getenv("JIRA_RATE_LIMIT_PER_SECOND", "10"))
+JIRA_RATE_LIMIT_BURST = float(os.getenv("JIRA_RATE_LIMIT_BURST", "20"))
+JIRA_RETRY_MAX_ATTEMPTS = int(os.getenv("JIRA_RETRY_MAX_ATTEMPTS", "3"))
+JIRA_RETRY_BACKOFF_BASE = float(os.getenv("JIRA_RETRY_BACKOFF_BASE", "0.5"))
+JIRA_RETRY_BACKOFF_MAX = float(os.getenv("JIRA_RETRY_BACKOFF_MAX", "30"))
+
+JIRA_CONCURRENCY_INITIAL = int(os.getenv("JIRA_CONCURRENCY_INITIAL", "8"))
+JIRA_CONCURRENCY_MIN = int(os.getenv("JIRA_CONCURRENCY_MIN", "2"))
+JIRA_CONCURRENCY_MAX = int(os.getenv("JIRA_CONCURRENCY_MAX", "32"))
+
+JIRA_BREAKER_FAILURE_THRESHOLD = int(os.getenv("JIRA_BREAKER_FAILURE_THRESHOLD", "5"))
+JIRA_BREAKER_RESET_TIMEOUT = float(os.getenv("JIRA_BREAKER_RESET_TIMEOUT", "30"))
+
+AUTH_CACHE_TTL = float(os.getenv("AUTH_CACHE_TTL", "300"))
+AUTH_CACHE_MAX_SIZE = int(os.getenv("AUTH_CACHE_MAX_SIZE", "1024"))
+
+SUMMARY_CACHE_TTL = float(os.getenv("SUMMARY_CACHE_TTL", "120"))
+SUMMARY_CACHE_MAX_SIZE = int(os.getenv("SUMMARY_CACHE_MAX_SIZE", "256"))
+SUMMARY_CACHE_MAX_MB = float(os.getenv("SUMMARY_CACHE_MAX_MB", "64"))
+SUMMARY_CACHE_STALE_WHILE_REVALIDATE = float(os.getenv("SUMMARY_CACHE_STALE_WHILE_REVALIDATE", "600"))
+SUMMARY_CACHE_MAX_STALE = float(os.getenv("SUMMARY_CACHE_MAX_STALE", "3600"))
+
+WORKLOG_STORE_PATH = os.getenv("WORKLOG_STORE_PATH", "")
+WORKLOG_SYNC_INTERVAL = float(os.getenv("WORKLOG_SYNC_INTERVAL", "60"))
+WORKLOG_SYNC_MAX_AGE = float(os.getenv("WORKLOG_SYNC_MAX_AGE", "300"))
+WORKLOG_SYNC_LOOKBACK_DAYS = int(os.getenv("WORKLOG_SYNC_LOOKBACK_DAYS", "90"))
+
+REQUEST_DEADLINE_SECONDS = float(os.getenv("REQUEST_DEADLINE_SECONDS", "60"))
+
 SECRET_KEY = os.getenv("SECRET_KEY", "change-this-secret-key-in-production")
 
 if not JIRA_DOMAIN:
@@ -5,7 +5,8 @@ API_V1_PREFIX = "/api/v1"
 API_TAGS = {
     "WORKLOGS": "Worklogs",
     "AUTH": "Auth",
-    "UI": "UI"
+    "UI": "UI",
+    "METRICS": "Metrics"
 }
 
 # Route Paths
@@ -18,7 +19,9 @@ ROUTES = {
     "AUTH_LOGOUT": "/auth/logout",
     "AUTH_ME": "/auth/me",
     "AUTH_DENIED": "/auth/denied",
-    "API_WORKLOGS_SUMMARY": f"{API_V1_PREFIX}/jira-worklogs/summary"
+    "API_WORKLOGS_SUMMARY": f"{API_V1_PREFIX}/jira-worklogs/summary",
+    "API_WORKLOGS_SUMMARY_STREAM": f"{API_V1_PREFIX}/jira-worklogs/summary/stream",
+    "API_METRICS": f"{API_V1_PREFIX}/metrics"
 }
 
 # Session Keys
@@ -40,3 +43,23 @@ SECONDS_PER_MINUTE = 60
 # Jira API Constants
 JIRA_API_VERSION = "3"
 JIRA_MAX_RESULTS = 100
+JIRA_REQUEST_TIMEOUT = 30
+JIRA_WORKLOG_PAGE_SIZE = 1000
+JIRA_WORKLOG_LIST_BATCH_SIZE = 1000
+JIRA_ISSUE_ID_BATCH_SIZE = 100
+JQL_DATE_MARGIN_DAYS = 1
+JIRA_ISSUE_FIELDS = ["summary", "reporter", "issuetype", "status", "priority", "assignee", "timeoriginalestimate"]
+
+# Summary Stream Events
+SUMMARY_EVENT_FRAGMENT = "fragment"
+SUMMARY_EVENT_TOTALS = "totals"
+SUMMARY_EVENT_ERROR = "error"
+
+# Worklog Record Stream Types
+RECORD_TYPE_WORKLOG = "worklog"
+RECORD_TYPE_COMPLETENESS = "completeness"
+RECORD_TYPE_ERROR = "error"
+
+# Worklog Fetch Strategies
+WORKLOG_FETCH_PER_ISSUE = "per_issue"
+WORKLOG_FETCH_EMBEDDED = "embedded"
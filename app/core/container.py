@@ -1,17 +1,111 @@
 """Dependency injection container."""
 
+import threading
 from typing import Optional
 
-from app.domain.interfaces import IJiraClient, IWorklogRepository, IWorklogService
+from app.domain.interfaces import (
+    IJiraClient,
+    IAsyncJiraClient,
+    IAsyncWorklogRepository,
+    IAsyncWorklogService,
+    IWorklogStore
+)
 from app.infrastructure.jira_client import JiraClient
-from app.domain.repositories.worklog_repository import WorklogRepository
-from app.domain.services.worklog_service import WorklogService
+from app.infrastructure.async_jira_client import AsyncJiraClient
+from app.infrastructure.worklog_store import SqliteWorklogStore
+from app.domain.repositories.async_worklog_repository import AsyncWorklogRepository
+from app.domain.repositories.local_worklog_repository import (
+    LocalWorklogRepository,
+    AsyncLocalWorklogRepository
+)
+from app.domain.services.worklog_service import AsyncWorklogService
+from app.domain.services.worklog_sync_service import WorklogSyncService
 from app.core.dependencies import AuthenticatedUser
+from app.core.cache import TTLCache
+from app.core.singleflight import SingleFlight, AsyncSingleFlight
+from app.utils.serialization import json_size
+from app.core.config import (
+    JIRA_WORKLOG_FETCH_WORKERS,
+    JIRA_WORKLOG_FETCH_STRATEGY,
+    SUMMARY_CACHE_TTL,
+    SUMMARY_CACHE_MAX_SIZE,
+    SUMMARY_CACHE_MAX_MB,
+    SUMMARY_CACHE_MAX_STALE,
+    SUMMARY_CACHE_STALE_WHILE_REVALIDATE,
+    WORKLOG_STORE_PATH,
+    WORKLOG_SYNC_INTERVAL,
+    WORKLOG_SYNC_LOOKBACK_DAYS,
+    WORKLOG_SYNC_MAX_AGE
+)
+
+_summary_cache = TTLCache(
+    max_size=SUMMARY_CACHE_MAX_SIZE,
+    ttl=SUMMARY_CACHE_TTL,
+    name="worklog_summary",
+    max_stale=max(SUMMARY_CACHE_MAX_STALE, SUMMARY_CACHE_STALE_WHILE_REVALIDATE),
+    # Summaries range from a few hundred bytes to megabytes, so bound them by
+    # encoded size as well as count; live dicts take a small multiple of it.
+    max_bytes=int(SUMMARY_CACHE_MAX_MB * 1024 * 1024),
+    sizeof=json_size
+)
+_async_summary_single_flight = AsyncSingleFlight()
+_sync_single_flight = SingleFlight()
+_async_sync_single_flight = AsyncSingleFlight()
+_worklog_store: Optional[IWorklogStore] = None
+_worklog_store_lock = threading.Lock()
 
 
 class Container:
     """Dependency injection container."""
 
+    @staticmethod
+    def get_summary_cache() -> TTLCache:
+        """Return the process-wide worklog summary cache."""
+        return _summary_cache
+
+    @staticmethod
+    def get_async_summary_single_flight() -> AsyncSingleFlight:
+        """Return the process-wide coalescer for async summary requests."""
+        return _async_summary_single_flight
+
+    @staticmethod
+    def get_worklog_store() -> Optional[IWorklogStore]:
+        """Return the process-wide local worklog store, or ``None`` when disabled."""
+        global _worklog_store
+        if not WORKLOG_STORE_PATH:
+            return None
+        with _worklog_store_lock:
+            if _worklog_store is None:
+                _worklog_store = SqliteWorklogStore(WORKLOG_STORE_PATH)
+            return _worklog_store
+
+    @staticmethod
+    def get_local_worklog_repository(user: AuthenticatedUser) -> Optional[LocalWorklogRepository]:
+        """Create a store-backed repository for the user, or ``None`` when the store is disabled."""
+        store = Container.get_worklog_store()
+        if store is None:
+            return None
+        sync_service = WorklogSyncService(
+            jira_client=Container.get_jira_client(
+                access_token=user.access_token,
+                cloud_id=user.cloud_id
+            ),
+            store=store,
+            cloud_id=user.cloud_id,
+            account_id=user.account_id,
+            lookback_days=WORKLOG_SYNC_LOOKBACK_DAYS,
+            min_interval=WORKLOG_SYNC_INTERVAL,
+            max_age=WORKLOG_SYNC_MAX_AGE,
+            single_flight=_sync_single_flight
+        )
+        return LocalWorklogRepository(
+            store=store,
+            sync_service=sync_service,
+            cloud_id=user.cloud_id,
+            user_account_id=user.account_id,
+            time_zone=user.time_zone
+        )
+
     @staticmethod
     def get_jira_client(
         access_token: Optional[str] = None,
@@ -21,31 +115,62 @@ class Container:
         return JiraClient(access_token=access_token, cloud_id=cloud_id)
 
     @staticmethod
-    def get_worklog_repository(jira_client: IJiraClient) -> IWorklogRepository:
-        """Create and return worklog repository instance."""
-        return WorklogRepository(jira_client=jira_client)
+    def get_async_jira_client(
+        access_token: Optional[str] = None,
+        cloud_id: Optional[str] = None
+    ) -> IAsyncJiraClient:
+        """Create and return async Jira client instance on the shared connection pool."""
+        return AsyncJiraClient(access_token=access_token, cloud_id=cloud_id)
+
+    @staticmethod
+    def get_async_worklog_repository(
+        jira_client: IAsyncJiraClient,
+        time_zone: Optional[str] = None
+    ) -> IAsyncWorklogRepository:
+        """Create and return async worklog repository instance."""
+        return AsyncWorklogRepository(
+            jira_client=jira_client,
+            max_workers=JIRA_WORKLOG_FETCH_WORKERS,
+            fetch_strategy=JIRA_WORKLOG_FETCH_STRATEGY,
+            time_zone=time_zone
+        )
 
     @staticmethod
-    def get_worklog_service(
-        worklog_repository: IWorklogRepository,
-        user_account_id: Optional[str] = None
-    ) -> IWorklogService:
-        """Create and return worklog service instance."""
-        return WorklogService(
+    def get_async_worklog_service(
+        worklog_repository: IAsyncWorklogRepository,
+        user_account_id: Optional[str] = None,
+        cloud_id: Optional[str] = None,
+        time_zone: Optional[str] = None
+    ) -> IAsyncWorklogService:
+        """Create and return async worklog service instance."""
+        return AsyncWorklogService(
             worklog_repository=worklog_repository,
-            user_account_id=user_account_id
+            user_account_id=user_account_id,
+            cloud_id=cloud_id,
+            time_zone=time_zone,
+            summary_cache=Container.get_summary_cache(),
+            single_flight=Container.get_async_summary_single_flight(),
+            stale_while_revalidate=SUMMARY_CACHE_STALE_WHILE_REVALIDATE
         )
 
     @staticmethod
-    def get_worklog_service_for_user(user: AuthenticatedUser) -> IWorklogService:
-        """Get worklog service configured for authenticated user."""
-        jira_client = Container.get_jira_client(
+    def get_async_worklog_service_for_user(user: AuthenticatedUser) -> IAsyncWorklogService:
+        """Get async worklog service configured for authenticated user."""
+        jira_client = Container.get_async_jira_client(
             access_token=user.access_token,
             cloud_id=user.cloud_id
         )
-        repository = Container.get_worklog_repository(jira_client)
-        service = Container.get_worklog_service(
+        repository = Container.get_async_worklog_repository(jira_client, time_zone=user.time_zone)
+        local_repository = Container.get_local_worklog_repository(user)
+        if local_repository is not None:
+            repository = AsyncLocalWorklogRepository(
+                local_repository,
+                fallback=repository,
+                single_flight=_async_sync_single_flight
+            )
+        return Container.get_async_worklog_service(
             repository,
-            user_account_id=user.account_id
+            user_account_id=user.account_id,
+            cloud_id=user.cloud_id,
+            time_zone=user.time_zone
         )
-        return service
@@ -0,0 +1,106 @@
+"""Per-request deadlines shared by every Jira call made on behalf of a request."""
+
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import AsyncGenerator, AsyncIterator, Generator, Iterator, Optional, TypeVar
+
+from app.core.config import REQUEST_DEADLINE_SECONDS
+from app.core.exceptions import DeadlineExceededError
+
+T = TypeVar("T")
+
+
+class Deadline:
+    """A fixed time budget, measured on the monotonic clock from creation."""
+
+    def __init__(self, seconds: float):
+        self._budget = seconds
+        self._expires_at = time.monotonic() + seconds
+
+    @property
+    def budget(self) -> float:
+        return self._budget
+
+    def remaining(self) -> float:
+        return max(0.0, self._expires_at - time.monotonic())
+
+    @property
+    def expired(self) -> bool:
+        return self.remaining() <= 0
+
+    def error(self) -> DeadlineExceededError:
+        return DeadlineExceededError(service_name="Jira", budget=self._budget)
+
+    def check(self) -> None:
+        """Raise ``DeadlineExceededError`` if the budget is spent."""
+        if self.expired:
+            raise self.error()
+
+    def timeout(self, default: float) -> float:
+        """Return ``default`` capped to the remaining budget, raising if nothing is left."""
+        self.check()
+        return min(default, self.remaining())
+
+
+_current_deadline: ContextVar[Optional[Deadline]] = ContextVar("deadline", default=None)
+
+
+def current_deadline() -> Optional[Deadline]:
+    """Return the deadline of the request being served in this context, if any."""
+    return _current_deadline.get()
+
+
+@contextmanager
+def deadline_scope(deadline: Optional[Deadline]) -> Iterator[None]:
+    """Make ``deadline`` the current deadline for code run inside the block.
+
+    Asyncio tasks created inside the block inherit it; work handed to threads
+    must be submitted through ``contextvars.copy_context().run``.
+    """
+    token = _current_deadline.set(deadline)
+    try:
+        yield
+    finally:
+        _current_deadline.reset(token)
+
+
+def iter_in_scope(deadline: Optional[Deadline], generator: Generator[T, None, None]) -> Iterator[T]:
+    """Advance ``generator`` under ``deadline``, leaving the caller's context untouched between items.
+
+    A generator cannot hold ``deadline_scope`` open across ``yield``, because
+    the consumer's code would then run inside the scope. ``generator`` is
+    closed as soon as the caller stops iterating.
+    """
+    try:
+        while True:
+            with deadline_scope(deadline):
+                try:
+                    item = next(generator)
+                except StopIteration:
+                    return
+            yield item
+    finally:
+        generator.close()
+
+
+async def aiter_in_scope(deadline: Optional[Deadline], generator: AsyncGenerator[T, None]) -> AsyncIterator[T]:
+    """Async counterpart of ``iter_in_scope``."""
+    try:
+        while True:
+            with deadline_scope(deadline):
+                try:
+                    item = await generator.__anext__()
+                except StopAsyncIteration:
+                    return
+            yield item
+    finally:
+        await generator.aclose()
+
+
+def resolve_deadline(requested_seconds: Optional[float] = None) -> Deadline:
+    """Build a request deadline; clients may shorten the configured budget but not extend it."""
+    seconds = REQUEST_DEADLINE_SECONDS
+    if requested_seconds is not None and 0 < requested_seconds < seconds:
+        seconds = requested_seconds
+    return Deadline(seconds)
@@ -14,12 +14,21 @@ from app.core.constants import ROUTES
 
 
 class AuthenticatedUser:
-    def __init__(self, account_id: str, display_name: str, email: str, access_token: str, cloud_id: str = None):
+    def __init__(
+        self,
+        account_id: str,
+        display_name: str,
+        email: str,
+        access_token: str,
+        cloud_id: str = None,
+        time_zone: str = None
+    ):
         self.account_id = account_id
         self.display_name = display_name
         self.email = email
         self.access_token = access_token
         self.cloud_id = cloud_id
+        self.time_zone = time_zone
 
 
 def get_current_user(request: Request) -> Union[AuthenticatedUser, RedirectResponse]:
@@ -40,7 +49,8 @@ def get_current_user(request: Request) -> Union[AuthenticatedUser, RedirectRespo
         display_name=user_info.get("displayName", ""),
         email=user_info.get("emailAddress", ""),
         access_token=access_token,
-        cloud_id=user_info.get("cloudId")
+        cloud_id=user_info.get("cloudId"),
+        time_zone=user_info.get("timeZone")
     )
 
 
@@ -1,9 +1,11 @@
 """Error handling utilities and decorators."""
 
+import inspect
 from functools import wraps
 from typing import Callable, Any
 from fastapi import HTTPException, Request
 from fastapi.responses import JSONResponse
+from starlette.concurrency import run_in_threadpool
 
 from app.core.exceptions import BaseApplicationException
 from app.core.logging import get_logger
@@ -12,17 +14,18 @@ logger = get_logger(__name__)
 
 
 def handle_exceptions(func: Callable) -> Callable:
-    """Decorator to handle exceptions and convert to HTTP responses."""
+    """Decorator to handle exceptions and convert to HTTP responses.
+
+    Coroutine handlers are awaited on the event loop; plain functions are run in
+    the threadpool so blocking I/O never stalls other requests on the worker.
+    """
     
     @wraps(func)
     async def wrapper(*args, **kwargs):
         try:
-            if hasattr(func, '__wrapped__'):
+            if inspect.iscoroutinefunction(func):
                 return await func(*args, **kwargs)
-            result = func(*args, **kwargs)
-            if hasattr(result, '__await__'):
-                return await result
-            return result
+            return await run_in_threadpool(func, *args, **kwargs)
         except BaseApplicationException as e:
             logger.error(
                 f"Application error in {func.__name__}",
@@ -88,6 +88,47 @@ class ExternalServiceError(BaseApplicationException):
         )
 
 
+class CircuitOpenError(ExternalServiceError):
+    """Exception raised without calling an external service whose circuit breaker is open."""
+
+    def __init__(
+        self,
+        service_name: str,
+        retry_after: float = 0,
+        details: Optional[Dict[str, Any]] = None
+    ):
+        merged_details = details.copy() if details else {}
+        merged_details["circuit"] = "open"
+        merged_details["retryAfterSeconds"] = round(retry_after, 1)
+        super().__init__(
+            message=f"{service_name} is currently unavailable; failing fast while the circuit is open",
+            service_name=service_name,
+            status_code=503,
+            details=merged_details
+        )
+        self.retry_after = retry_after
+
+
+class DeadlineExceededError(ExternalServiceError):
+    """Exception raised when a request's time budget runs out before the external service answered."""
+
+    def __init__(
+        self,
+        service_name: str,
+        budget: float,
+        details: Optional[Dict[str, Any]] = None
+    ):
+        merged_details = details.copy() if details else {}
+        merged_details["budgetSeconds"] = budget
+        super().__init__(
+            message=f"{service_name} did not respond within the {budget:g}s request deadline",
+            service_name=service_name,
+            status_code=504,
+            details=merged_details
+        )
+        self.error_code = "DEADLINE_EXCEEDED"
+
+
 class RepositoryError(BaseApplicationException):
     """Exception for repository/data access errors."""
     
@@ -0,0 +1,108 @@
+"""Coalescing of identical concurrent calls ("single-flight")."""
+
+import asyncio
+import threading
+from typing import Any, Awaitable, Callable, Dict, Hashable
+
+
+class _Call:
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: BaseException = None
+
+
+class SingleFlight:
+    """Run at most one call per key at a time; concurrent callers share its outcome.
+
+    The first caller for a key executes ``fn``. Callers arriving while it is
+    in flight block until it finishes and receive the same result, or the
+    same exception.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls: Dict[Hashable, _Call] = {}
+        self._executions = 0
+        self._coalesced = 0
+
+    def do(self, key: Hashable, fn: Callable[[], Any]) -> Any:
+        with self._lock:
+            call = self._calls.get(key)
+            if call is not None:
+                self._coalesced += 1
+                leader = False
+            else:
+                call = self._calls[key] = _Call()
+                self._executions += 1
+                leader = True
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        return self._run(key, call, fn)
+
+    def _run(self, key: Hashable, call: _Call, fn: Callable[[], Any]) -> Any:
+        try:
+            call.result = fn()
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                self._calls.pop(key, None)
+            call.done.set()
+        return call.result
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "inFlight": len(self._calls),
+                "executions": self._executions,
+                "coalesced": self._coalesced
+            }
+
+
+class AsyncSingleFlight:
+    """Asyncio counterpart of ``SingleFlight``.
+
+    The shared computation runs in its own task, so a waiter being cancelled
+    (e.g. its client disconnecting) does not cancel it for the others.
+    """
+
+    def __init__(self):
+        self._tasks: Dict[Hashable, asyncio.Task] = {}
+        self._executions = 0
+        self._coalesced = 0
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[Any]]) -> Any:
+        task = self._tasks.get(key)
+        if task is not None:
+            self._coalesced += 1
+        else:
+            task = self.start(key, fn)
+        return await asyncio.shield(task)
+
+    def start(self, key: Hashable, fn: Callable[[], Awaitable[Any]]) -> asyncio.Task:
+        """Start the call for ``key`` without waiting for it, or return the one already in flight."""
+        task = self._tasks.get(key)
+        if task is None:
+            task = asyncio.ensure_future(fn())
+            self._tasks[key] = task
+            self._executions += 1
+            task.add_done_callback(lambda finished: self._forget(key, finished))
+        return task
+
+    def _forget(self, key: Hashable, task: asyncio.Task) -> None:
+        if self._tasks.get(key) is task:
+            del self._tasks[key]
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "inFlight": len(self._tasks),
+            "executions": self._executions,
+            "coalesced": self._coalesced
+        }
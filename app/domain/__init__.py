@@ -3,15 +3,38 @@
 from app.domain.interfaces import (
     IJiraClient,
     IWorklogRepository,
-    IWorklogService
+    IAsyncJiraClient,
+    IAsyncWorklogRepository,
+    IAsyncWorklogService,
+    IWorklogStore,
+    IWorklogSyncService
+)
+from app.domain.aggregation import WorklogAggregator
+from app.domain.completeness import FetchCompleteness
+from app.domain.summary_formats import normalize_summary, summary_version
+from app.domain.services.worklog_service import AsyncWorklogService
+from app.domain.services.worklog_sync_service import WorklogSyncService
+from app.domain.repositories.async_worklog_repository import AsyncWorklogRepository
+from app.domain.repositories.local_worklog_repository import (
+    LocalWorklogRepository,
+    AsyncLocalWorklogRepository
 )
-from app.domain.services.worklog_service import WorklogService
-from app.domain.repositories.worklog_repository import WorklogRepository
 
 __all__ = [
     "IJiraClient",
     "IWorklogRepository",
-    "IWorklogService",
-    "WorklogService",
-    "WorklogRepository",
+    "IAsyncJiraClient",
+    "IAsyncWorklogRepository",
+    "IAsyncWorklogService",
+    "IWorklogStore",
+    "IWorklogSyncService",
+    "WorklogAggregator",
+    "FetchCompleteness",
+    "normalize_summary",
+    "summary_version",
+    "AsyncWorklogService",
+    "WorklogSyncService",
+    "AsyncWorklogRepository",
+    "LocalWorklogRepository",
+    "AsyncLocalWorklogRepository",
 ]
@@ -0,0 +1,201 @@
+"""Aggregation of Jira issues and their worklogs into summaries."""
+
+from typing import List, Dict, Any, Iterator, Optional
+
+from app.domain.records import DaySummary, Issue, IssueDay, Person, Worklog
+from app.domain.summary_formats import issue_sort_key
+from app.utils.helpers import extract_comment, format_seconds
+from app.utils.timestamps import TimestampFormatter, format_display_date
+
+
+class WorklogAggregator:
+    """Filters issues' worklogs to one account and date range and builds summaries from them.
+
+    The repositories fetch ``(issue, worklogs)`` pairs from Jira or the local
+    store and hand them here, to be collected into a summary, its per-issue
+    fragments or flat worklog records.
+
+    Worklogs are grouped by their start date in ``time_zone`` (the viewer's
+    Jira profile time zone), and their times are shown in it; without one,
+    the offset Jira returned each timestamp in is kept.
+    """
+
+    def __init__(self, time_zone: Optional[str] = None):
+        self._timestamps = TimestampFormatter(time_zone)
+
+    def worklog_records(
+        self,
+        issue: Dict[str, Any],
+        worklogs: List[Dict[str, Any]],
+        account_id: str,
+        start_date: str,
+        end_date: str
+    ) -> Iterator[Dict[str, Any]]:
+        """Yield one flat record per worklog of ``account_id`` within the date range."""
+        fields = issue["fields"]
+        issue_type = fields.get("issuetype") or {}
+        status = fields.get("status") or {}
+        priority = fields.get("priority") or {}
+
+        for wl in worklogs:
+            if wl["author"]["accountId"] != account_id:
+                continue
+
+            worklog_date = self._timestamps.work_date(wl["started"])
+            if not (start_date <= worklog_date <= end_date):
+                continue
+
+            yield {
+                "workDate": worklog_date,
+                "issueKey": issue["key"],
+                "issueSummary": fields["summary"],
+                "issueType": issue_type.get("name"),
+                "status": status.get("name"),
+                "priority": priority.get("name"),
+                "originalEstimate": fields.get("timeoriginalestimate"),
+                "worklogId": wl["id"],
+                "timeSpentSeconds": wl["timeSpentSeconds"],
+                "started": wl["started"],
+                "updated": wl.get("updated", ""),
+                "comment": extract_comment(wl.get("comment")),
+                "authorAccountId": wl["author"]["accountId"]
+            }
+
+    def collect_worklogs(
+        self,
+        daily_data: Dict[str, DaySummary],
+        issue: Dict[str, Any],
+        worklogs: List[Dict[str, Any]],
+        account_id: str,
+        start_date: str,
+        end_date: str
+    ) -> None:
+        issue_record = None
+        author = None
+
+        for wl in worklogs:
+            worklog_author = wl["author"]
+            if worklog_author["accountId"] != account_id:
+                continue
+
+            started = wl["started"]
+            local_parts = self._timestamps.local_parts(started)
+            worklog_date, started_time = local_parts or (started[:10], started[11:16])
+            if not (start_date <= worklog_date <= end_date):
+                continue
+
+            if issue_record is None:
+                # Every worklog kept here is by ``account_id``, so one author record serves them all.
+                issue_record = Issue.from_jira(issue)
+                author = Person(account_id, worklog_author.get("displayName", "Unknown"))
+
+            day = daily_data.get(worklog_date)
+            if day is None:
+                day = daily_data[worklog_date] = DaySummary(worklog_date, 0, {})
+
+            issue_day = day.issues.get(issue_record.key)
+            if issue_day is None:
+                issue_day = day.issues[issue_record.key] = IssueDay(issue_record, 0, [])
+
+            time_seconds = wl["timeSpentSeconds"]
+            issue_day.worklogs.append(Worklog(
+                wl["id"],
+                extract_comment(wl.get("comment")),
+                time_seconds,
+                started,
+                started_time,
+                wl.get("updated", ""),
+                author
+            ))
+            issue_day.total_seconds += time_seconds
+            day.total_seconds += time_seconds
+
+    def format_response(self, daily_data: Dict[str, DaySummary]) -> List[Dict[str, Any]]:
+        """Convert collected records to the API's dict shape, consuming ``daily_data``.
+
+        Days are in date order, and each day's issues in ``issue_sort_key``
+        order whatever order they were fetched in. Days are removed from
+        ``daily_data`` as they are converted, so records and dicts for the
+        whole range are never held at once. Person and issue metadata dicts are
+        built once and shared by every day they appear on.
+        """
+        people: Dict[Person, Dict[str, Any]] = {}
+        issue_metadata: Dict[str, Dict[str, Any]] = {}
+        result = []
+        for work_date in sorted(daily_data):
+            day = daily_data.pop(work_date)
+            result.append({
+                "workDate": work_date,
+                "workDateFormatted": format_display_date(work_date),
+                "daySummary": {
+                    "totalTimeSpentSeconds": day.total_seconds,
+                    "totalTimeSpentFormatted": format_seconds(day.total_seconds)
+                },
+                "issues": [
+                    self._issue_entry(work_date, issue_day, issue_metadata, people)
+                    for issue_day in sorted(day.issues.values(), key=lambda d: issue_sort_key(d.issue.key))
+                ]
+            })
+
+        return result
+
+    def _issue_entry(
+        self,
+        work_date: str,
+        issue_day: IssueDay,
+        issue_metadata: Dict[str, Dict[str, Any]],
+        people: Dict[Person, Dict[str, Any]]
+    ) -> Dict[str, Any]:
+        issue = issue_day.issue
+        metadata = issue_metadata.get(issue.key)
+        if metadata is None:
+            metadata = issue_metadata[issue.key] = {
+                "issueKey": issue.key,
+                "issueSummary": issue.summary,
+                "reportedBy": self._person_entry(issue.reported_by, people),
+                "assignee": self._person_entry(issue.assignee, people),
+                "issueType": {"name": issue.issue_type_name, "iconUrl": issue.issue_type_icon_url},
+                "status": {"name": issue.status_name, "statusCategory": issue.status_category},
+                "priority": {"name": issue.priority_name, "iconUrl": issue.priority_icon_url},
+                "originalEstimate": issue.original_estimate,
+                "originalEstimateFormatted": (
+                    format_seconds(issue.original_estimate) if issue.original_estimate else None
+                )
+            }
+
+        return {
+            **metadata,
+            "worklogSummary": {
+                "totalTimeSpentSeconds": issue_day.total_seconds,
+                "totalTimeSpentFormatted": format_seconds(issue_day.total_seconds)
+            },
+            "worklogs": [self._worklog_entry(work_date, worklog, people) for worklog in issue_day.worklogs]
+        }
+
+    def _worklog_entry(
+        self,
+        work_date: str,
+        worklog: Worklog,
+        people: Dict[Person, Dict[str, Any]]
+    ) -> Dict[str, Any]:
+        started_raw = worklog.started
+        updated_raw = worklog.updated
+        return {
+            "worklogId": worklog.id,
+            "comment": worklog.comment,
+            "timeSpentSeconds": worklog.time_spent_seconds,
+            "timeSpentFormatted": format_seconds(worklog.time_spent_seconds),
+            "started": started_raw,
+            "startedDate": work_date,
+            "startedTime": worklog.started_time,
+            "updated": updated_raw,
+            "updatedFormatted": self._timestamps.display_datetime(updated_raw) if updated_raw else "",
+            "author": self._person_entry(worklog.author, people)
+        }
+
+    @staticmethod
+    def _person_entry(person: Person, people: Dict[Person, Dict[str, Any]]) -> Dict[str, Any]:
+        entry = people.get(person)
+        if entry is None:
+            entry = people[person] = person.to_dict()
+        return entry
@@ -0,0 +1,59 @@
+"""Completeness tracking for worklog summaries that may be partial."""
+
+from typing import Any, Dict, List
+
+ISSUE_FAILED = "failed"
+ISSUE_TIMED_OUT = "timed_out"
+ISSUE_SKIPPED = "skipped"
+
+
+class FetchCompleteness:
+    """Records which issues made it into a summary and which did not.
+
+    Issues are ``failed`` when Jira returned an error for them, ``timed_out``
+    when the request deadline ran out while their worklogs were being
+    fetched, and ``skipped`` when the deadline had already passed before
+    their fetch started. ``truncated`` means the issue listing itself was
+    cut short, so further issues may be missing without being named.
+
+    With ``allow_partial``, repositories return what they collected when the
+    deadline runs out instead of raising ``DeadlineExceededError``.
+    """
+
+    def __init__(self, allow_partial: bool = False):
+        self.allow_partial = allow_partial
+        self.fetched = 0
+        self.failed: List[str] = []
+        self.timed_out: List[str] = []
+        self.skipped: List[str] = []
+        self.truncated = False
+
+    def record_fetched(self) -> None:
+        self.fetched += 1
+
+    def record_missing(self, issue_key: str, outcome: str) -> None:
+        if outcome == ISSUE_TIMED_OUT:
+            self.timed_out.append(issue_key)
+        elif outcome == ISSUE_SKIPPED:
+            self.skipped.append(issue_key)
+        else:
+            self.failed.append(issue_key)
+
+    @property
+    def total(self) -> int:
+        return self.fetched + len(self.failed) + len(self.timed_out) + len(self.skipped)
+
+    @property
+    def complete(self) -> bool:
+        return not (self.failed or self.timed_out or self.skipped or self.truncated)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "complete": self.complete,
+            "issuesTotal": self.total,
+            "issuesFetched": self.fetched,
+            "failedIssues": self.failed,
+            "timedOutIssues": self.timed_out,
+            "skippedIssues": self.skipped,
+            "truncated": self.truncated
+        }
@@ -1,20 +1,39 @@
 """Domain interfaces and abstractions."""
 
 from abc import ABC, abstractmethod
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, AsyncIterator, Iterable, Iterator, Optional, Tuple
+
+from app.core.deadline import Deadline
+from app.domain.completeness import FetchCompleteness
 
 
 class IJiraClient(ABC):
     """Interface for Jira API client."""
 
     @abstractmethod
-    def search_issues(self, jql: str, fields: List[str], start_at: int = 0, max_results: int = 100) -> Dict[str, Any]:
-        """Search Jira issues using JQL."""
+    def search_issues(self, jql: str, fields: List[str], max_results: int = 100) -> Iterator[List[Dict[str, Any]]]:
+        """Search Jira issues using JQL, yielding one page of issues at a time."""
         pass
 
     @abstractmethod
-    def get_issue_worklogs(self, issue_key: str) -> List[Dict[str, Any]]:
-        """Get worklogs for a specific issue."""
+    def get_issue_worklogs(
+        self,
+        issue_key: str,
+        started_after: Optional[int] = None,
+        started_before: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """Get worklogs for a specific issue, optionally bounded by epoch-millisecond start times."""
+        pass
+
+    @abstractmethod
+    def iter_issue_worklogs(
+        self,
+        issue_key: str,
+        started_after: Optional[int] = None,
+        started_before: Optional[int] = None,
+        max_results: int = 1000
+    ) -> Iterator[List[Dict[str, Any]]]:
+        """Iterate over pages of worklogs for a specific issue."""
         pass
 
     @abstractmethod
@@ -22,6 +41,94 @@ class IJiraClient(ABC):
         """Get current user information."""
         pass
 
+    @abstractmethod
+    def iter_updated_worklogs(self, since: int) -> Iterator[Dict[str, Any]]:
+        """Iterate over pages of the updated-worklog feed since an epoch-millisecond timestamp."""
+        pass
+
+    @abstractmethod
+    def iter_deleted_worklogs(self, since: int) -> Iterator[Dict[str, Any]]:
+        """Iterate over pages of the deleted-worklog feed since an epoch-millisecond timestamp."""
+        pass
+
+    @abstractmethod
+    def get_worklogs_by_ids(self, worklog_ids: List[int]) -> List[Dict[str, Any]]:
+        """Get worklogs by ID, requesting them in batches of up to 1000."""
+        pass
+
+
+class IWorklogStore(ABC):
+    """Interface for persistent local worklog storage."""
+
+    @abstractmethod
+    def upsert_issues(self, cloud_id: str, issues: Iterable[Dict[str, Any]]) -> int:
+        """Insert or update issue metadata."""
+        pass
+
+    @abstractmethod
+    def upsert_worklogs(self, cloud_id: str, worklogs: Iterable[Dict[str, Any]]) -> int:
+        """Insert or update worklogs."""
+        pass
+
+    @abstractmethod
+    def delete_worklogs(self, cloud_id: str, worklog_ids: Iterable[Any]) -> int:
+        """Delete worklogs by ID."""
+        pass
+
+    @abstractmethod
+    def get_issue_ids_without_metadata(self, cloud_id: str) -> List[str]:
+        """List IDs of issues referenced by stored worklogs but missing metadata."""
+        pass
+
+    @abstractmethod
+    def get_worklogs_by_date_range(
+        self,
+        cloud_id: str,
+        account_id: str,
+        start_date: str,
+        end_date: str
+    ) -> List[Tuple[Dict[str, Any], List[Dict[str, Any]]]]:
+        """Return (issue, worklogs) pairs for an author within a date range."""
+        pass
+
+    @abstractmethod
+    def get_sync_state(self, cloud_id: str, account_id: str) -> Optional[Dict[str, Any]]:
+        """Get incremental sync cursors for a site and syncing user."""
+        pass
+
+    @abstractmethod
+    def set_sync_state(
+        self,
+        cloud_id: str,
+        account_id: str,
+        updated_since: int,
+        deleted_since: int,
+        issues_since: int,
+        horizon_date: str,
+        synced_at: float
+    ) -> None:
+        """Persist incremental sync cursors for a site and syncing user."""
+        pass
+
+
+class IWorklogSyncService(ABC):
+    """Interface for keeping the local worklog store up to date."""
+
+    @abstractmethod
+    def covers(self, start_date: str) -> bool:
+        """Whether a recent sync has completed and the store holds complete history from ``start_date``."""
+        pass
+
+    @abstractmethod
+    def sync_if_stale(self) -> None:
+        """Synchronise unless the last sync is recent enough."""
+        pass
+
+    @abstractmethod
+    def sync(self) -> Dict[str, int]:
+        """Apply changes from Jira since the last sync."""
+        pass
+
 
 class IWorklogRepository(ABC):
     """Interface for worklog data access."""
@@ -31,21 +138,173 @@ class IWorklogRepository(ABC):
         self,
         account_id: str,
         start_date: str,
-        end_date: str
+        end_date: str,
+        deadline: Optional[Deadline] = None,
+        completeness: Optional[FetchCompleteness] = None
+    ) -> List[Dict[str, Any]]:
+        """Retrieve worklogs for a user within a date range, giving up once ``deadline`` passes.
+
+        Issues missing from the result are recorded in ``completeness``.
+        """
+        pass
+
+    @abstractmethod
+    def iter_summary_fragments(
+        self,
+        account_id: str,
+        start_date: str,
+        end_date: str,
+        deadline: Optional[Deadline] = None,
+        completeness: Optional[FetchCompleteness] = None
+    ) -> Iterator[List[Dict[str, Any]]]:
+        """Yield the summary one issue at a time, as days holding only that issue."""
+        pass
+
+    @abstractmethod
+    def iter_worklog_records(
+        self,
+        account_id: str,
+        start_date: str,
+        end_date: str,
+        deadline: Optional[Deadline] = None,
+        completeness: Optional[FetchCompleteness] = None
+    ) -> Iterator[Dict[str, Any]]:
+        """Yield one flat record per worklog, without aggregating them into a summary."""
+        pass
+
+
+class IAsyncJiraClient(ABC):
+    """Interface for asyncio-native Jira API client."""
+
+    @abstractmethod
+    def search_issues(self, jql: str, fields: List[str], max_results: int = 100) -> AsyncIterator[List[Dict[str, Any]]]:
+        """Search Jira issues using JQL, yielding one page of issues at a time."""
+        pass
+
+    @abstractmethod
+    async def get_issue_worklogs(
+        self,
+        issue_key: str,
+        started_after: Optional[int] = None,
+        started_before: Optional[int] = None
     ) -> List[Dict[str, Any]]:
-        """Retrieve worklogs for a user within a date range."""
+        """Get worklogs for a specific issue, optionally bounded by epoch-millisecond start times."""
+        pass
+
+    @abstractmethod
+    def iter_issue_worklogs(
+        self,
+        issue_key: str,
+        started_after: Optional[int] = None,
+        started_before: Optional[int] = None,
+        max_results: int = 1000
+    ) -> AsyncIterator[List[Dict[str, Any]]]:
+        """Iterate over pages of worklogs for a specific issue."""
+        pass
+
+    @abstractmethod
+    async def get_user_info(self, access_token: str) -> Dict[str, Any]:
+        """Get current user information."""
         pass
 
 
-class IWorklogService(ABC):
-    """Interface for worklog business logic."""
+class IAsyncWorklogRepository(ABC):
+    """Interface for asynchronous worklog data access."""
 
     @abstractmethod
-    def get_worklog_summary(
+    async def get_worklogs_by_date_range(
         self,
         account_id: str,
         start_date: str,
-        end_date: str
+        end_date: str,
+        deadline: Optional[Deadline] = None,
+        completeness: Optional[FetchCompleteness] = None
+    ) -> List[Dict[str, Any]]:
+        """Retrieve worklogs for a user within a date range, giving up once ``deadline`` passes.
+
+        Issues missing from the result are recorded in ``completeness``.
+        """
+        pass
+
+    @abstractmethod
+    def iter_summary_fragments(
+        self,
+        account_id: str,
+        start_date: str,
+        end_date: str,
+        deadline: Optional[Deadline] = None,
+        completeness: Optional[FetchCompleteness] = None
+    ) -> AsyncIterator[List[Dict[str, Any]]]:
+        """Yield the summary one issue at a time, as days holding only that issue."""
+        pass
+
+    @abstractmethod
+    def iter_worklog_records(
+        self,
+        account_id: str,
+        start_date: str,
+        end_date: str,
+        deadline: Optional[Deadline] = None,
+        completeness: Optional[FetchCompleteness] = None
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Yield one flat record per worklog, without aggregating them into a summary."""
+        pass
+
+
+class IAsyncWorklogService(ABC):
+    """Interface for asynchronous worklog business logic."""
+
+    @abstractmethod
+    async def get_worklog_summary(
+        self,
+        account_id: str,
+        start_date: str,
+        end_date: str,
+        refresh: bool = False,
+        deadline: Optional[Deadline] = None
     ) -> List[Dict[str, Any]]:
-        """Get formatted worklog summary."""
+        """Get formatted worklog summary, bypassing any cached result when ``refresh`` is set.
+
+        Jira calls made for the summary share ``deadline``'s time budget.
+        """
+        pass
+
+    @abstractmethod
+    async def get_worklog_summary_envelope(
+        self,
+        account_id: str,
+        start_date: str,
+        end_date: str,
+        refresh: bool = False,
+        deadline: Optional[Deadline] = None,
+        allow_partial: bool = True
+    ) -> Dict[str, Any]:
+        """Get ``{"days": [...], "completeness": {...}, "version": "...", "freshness": {...}}``.
+
+        ``version`` is a hash of the days and completeness. With
+        ``allow_partial``, returns what was fetched if ``deadline`` runs out.
+        """
+        pass
+
+    @abstractmethod
+    def stream_worklog_summary(
+        self,
+        account_id: str,
+        start_date: str,
+        end_date: str,
+        refresh: bool = False,
+        deadline: Optional[Deadline] = None
+    ) -> AsyncIterator[Tuple[str, Dict[str, Any]]]:
+        """Yield ``(event, payload)`` pairs: a ``fragment`` of days as each issue is fetched, then ``totals``."""
+        pass
+
+    @abstractmethod
+    def stream_worklog_records(
+        self,
+        account_id: str,
+        start_date: str,
+        end_date: str,
+        deadline: Optional[Deadline] = None
+    ) -> AsyncIterator[Tuple[str, Dict[str, Any]]]:
+        """Yield ``("worklog", record)`` for each worklog as it is fetched, then ``("completeness", {...})``."""
         pass
@@ -0,0 +1,117 @@
+"""Compact records used while aggregating worklogs into a summary.
+
+Repositories collect worklogs into these slotted records rather than nested
+dicts, and build the API's dict shape from them once, when the summary is
+formatted. Issue metadata and people are then parsed once per issue instead
+of once per worklog.
+"""
+
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional
+
+
+@dataclass(frozen=True)
+class Person:
+    __slots__ = ("account_id", "display_name")
+
+    account_id: Optional[str]
+    display_name: str
+
+    @classmethod
+    def from_jira(cls, user: Optional[Dict[str, Any]], fallback_name: str) -> "Person":
+        if not user:
+            return cls(None, fallback_name)
+        return cls(user.get("accountId"), user.get("displayName"))
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {"accountId": self.account_id, "displayName": self.display_name}
+
+
+@dataclass(frozen=True)
+class Issue:
+    __slots__ = (
+        "key",
+        "summary",
+        "reported_by",
+        "assignee",
+        "issue_type_name",
+        "issue_type_icon_url",
+        "status_name",
+        "status_category",
+        "priority_name",
+        "priority_icon_url",
+        "original_estimate"
+    )
+
+    key: str
+    summary: str
+    reported_by: Person
+    assignee: Person
+    issue_type_name: str
+    issue_type_icon_url: Optional[str]
+    status_name: str
+    status_category: Optional[str]
+    priority_name: str
+    priority_icon_url: Optional[str]
+    original_estimate: Optional[int]
+
+    @classmethod
+    def from_jira(cls, issue: Dict[str, Any]) -> "Issue":
+        fields = issue["fields"]
+        issue_type = fields.get("issuetype") or {}
+        status = fields.get("status") or {}
+        priority = fields.get("priority") or {}
+        return cls(
+            key=issue["key"],
+            summary=fields["summary"],
+            reported_by=Person.from_jira(fields.get("reporter"), "Unknown"),
+            assignee=Person.from_jira(fields.get("assignee"), "Unassigned"),
+            issue_type_name=issue_type.get("name") if issue_type else "Unknown",
+            issue_type_icon_url=issue_type.get("iconUrl"),
+            status_name=status.get("name") if status else "Unknown",
+            status_category=status.get("statusCategory", {}).get("name") if status else None,
+            priority_name=priority.get("name") if priority else "Unknown",
+            priority_icon_url=priority.get("iconUrl"),
+            original_estimate=fields.get("timeoriginalestimate")
+        )
+
+
+@dataclass(frozen=True)
+class Worklog:
+    """A worklog; ``started_time`` is its local ``HH:MM`` start in the viewer's time zone."""
+
+    __slots__ = ("id", "comment", "time_spent_seconds", "started", "started_time", "updated", "author")
+
+    id: str
+    comment: str
+    time_spent_seconds: int
+    started: str
+    started_time: str
+    updated: str
+    author: Person
+
+
+@dataclass
+class IssueDay:
+    """An issue's worklogs on one day."""
+
+    __slots__ = ("issue", "total_seconds", "worklogs")
+
+    issue: Issue
+    total_seconds: int
+    worklogs: List[Worklog]
+
+
+@dataclass
+class DaySummary:
+    """Worklogs on one day, grouped by issue key.
+
+    ``issues`` keeps the order issues were collected in, which depends on
+    Jira; ``WorklogAggregator.format_response`` sorts them by ``issue_sort_key``.
+    """
+
+    __slots__ = ("work_date", "total_seconds", "issues")
+
+    work_date: str
+    total_seconds: int
+    issues: Dict[str, IssueDay]
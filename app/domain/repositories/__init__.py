@@ -1,5 +1,13 @@
 """Repository implementations."""
 
-from app.domain.repositories.worklog_repository import WorklogRepository
+from app.domain.repositories.async_worklog_repository import AsyncWorklogRepository
+from app.domain.repositories.local_worklog_repository import (
+    LocalWorklogRepository,
+    AsyncLocalWorklogRepository
+)
 
-__all__ = ["WorklogRepository"]
+__all__ = [
+    "AsyncWorklogRepository",
+    "LocalWorklogRepository",
+    "AsyncLocalWorklogRepository",
+]
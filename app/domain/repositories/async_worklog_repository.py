@@ -0,0 +1,351 @@
+"""Asynchronous worklog repository implementation."""
+
+import asyncio
+from datetime import datetime, timedelta, timezone
+from typing import List, Dict, Any, AsyncIterator, Optional, Tuple, Union
+
+from app.domain.interfaces import IAsyncWorklogRepository, IAsyncJiraClient
+from app.domain.completeness import FetchCompleteness, ISSUE_FAILED, ISSUE_SKIPPED, ISSUE_TIMED_OUT
+from app.domain.aggregation import WorklogAggregator
+from app.core.base import BaseRepository
+from app.core.exceptions import ExternalServiceError, CircuitOpenError, DeadlineExceededError
+from app.core.deadline import Deadline, current_deadline, deadline_scope, aiter_in_scope
+from app.core.constants import (
+    DATE_FORMAT,
+    JIRA_ISSUE_FIELDS,
+    JIRA_MAX_RESULTS,
+    JQL_DATE_MARGIN_DAYS,
+    WORKLOG_FETCH_PER_ISSUE,
+    WORKLOG_FETCH_EMBEDDED
+)
+
+# An issue's worklogs, or the completeness outcome explaining why there are none.
+IssueWorklogs = Union[List[Dict[str, Any]], str]
+
+
+class AsyncWorklogRepository(BaseRepository, IAsyncWorklogRepository):
+    """Repository for worklog data access on top of an async Jira client.
+
+    With the ``embedded`` fetch strategy the search requests the ``worklog``
+    field, and issues whose worklogs fit in the embedded page need no
+    follow-up call. The ``per_issue`` strategy always fetches worklogs per issue.
+
+    Filtering and formatting are done by ``WorklogAggregator``, as for the
+    local store; at most ``max_workers`` issue fetches are in flight.
+    When the ``deadline`` runs out, the fetch and every request it has in
+    flight are cancelled, unless ``completeness`` allows a partial result.
+    Issues that could not be fetched are recorded in ``completeness`` when
+    one is passed.
+
+    ``iter_summary_fragments`` and ``iter_worklog_records`` follow the order
+    in which fetches finish rather than search order.
+    """
+
+    def __init__(
+        self,
+        jira_client: IAsyncJiraClient,
+        max_workers: int = 1,
+        fetch_strategy: str = WORKLOG_FETCH_PER_ISSUE,
+        time_zone: Optional[str] = None
+    ):
+        super().__init__()
+        self._aggregator = WorklogAggregator(time_zone)
+        self._jira_client = jira_client
+        self._max_workers = max(1, max_workers)
+        self._fetch_strategy = fetch_strategy
+
+    async def get_worklogs_by_date_range(
+        self,
+        account_id: str,
+        start_date: str,
+        end_date: str,
+        deadline: Optional[Deadline] = None,
+        completeness: Optional[FetchCompleteness] = None
+    ) -> List[Dict[str, Any]]:
+        fetch = self._get_worklogs_async(account_id, start_date, end_date, completeness)
+        if deadline is None:
+            return await fetch
+        with deadline_scope(deadline):
+            if completeness is not None and completeness.allow_partial:
+                # Each issue fetch is bounded by the deadline on its own, so
+                # whatever finished in time is kept.
+                return await fetch
+            try:
+                return await asyncio.wait_for(fetch, timeout=deadline.remaining())
+            except asyncio.TimeoutError as e:
+                raise deadline.error() from e
+
+    async def iter_summary_fragments(
+        self,
+        account_id: str,
+        start_date: str,
+        end_date: str,
+        deadline: Optional[Deadline] = None,
+        completeness: Optional[FetchCompleteness] = None
+    ) -> AsyncIterator[List[Dict[str, Any]]]:
+        issue_worklogs = aiter_in_scope(
+            deadline,
+            self._iter_issue_worklogs_async(account_id, start_date, end_date, completeness, ordered=False)
+        )
+        try:
+            async for issue, worklogs in issue_worklogs:
+                daily_data = {}
+                self._aggregator.collect_worklogs(daily_data, issue, worklogs, account_id, start_date, end_date)
+                if daily_data:
+                    yield self._aggregator.format_response(daily_data)
+        except ExternalServiceError:
+            raise
+        except Exception as e:
+            self._handle_error(
+                error=e,
+                operation="iter_summary_fragments",
+                context={
+                    "account_id": account_id,
+                    "start_date": start_date,
+                    "end_date": end_date
+                }
+            )
+        finally:
+            await issue_worklogs.aclose()
+
+    async def iter_worklog_records(
+        self,
+        account_id: str,
+        start_date: str,
+        end_date: str,
+        deadline: Optional[Deadline] = None,
+        completeness: Optional[FetchCompleteness] = None
+    ) -> AsyncIterator[Dict[str, Any]]:
+        issue_worklogs = aiter_in_scope(
+            deadline,
+            self._iter_issue_worklogs_async(account_id, start_date, end_date, completeness, ordered=False)
+        )
+        try:
+            async for issue, worklogs in issue_worklogs:
+                for record in self._aggregator.worklog_records(issue, worklogs, account_id, start_date, end_date):
+                    yield record
+        except ExternalServiceError:
+            raise
+        except Exception as e:
+            self._handle_error(
+                error=e,
+                operation="iter_worklog_records",
+                context={
+                    "account_id": account_id,
+                    "start_date": start_date,
+                    "end_date": end_date
+                }
+            )
+        finally:
+            await issue_worklogs.aclose()
+
+    async def _get_worklogs_async(
+        self,
+        account_id: str,
+        start_date: str,
+        end_date: str,
+        completeness: Optional[FetchCompleteness] = None
+    ) -> List[Dict[str, Any]]:
+        daily_data = {}
+
+        try:
+            async for issue, worklogs in self._iter_issue_worklogs_async(account_id, start_date, end_date, completeness):
+                self._aggregator.collect_worklogs(daily_data, issue, worklogs, account_id, start_date, end_date)
+        except ExternalServiceError:
+            raise
+        except Exception as e:
+            self._handle_error(
+                error=e,
+                operation="get_worklogs_by_date_range",
+                context={
+                    "account_id": account_id,
+                    "start_date": start_date,
+                    "end_date": end_date
+                }
+            )
+
+        return self._aggregator.format_response(daily_data)
+
+    async def _iter_issue_worklogs_async(
+        self,
+        account_id: str,
+        start_date: str,
+        end_date: str,
+        completeness: Optional[FetchCompleteness] = None,
+        ordered: bool = True
+    ) -> AsyncIterator[Tuple[Dict[str, Any], List[Dict[str, Any]]]]:
+        """Yield each issue whose worklogs were fetched, recording the others in ``completeness``."""
+        issue_worklogs = None
+        try:
+            started_after, started_before = self._started_window(start_date, end_date)
+            pages = self._jira_client.search_issues(
+                jql=self._build_jql(account_id, start_date, end_date),
+                fields=self._search_fields(),
+                max_results=JIRA_MAX_RESULTS
+            )
+            issue_worklogs = self._fetch_issue_worklogs_async(pages, started_after, started_before, ordered)
+            async for issue, worklogs in issue_worklogs:
+                if isinstance(worklogs, str):
+                    self._record_missing(completeness, issue["key"], worklogs)
+                    continue
+                if completeness is not None:
+                    completeness.record_fetched()
+                yield issue, worklogs
+        except DeadlineExceededError:
+            if completeness is None or not completeness.allow_partial:
+                raise
+            self._mark_truncated(completeness, account_id)
+        finally:
+            # Cancel fetches still in flight when the caller stops early.
+            if issue_worklogs is not None:
+                await issue_worklogs.aclose()
+
+    def _record_missing(self, completeness: Optional[FetchCompleteness], issue_key: str, outcome: str) -> None:
+        """Record an issue missing from the summary, or fail the request if partial results are not allowed."""
+        if outcome != ISSUE_FAILED and (completeness is None or not completeness.allow_partial):
+            raise current_deadline().error()
+        if completeness is not None:
+            completeness.record_missing(issue_key, outcome)
+
+    def _mark_truncated(self, completeness: FetchCompleteness, account_id: str) -> None:
+        completeness.truncated = True
+        self.logger.warning(
+            "Request deadline reached, returning a partial worklog summary",
+            extra={"account_id": account_id, "issues_fetched": completeness.fetched}
+        )
+
+    def _build_jql(self, account_id: str, start_date: str, end_date: str) -> str:
+        """Build JQL matching issues the user logged time on within the date range.
+
+        Jira evaluates ``worklogDate`` in the site's timezone, so the range is
+        widened by a small margin; exact filtering happens in ``WorklogAggregator``.
+        """
+        margin = timedelta(days=JQL_DATE_MARGIN_DAYS)
+        jql_start = (datetime.strptime(start_date, DATE_FORMAT) - margin).strftime(DATE_FORMAT)
+        jql_end = (datetime.strptime(end_date, DATE_FORMAT) + margin).strftime(DATE_FORMAT)
+        return (
+            f'worklogAuthor = "{account_id}" '
+            f'AND worklogDate >= "{jql_start}" AND worklogDate <= "{jql_end}"'
+        )
+
+    def _search_fields(self) -> List[str]:
+        if self._fetch_strategy == WORKLOG_FETCH_EMBEDDED:
+            return JIRA_ISSUE_FIELDS + ["worklog"]
+        return JIRA_ISSUE_FIELDS
+
+    def _embedded_worklogs(self, issue: Dict[str, Any]) -> Optional[List[Dict[str, Any]]]:
+        """Return the worklogs embedded in a search result, or ``None`` if they are incomplete.
+
+        Jira embeds only the first page of an issue's worklogs; when ``total``
+        exceeds what was returned the issue needs a follow-up fetch.
+        """
+        embedded = issue.get("fields", {}).get("worklog")
+        if self._fetch_strategy != WORKLOG_FETCH_EMBEDDED or not embedded:
+            return None
+        worklogs = embedded.get("worklogs", [])
+        if embedded.get("total", 0) > len(worklogs):
+            return None
+        return worklogs
+
+    def _started_window(self, start_date: str, end_date: str) -> Tuple[int, int]:
+        """Return epoch-millisecond ``startedAfter``/``startedBefore`` bounds for the date range.
+
+        The window is widened by the same margin as the JQL so worklogs near
+        midnight in the user's timezone are still transferred.
+        """
+        margin = timedelta(days=JQL_DATE_MARGIN_DAYS)
+        window_start = datetime.strptime(start_date, DATE_FORMAT).replace(tzinfo=timezone.utc) - margin
+        window_end = datetime.strptime(end_date, DATE_FORMAT).replace(tzinfo=timezone.utc) + timedelta(days=1) + margin
+        return int(window_start.timestamp() * 1000), int(window_end.timestamp() * 1000)
+
+    async def _fetch_issue_worklogs_async(
+        self,
+        pages: AsyncIterator[List[Dict[str, Any]]],
+        started_after: Optional[int] = None,
+        started_before: Optional[int] = None,
+        ordered: bool = True
+    ) -> AsyncIterator[Tuple[Dict[str, Any], IssueWorklogs]]:
+        """Fetch worklogs page by page while the next search page downloads in the background.
+
+        Without ``ordered``, each issue is yielded as soon as its fetch finishes
+        instead of in search order.
+        """
+        semaphore = asyncio.Semaphore(self._max_workers)
+        next_page = asyncio.ensure_future(self._next_page(pages))
+        try:
+            while True:
+                page = await next_page
+                if page is None:
+                    return
+                next_page = asyncio.ensure_future(self._next_page(pages))
+                tasks = [
+                    asyncio.ensure_future(
+                        self._issue_worklogs_or_outcome_async(issue, semaphore, started_after, started_before)
+                    )
+                    for issue in page
+                ]
+                try:
+                    if ordered:
+                        for issue, worklogs in zip(page, await asyncio.gather(*tasks)):
+                            yield issue, worklogs
+                    else:
+                        issues = dict(zip(tasks, page))
+                        pending = set(tasks)
+                        while pending:
+                            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                            for task in done:
+                                yield issues[task], task.result()
+                finally:
+                    # gather() leaves siblings running when one of them fails.
+                    for task in tasks:
+                        task.cancel()
+        finally:
+            if not next_page.done():
+                next_page.cancel()
+
+    @staticmethod
+    async def _next_page(pages: AsyncIterator[List[Dict[str, Any]]]) -> Optional[List[Dict[str, Any]]]:
+        try:
+            return await pages.__anext__()
+        except StopAsyncIteration:
+            return None
+
+    async def _issue_worklogs_or_outcome_async(
+        self,
+        issue: Dict[str, Any],
+        semaphore: asyncio.Semaphore,
+        started_after: Optional[int] = None,
+        started_before: Optional[int] = None
+    ) -> IssueWorklogs:
+        embedded = self._embedded_worklogs(issue)
+        if embedded is not None:
+            return embedded
+        return await self._fetch_worklogs_or_outcome_async(issue["key"], semaphore, started_after, started_before)
+
+    async def _fetch_worklogs_or_outcome_async(
+        self,
+        issue_key: str,
+        semaphore: asyncio.Semaphore,
+        started_after: Optional[int] = None,
+        started_before: Optional[int] = None
+    ) -> IssueWorklogs:
+        async with semaphore:
+            deadline = current_deadline()
+            if deadline is not None and deadline.expired:
+                return ISSUE_SKIPPED
+            try:
+                fetch = self._jira_client.get_issue_worklogs(issue_key, started_after, started_before)
+                if deadline is None:
+                    return await fetch
+                return await asyncio.wait_for(fetch, timeout=deadline.remaining())
+            except CircuitOpenError:
+                raise
+            except (DeadlineExceededError, asyncio.TimeoutError):
+                return ISSUE_TIMED_OUT
+            except Exception as e:
+                self.logger.warning(
+                    f"Failed to fetch worklogs for issue {issue_key}",
+                    extra={"issue_key": issue_key},
+                    exc_info=e
+                )
+                return ISSUE_FAILED
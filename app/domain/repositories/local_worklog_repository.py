@@ -0,0 +1,322 @@
+"""Worklog repositories backed by the local worklog store."""
+
+import asyncio
+from datetime import date, timedelta
+from typing import List, Dict, Any, AsyncIterator, Callable, Iterator, Optional, Tuple, TypeVar
+
+from app.domain.interfaces import (
+    IAsyncWorklogRepository,
+    IWorklogRepository,
+    IWorklogStore,
+    IWorklogSyncService
+)
+from app.domain.aggregation import WorklogAggregator
+from app.domain.completeness import FetchCompleteness
+from app.core.base import BaseRepository
+from app.core.exceptions import ExternalServiceError
+from app.core.singleflight import AsyncSingleFlight
+from app.core.deadline import Deadline, deadline_scope, iter_in_scope
+from app.core.constants import JQL_DATE_MARGIN_DAYS
+
+T = TypeVar("T")
+
+
+class LocalWorklogRepository(BaseRepository, IWorklogRepository):
+    """Repository answering date-range queries from the local worklog store.
+
+    The store is only authoritative for the syncing user's own worklogs on or
+    after the sync horizon, and only while its last completed sync is recent;
+    callers check ``is_current`` before querying it. Syncing is left to
+    ``sync_if_stale``, so a query never waits for Jira.
+    """
+
+    def __init__(
+        self,
+        store: IWorklogStore,
+        sync_service: IWorklogSyncService,
+        cloud_id: str,
+        user_account_id: str,
+        time_zone: Optional[str] = None
+    ):
+        super().__init__()
+        self._aggregator = WorklogAggregator(time_zone)
+        self._store = store
+        self._sync_service = sync_service
+        self._cloud_id = cloud_id
+        self._user_account_id = user_account_id
+
+    @property
+    def sync_key(self) -> Tuple[str, str]:
+        """Identify the store sync this repository reads from, for coalescing syncs."""
+        return self._cloud_id, self._user_account_id
+
+    def is_current(self, account_id: str, start_date: str) -> bool:
+        """Report whether the store can answer the query as it is, without syncing first."""
+        return account_id == self._user_account_id and self._sync_service.covers(start_date)
+
+    def sync_if_stale(self) -> None:
+        """Sync the store if a sync is due, logging a failure instead of raising it.
+
+        Meant to run off the request path; until a sync succeeds,
+        ``is_current`` keeps answering ``False``.
+        """
+        try:
+            self._sync_service.sync_if_stale()
+        except Exception as e:
+            self.logger.warning(
+                "Worklog store sync failed",
+                extra={"cloud_id": self._cloud_id, "account_id": self._user_account_id},
+                exc_info=e
+            )
+
+    def get_worklogs_by_date_range(
+        self,
+        account_id: str,
+        start_date: str,
+        end_date: str,
+        deadline: Optional[Deadline] = None,
+        completeness: Optional[FetchCompleteness] = None
+    ) -> List[Dict[str, Any]]:
+        with deadline_scope(deadline):
+            return self._get_worklogs(account_id, start_date, end_date, completeness)
+
+    def iter_summary_fragments(
+        self,
+        account_id: str,
+        start_date: str,
+        end_date: str,
+        deadline: Optional[Deadline] = None,
+        completeness: Optional[FetchCompleteness] = None
+    ) -> Iterator[List[Dict[str, Any]]]:
+        issue_worklogs = iter_in_scope(
+            deadline,
+            self._iter_issue_worklogs(account_id, start_date, end_date, completeness, ordered=False)
+        )
+        try:
+            for issue, worklogs in issue_worklogs:
+                daily_data = {}
+                self._aggregator.collect_worklogs(daily_data, issue, worklogs, account_id, start_date, end_date)
+                if daily_data:
+                    yield self._aggregator.format_response(daily_data)
+        except ExternalServiceError:
+            raise
+        except Exception as e:
+            self._handle_error(
+                error=e,
+                operation="iter_summary_fragments",
+                context={
+                    "account_id": account_id,
+                    "start_date": start_date,
+                    "end_date": end_date
+                }
+            )
+        finally:
+            issue_worklogs.close()
+
+    def iter_worklog_records(
+        self,
+        account_id: str,
+        start_date: str,
+        end_date: str,
+        deadline: Optional[Deadline] = None,
+        completeness: Optional[FetchCompleteness] = None
+    ) -> Iterator[Dict[str, Any]]:
+        issue_worklogs = iter_in_scope(
+            deadline,
+            self._iter_issue_worklogs(account_id, start_date, end_date, completeness, ordered=False)
+        )
+        try:
+            for issue, worklogs in issue_worklogs:
+                yield from self._aggregator.worklog_records(issue, worklogs, account_id, start_date, end_date)
+        except ExternalServiceError:
+            raise
+        except Exception as e:
+            self._handle_error(
+                error=e,
+                operation="iter_worklog_records",
+                context={
+                    "account_id": account_id,
+                    "start_date": start_date,
+                    "end_date": end_date
+                }
+            )
+        finally:
+            issue_worklogs.close()
+
+    def _get_worklogs(
+        self,
+        account_id: str,
+        start_date: str,
+        end_date: str,
+        completeness: Optional[FetchCompleteness] = None
+    ) -> List[Dict[str, Any]]:
+        daily_data = {}
+
+        try:
+            for issue, worklogs in self._iter_issue_worklogs(account_id, start_date, end_date, completeness):
+                self._aggregator.collect_worklogs(daily_data, issue, worklogs, account_id, start_date, end_date)
+        except ExternalServiceError:
+            raise
+        except Exception as e:
+            self._handle_error(
+                error=e,
+                operation="get_worklogs_by_date_range",
+                context={
+                    "account_id": account_id,
+                    "start_date": start_date,
+                    "end_date": end_date
+                }
+            )
+
+        return self._aggregator.format_response(daily_data)
+
+    def _iter_issue_worklogs(
+        self,
+        account_id: str,
+        start_date: str,
+        end_date: str,
+        completeness: Optional[FetchCompleteness] = None,
+        ordered: bool = True
+    ) -> Iterator[Tuple[Dict[str, Any], List[Dict[str, Any]]]]:
+        """Yield each issue with its worklogs from the store, counting them in ``completeness``."""
+        # The store indexes worklogs by their date in Jira's offset; widen the
+        # range so the aggregator can bucket them in the viewer's time zone.
+        margin = timedelta(days=JQL_DATE_MARGIN_DAYS)
+        rows = self._store.get_worklogs_by_date_range(
+            self._cloud_id,
+            account_id,
+            (date.fromisoformat(start_date) - margin).isoformat(),
+            (date.fromisoformat(end_date) + margin).isoformat()
+        )
+        for issue, worklogs in rows:
+            if completeness is not None:
+                completeness.record_fetched()
+            yield issue, worklogs
+
+
+class AsyncLocalWorklogRepository(IAsyncWorklogRepository):
+    """Async adapter serving from the local store, or from live Jira when it cannot.
+
+    Each query starts a store sync in the background when one is due and
+    answers from live Jira until the store is current again. The sync runs in
+    its own task, shared through ``single_flight`` by concurrent requests, so
+    a cold backfill never holds up a request and is not stopped by a client
+    going away.
+    """
+
+    def __init__(
+        self,
+        local_repository: LocalWorklogRepository,
+        fallback: IAsyncWorklogRepository,
+        single_flight: Optional[AsyncSingleFlight] = None
+    ):
+        self._local_repository = local_repository
+        self._fallback = fallback
+        self._single_flight = single_flight or AsyncSingleFlight()
+
+    async def _use_store(self, account_id: str, start_date: str, deadline: Optional[Deadline]) -> bool:
+        # The sync must not inherit the request's deadline.
+        with deadline_scope(None):
+            self._single_flight.start(
+                self._local_repository.sync_key,
+                lambda: asyncio.to_thread(self._local_repository.sync_if_stale)
+            )
+        return await self._in_thread(deadline, self._local_repository.is_current, account_id, start_date)
+
+    @staticmethod
+    async def _in_thread(deadline: Optional[Deadline], func: Callable[..., T], *args: Any) -> T:
+        """Run ``func`` in a worker thread that sees ``deadline`` as the current deadline."""
+        with deadline_scope(deadline):
+            # ``to_thread`` copies the context, and with it the scope, when called.
+            return await asyncio.to_thread(func, *args)
+
+    async def get_worklogs_by_date_range(
+        self,
+        account_id: str,
+        start_date: str,
+        end_date: str,
+        deadline: Optional[Deadline] = None,
+        completeness: Optional[FetchCompleteness] = None
+    ) -> List[Dict[str, Any]]:
+        if not await self._use_store(account_id, start_date, deadline):
+            return await self._fallback.get_worklogs_by_date_range(
+                account_id,
+                start_date,
+                end_date,
+                deadline=deadline,
+                completeness=completeness
+            )
+        return await self._in_thread(
+            deadline,
+            self._local_repository.get_worklogs_by_date_range,
+            account_id,
+            start_date,
+            end_date,
+            deadline,
+            completeness
+        )
+
+    async def iter_summary_fragments(
+        self,
+        account_id: str,
+        start_date: str,
+        end_date: str,
+        deadline: Optional[Deadline] = None,
+        completeness: Optional[FetchCompleteness] = None
+    ) -> AsyncIterator[List[Dict[str, Any]]]:
+        if not await self._use_store(account_id, start_date, deadline):
+            fragments = self._fallback.iter_summary_fragments(
+                account_id,
+                start_date,
+                end_date,
+                deadline=deadline,
+                completeness=completeness
+            )
+            async for fragment in fragments:
+                yield fragment
+            return
+        # A local read is a single query, so it is collected off the event loop in one go.
+        fragments = await self._in_thread(
+            deadline,
+            lambda: list(self._local_repository.iter_summary_fragments(
+                account_id,
+                start_date,
+                end_date,
+                deadline=deadline,
+                completeness=completeness
+            ))
+        )
+        for fragment in fragments:
+            yield fragment
+
+    async def iter_worklog_records(
+        self,
+        account_id: str,
+        start_date: str,
+        end_date: str,
+        deadline: Optional[Deadline] = None,
+        completeness: Optional[FetchCompleteness] = None
+    ) -> AsyncIterator[Dict[str, Any]]:
+        if not await self._use_store(account_id, start_date, deadline):
+            records = self._fallback.iter_worklog_records(
+                account_id,
+                start_date,
+                end_date,
+                deadline=deadline,
+                completeness=completeness
+            )
+            async for record in records:
+                yield record
+            return
+        records = await self._in_thread(
+            deadline,
+            lambda: list(self._local_repository.iter_worklog_records(
+                account_id,
+                start_date,
+                end_date,
+                deadline=deadline,
+                completeness=completeness
+            ))
+        )
+        for record in records:
+            yield record
@@ -1,48 +1,355 @@
 """Worklog business logic service."""
 
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, AsyncIterator, Hashable, Optional, Tuple
 
-from app.domain.interfaces import IWorklogService, IWorklogRepository
+from app.domain.completeness import FetchCompleteness
+from app.domain.summary_formats import issue_sort_key, summary_version
+from app.domain.interfaces import IAsyncWorklogService, IAsyncWorklogRepository
 from app.core.base import BaseService
-from app.core.exceptions import ExternalServiceError
+from app.core.cache import TTLCache
+from app.core.singleflight import AsyncSingleFlight
+from app.core.exceptions import ExternalServiceError, CircuitOpenError
+from app.core.deadline import Deadline, resolve_deadline
 from app.core.validators import validate_date_range, validate_required
+from app.core.constants import (
+    SUMMARY_EVENT_FRAGMENT,
+    SUMMARY_EVENT_TOTALS,
+    RECORD_TYPE_WORKLOG,
+    RECORD_TYPE_COMPLETENESS
+)
+from app.utils.helpers import format_seconds
 
 
-class WorklogService(BaseService, IWorklogService):
-    """Service for worklog business logic."""
+class AsyncWorklogService(BaseService, IAsyncWorklogService):
+    """Service for worklog business logic backed by an async repository.
 
-    def __init__(self, worklog_repository: IWorklogRepository, user_account_id: Optional[str] = None):
+    When a ``summary_cache`` is supplied, summaries are cached per
+    (cloud_id, account_id, start_date, end_date); ``refresh=True`` bypasses
+    the cached entry and replaces it with a freshly computed one. Concurrent
+    requests for the same key share one repository call through
+    ``single_flight``; followers wait under the leader's ``deadline``. While
+    Jira's circuit breaker is open, an expired cached summary is served if
+    the cache still holds one.
+
+    Cached summaries are served as-is while younger than the cache TTL. For
+    ``stale_while_revalidate`` seconds after that, the expired summary is
+    still returned immediately, and a task on the running event loop
+    replaces it.
+
+    Summaries are built as envelopes of ``days`` plus a ``completeness``
+    block and a content ``version``; only complete ones are cached. Responses also carry a
+    ``freshness`` block with the summary's age and whether it is stale.
+    ``get_worklog_summary_envelope`` can return a partial envelope when the
+    deadline runs out, while ``get_worklog_summary`` fails with
+    ``DeadlineExceededError`` instead.
+
+    ``stream_worklog_summary`` yields the summary one issue at a time as
+    Jira answers, so callers can show the first issues after a single round
+    trip; it shares the cache but not the single-flight of
+    ``get_worklog_summary_envelope``. ``stream_worklog_records`` passes flat
+    worklog records straight through from the repository, bypassing the
+    cache, so memory stays flat however long the date range is.
+    """
+
+    def __init__(
+        self,
+        worklog_repository: IAsyncWorklogRepository,
+        user_account_id: Optional[str] = None,
+        cloud_id: Optional[str] = None,
+        summary_cache: Optional[TTLCache] = None,
+        single_flight: Optional[AsyncSingleFlight] = None,
+        stale_while_revalidate: float = 0,
+        time_zone: Optional[str] = None
+    ):
         super().__init__()
         self._repository = worklog_repository
         self._user_account_id = user_account_id
+        self._cloud_id = cloud_id
+        self._time_zone = time_zone
+        self._summary_cache = summary_cache
+        self._single_flight = single_flight or AsyncSingleFlight()
+        self._stale_while_revalidate = stale_while_revalidate
 
-    def get_worklog_summary(
+    async def get_worklog_summary(
         self,
         account_id: Optional[str] = None,
         start_date: str = "",
-        end_date: str = ""
+        end_date: str = "",
+        refresh: bool = False,
+        deadline: Optional[Deadline] = None
     ) -> List[Dict[str, Any]]:
+        envelope = await self.get_worklog_summary_envelope(
+            account_id, start_date, end_date, refresh, deadline, allow_partial=False
+        )
+        return envelope["days"]
+
+    async def get_worklog_summary_envelope(
+        self,
+        account_id: Optional[str] = None,
+        start_date: str = "",
+        end_date: str = "",
+        refresh: bool = False,
+        deadline: Optional[Deadline] = None,
+        allow_partial: bool = True
+    ) -> Dict[str, Any]:
+        account_id = self._validate_request(account_id, start_date, end_date)
+        cache_key = self._cache_key(account_id, start_date, end_date)
+        if not refresh:
+            cached = self._get_cached(cache_key)
+            if cached is not None:
+                envelope, age, stale = cached
+                if stale:
+                    self._revalidate(cache_key, account_id, start_date, end_date)
+                return self._with_freshness(envelope, age, stale)
+
+        async def load() -> Dict[str, Any]:
+            return await self._load_envelope(cache_key, account_id, start_date, end_date, deadline, allow_partial)
+
+        try:
+            return self._with_freshness(await self._single_flight.do((cache_key, allow_partial), load))
+        except CircuitOpenError as e:
+            return self._get_stale_or_raise(cache_key, e)
+        except ExternalServiceError:
+            raise
+        except Exception as e:
+            self._handle_error(
+                error=e,
+                operation="get_worklog_summary",
+                context={
+                    "account_id": account_id,
+                    "start_date": start_date,
+                    "end_date": end_date
+                }
+            )
+
+    async def _load_envelope(
+        self,
+        cache_key: Hashable,
+        account_id: str,
+        start_date: str,
+        end_date: str,
+        deadline: Optional[Deadline],
+        allow_partial: bool
+    ) -> Dict[str, Any]:
+        completeness = FetchCompleteness(allow_partial=allow_partial)
+        summary = await self._repository.get_worklogs_by_date_range(
+            account_id=account_id,
+            start_date=start_date,
+            end_date=end_date,
+            deadline=deadline,
+            completeness=completeness
+        )
+        return self._store_envelope(cache_key, summary, completeness)
+
+    def _revalidate(self, cache_key: Hashable, account_id: str, start_date: str, end_date: str) -> None:
+        """Refresh a stale summary in a background task, unless a refresh is already running."""
+        async def refresh() -> Dict[str, Any]:
+            try:
+                return await self._load_envelope(
+                    cache_key, account_id, start_date, end_date, resolve_deadline(), False
+                )
+            except Exception as e:
+                self.logger.warning(
+                    "Background refresh of stale summary failed",
+                    extra={"cloud_id": self._cloud_id},
+                    exc_info=e
+                )
+                raise
+
+        task = self._single_flight.start((cache_key, False), refresh)
+        # Retrieve the outcome so a refresh that failed with nobody awaiting it is not reported as unhandled.
+        task.add_done_callback(lambda finished: finished.cancelled() or finished.exception())
+
+    def _validate_request(self, account_id: Optional[str], start_date: str, end_date: str) -> str:
         account_id = account_id or self._user_account_id
         validate_required(account_id, "account_id")
         validate_required(start_date, "start_date")
         validate_required(end_date, "end_date")
         validate_date_range(start_date, end_date)
-        
+        return account_id
+
+    def _cache_key(self, account_id: str, start_date: str, end_date: str) -> Hashable:
+        # Summaries fetched for another account are scoped to the requesting
+        # user, since Jira only returns worklogs visible to their token. Days
+        # are bucketed in the viewer's time zone, so it is part of the key too.
+        viewer = None if account_id == self._user_account_id else self._user_account_id
+        return (self._cloud_id, account_id, start_date, end_date, viewer, self._time_zone)
+
+    def _get_cached(self, cache_key: Hashable) -> Optional[Tuple[Dict[str, Any], float, bool]]:
+        """Return ``(envelope, age, stale)`` for a fresh entry, or for a stale one still within the revalidation window."""
+        if self._summary_cache is None:
+            return None
+        entry = self._summary_cache.get_entry(cache_key)
+        if entry is not None:
+            return entry[0], entry[1], False
+        if self._stale_while_revalidate <= 0:
+            return None
+        stale = self._summary_cache.get_stale(cache_key)
+        if stale is None or stale[1] >= self._summary_cache.ttl + self._stale_while_revalidate:
+            return None
+        return stale[0], stale[1], True
+
+    def _get_stale_or_raise(self, cache_key: Hashable, error: CircuitOpenError) -> Dict[str, Any]:
+        """Return a stale cached summary for ``cache_key``, or raise ``error`` if there is none."""
+        stale = self._summary_cache.get_stale(cache_key) if self._summary_cache is not None else None
+        if stale is None:
+            raise error
+        envelope, age = stale
+        self.logger.warning(
+            "Jira circuit open, serving stale cached summary",
+            extra={"cloud_id": self._cloud_id, "age_seconds": round(age, 1)}
+        )
+        return self._with_freshness(envelope, age, stale=True)
+
+    def _store_envelope(
+        self,
+        cache_key: Hashable,
+        summary: List[Dict[str, Any]],
+        completeness: FetchCompleteness
+    ) -> Dict[str, Any]:
+        """Wrap a summary with its completeness and version, caching it only if no issue is missing."""
+        completeness_dict = completeness.to_dict()
+        envelope = {
+            "days": summary,
+            "completeness": completeness_dict,
+            "version": summary_version(summary, completeness_dict)
+        }
+        if completeness.complete and self._summary_cache is not None:
+            self._summary_cache.set(cache_key, envelope)
+        return envelope
+
+    @staticmethod
+    def _with_freshness(envelope: Dict[str, Any], age: float = 0.0, stale: bool = False) -> Dict[str, Any]:
+        # Cached envelopes are shared between requests, so never annotate them in place.
+        return {**envelope, "freshness": {"ageSeconds": round(age, 1), "stale": stale}}
+
+    async def stream_worklog_summary(
+        self,
+        account_id: Optional[str] = None,
+        start_date: str = "",
+        end_date: str = "",
+        refresh: bool = False,
+        deadline: Optional[Deadline] = None
+    ) -> AsyncIterator[Tuple[str, Dict[str, Any]]]:
+        account_id = self._validate_request(account_id, start_date, end_date)
+        cache_key = self._cache_key(account_id, start_date, end_date)
+        if not refresh:
+            cached = self._get_cached(cache_key)
+            if cached is not None:
+                envelope, age, stale = cached
+                if stale:
+                    self._revalidate(cache_key, account_id, start_date, end_date)
+                for event in self._replay(self._with_freshness(envelope, age, stale)):
+                    yield event
+                return
+
+        completeness = FetchCompleteness(allow_partial=True)
+        days: Dict[str, Dict[str, Any]] = {}
+        fragments = self._repository.iter_summary_fragments(
+            account_id=account_id,
+            start_date=start_date,
+            end_date=end_date,
+            deadline=deadline,
+            completeness=completeness
+        )
         try:
-            return self._repository.get_worklogs_by_date_range(
-                account_id=account_id,
-                start_date=start_date,
-                end_date=end_date
+            async for fragment in fragments:
+                self._merge_fragment(days, fragment)
+                yield SUMMARY_EVENT_FRAGMENT, {"days": fragment}
+        except CircuitOpenError as e:
+            # A stale summary can only stand in for one that has not started streaming.
+            if days:
+                raise
+            for event in self._replay(self._get_stale_or_raise(cache_key, e)):
+                yield event
+            return
+        except ExternalServiceError:
+            raise
+        except Exception as e:
+            self._handle_error(
+                error=e,
+                operation="stream_worklog_summary",
+                context={
+                    "account_id": account_id,
+                    "start_date": start_date,
+                    "end_date": end_date
+                }
             )
+        finally:
+            # Stop in-flight Jira fetches as soon as the client goes away.
+            await fragments.aclose()
+
+        for day in days.values():
+            # Match the issue order of summaries built in one piece.
+            day["issues"].sort(key=lambda issue: issue_sort_key(issue["issueKey"]))
+        envelope = self._store_envelope(cache_key, [days[day] for day in sorted(days)], completeness)
+        yield SUMMARY_EVENT_TOTALS, self._totals(self._with_freshness(envelope))
+
+    async def stream_worklog_records(
+        self,
+        account_id: Optional[str] = None,
+        start_date: str = "",
+        end_date: str = "",
+        deadline: Optional[Deadline] = None
+    ) -> AsyncIterator[Tuple[str, Dict[str, Any]]]:
+        account_id = self._validate_request(account_id, start_date, end_date)
+        completeness = FetchCompleteness(allow_partial=True)
+        records = self._repository.iter_worklog_records(
+            account_id=account_id,
+            start_date=start_date,
+            end_date=end_date,
+            deadline=deadline,
+            completeness=completeness
+        )
+        try:
+            async for record in records:
+                yield RECORD_TYPE_WORKLOG, record
         except ExternalServiceError:
             raise
         except Exception as e:
             self._handle_error(
                 error=e,
-                operation="get_worklog_summary",
+                operation="stream_worklog_records",
                 context={
                     "account_id": account_id,
                     "start_date": start_date,
                     "end_date": end_date
                 }
             )
+        finally:
+            await records.aclose()
+
+        yield RECORD_TYPE_COMPLETENESS, completeness.to_dict()
+
+    def _replay(self, envelope: Dict[str, Any]) -> List[Tuple[str, Dict[str, Any]]]:
+        """Stream events for an already-built envelope: all days in one fragment, then totals."""
+        return [
+            (SUMMARY_EVENT_FRAGMENT, {"days": envelope["days"]}),
+            (SUMMARY_EVENT_TOTALS, self._totals(envelope))
+        ]
+
+    @staticmethod
+    def _merge_fragment(days: Dict[str, Dict[str, Any]], fragment: List[Dict[str, Any]]) -> None:
+        for day in fragment:
+            merged = days.get(day["workDate"])
+            if merged is None:
+                days[day["workDate"]] = {**day, "daySummary": dict(day["daySummary"]), "issues": list(day["issues"])}
+                continue
+            merged["issues"].extend(day["issues"])
+            total = merged["daySummary"]["totalTimeSpentSeconds"] + day["daySummary"]["totalTimeSpentSeconds"]
+            merged["daySummary"] = {"totalTimeSpentSeconds": total, "totalTimeSpentFormatted": format_seconds(total)}
+
+    @staticmethod
+    def _totals(envelope: Dict[str, Any]) -> Dict[str, Any]:
+        days = envelope["days"]
+        total = sum(day["daySummary"]["totalTimeSpentSeconds"] for day in days)
+        return {
+            "days": [
+                {"workDate": day["workDate"], "workDateFormatted": day["workDateFormatted"], "daySummary": day["daySummary"]}
+                for day in days
+            ],
+            "totalTimeSpentSeconds": total,
+            "totalTimeSpentFormatted": format_seconds(total),
+            "completeness": envelope["completeness"],
+            "freshness": envelope["freshness"]
+        }
@@ -0,0 +1,159 @@
+"""Incremental synchronisation of the local worklog store from Jira."""
+
+import time
+from datetime import date, datetime, timedelta, timezone
+from typing import Any, Dict, Iterable, Iterator, Optional, Set
+
+from app.domain.interfaces import IJiraClient, IWorklogStore, IWorklogSyncService
+from app.core.base import BaseService
+from app.core.constants import (
+    DATE_FORMAT,
+    JIRA_ISSUE_FIELDS,
+    JIRA_ISSUE_ID_BATCH_SIZE,
+    JIRA_MAX_RESULTS,
+    JQL_DATE_MARGIN_DAYS
+)
+from app.core.singleflight import SingleFlight
+
+
+def issue_id_jql(issue_ids: Iterable[Any]) -> Iterator[str]:
+    """Yield ``id in (...)`` JQL clauses covering the given issue IDs in fixed-size batches."""
+    issue_ids = sorted({str(issue_id) for issue_id in issue_ids})
+    for offset in range(0, len(issue_ids), JIRA_ISSUE_ID_BATCH_SIZE):
+        yield f"id in ({','.join(issue_ids[offset:offset + JIRA_ISSUE_ID_BATCH_SIZE])})"
+
+
+class WorklogSyncService(BaseService, IWorklogSyncService):
+    """Keep the local worklog store current from Jira's worklog change feeds.
+
+    Changed worklog IDs come from ``/worklog/updated`` and are hydrated in
+    bulk through ``/worklog/list``; removals come from ``/worklog/deleted``.
+    Cursors are stored per (cloud_id, account_id) because the feeds only
+    return worklogs visible to the syncing user's token. The first sync
+    backfills ``lookback_days`` of history, which becomes the store's horizon.
+    The backfill reads the feed from the horizon, so a worklog dated after
+    the horizon but last updated before it (logged ahead of time) only
+    reaches the store once it is edited again; ``covers`` cannot detect that.
+
+    Feed cursors are saved after every page, so a sync cut short resumes
+    where it stopped. ``syncedAt`` is only set once a sync finishes; the
+    store covers nothing until the first one has, nor once the last
+    completed sync is more than ``max_age`` seconds old. Issue metadata is
+    refreshed on its own ``updated`` cursor, so edits to the syncing user's
+    issues are picked up even when none of their worklogs changed.
+    """
+
+    def __init__(
+        self,
+        jira_client: IJiraClient,
+        store: IWorklogStore,
+        cloud_id: str,
+        account_id: str,
+        lookback_days: int,
+        min_interval: float,
+        max_age: float,
+        single_flight: Optional[SingleFlight] = None
+    ):
+        super().__init__()
+        self._jira_client = jira_client
+        self._store = store
+        self._cloud_id = cloud_id
+        self._account_id = account_id
+        self._lookback_days = lookback_days
+        self._min_interval = min_interval
+        self._max_age = max_age
+        self._single_flight = single_flight or SingleFlight()
+
+    def covers(self, start_date: str) -> bool:
+        state = self._store.get_sync_state(self._cloud_id, self._account_id)
+        if not state or not state["syncedAt"]:
+            return False
+        return time.time() - state["syncedAt"] < self._max_age and start_date >= state["horizonDate"]
+
+    def sync_if_stale(self) -> None:
+        state = self._store.get_sync_state(self._cloud_id, self._account_id)
+        if state and time.time() - state["syncedAt"] < self._min_interval:
+            return
+        self._single_flight.do((self._cloud_id, self._account_id), self.sync)
+
+    def sync(self) -> Dict[str, int]:
+        started_at = time.time()
+        state = self._store.get_sync_state(self._cloud_id, self._account_id)
+        if state is None:
+            horizon = (date.today() - timedelta(days=self._lookback_days)).strftime(DATE_FORMAT)
+            horizon_dt = datetime.strptime(horizon, DATE_FORMAT).replace(tzinfo=timezone.utc)
+            horizon_ms = int(horizon_dt.timestamp() * 1000)
+            # Worklogs deleted before the backfill starts are never fetched, so
+            # only deletions from then on need to be applied.
+            state = {
+                "updatedSince": horizon_ms,
+                "deletedSince": int(started_at * 1000),
+                "issuesSince": horizon_ms,
+                "horizonDate": horizon,
+                "syncedAt": 0
+            }
+        backfilled = bool(state["syncedAt"])
+
+        touched_issue_ids: Set[str] = set()
+        updated = 0
+        for page in self._jira_client.iter_updated_worklogs(state["updatedSince"]):
+            worklog_ids = [value["worklogId"] for value in page.get("values", [])]
+            worklogs = self._jira_client.get_worklogs_by_ids(worklog_ids)
+            updated += self._store.upsert_worklogs(self._cloud_id, worklogs)
+            touched_issue_ids.update(str(wl["issueId"]) for wl in worklogs)
+            state["updatedSince"] = page.get("until", state["updatedSince"])
+            self._save_state(state)
+
+        deleted = 0
+        for page in self._jira_client.iter_deleted_worklogs(state["deletedSince"]):
+            worklog_ids = [value["worklogId"] for value in page.get("values", [])]
+            deleted += self._store.delete_worklogs(self._cloud_id, worklog_ids)
+            state["deletedSince"] = page.get("until", state["deletedSince"])
+            self._save_state(state)
+
+        touched_issue_ids.update(self._store.get_issue_ids_without_metadata(self._cloud_id))
+        issues = self._refresh_issues(touched_issue_ids)
+        if backfilled:
+            issues += self._refresh_updated_issues(state["issuesSince"])
+
+        state["issuesSince"] = int(started_at * 1000)
+        state["syncedAt"] = time.time()
+        self._save_state(state)
+
+        result = {"updated": updated, "deleted": deleted, "issues": issues}
+        self.logger.info(
+            "Worklog store synchronised",
+            extra={"cloud_id": self._cloud_id, **result}
+        )
+        return result
+
+    def _save_state(self, state: Dict[str, Any]) -> None:
+        self._store.set_sync_state(
+            self._cloud_id,
+            self._account_id,
+            updated_since=state["updatedSince"],
+            deleted_since=state["deletedSince"],
+            issues_since=state["issuesSince"],
+            horizon_date=state["horizonDate"],
+            synced_at=state["syncedAt"]
+        )
+
+    def _refresh_issues(self, issue_ids: Iterable[str]) -> int:
+        refreshed = 0
+        for jql in issue_id_jql(issue_ids):
+            for page in self._jira_client.search_issues(jql=jql, fields=JIRA_ISSUE_FIELDS, max_results=JIRA_MAX_RESULTS):
+                refreshed += self._store.upsert_issues(self._cloud_id, page)
+        return refreshed
+
+    def _refresh_updated_issues(self, updated_since: int) -> int:
+        """Re-read metadata of the syncing user's issues updated since an epoch-millisecond cursor.
+
+        JQL compares dates in the user's profile time zone, so the cursor is
+        widened by a margin and issues near it are simply read again.
+        """
+        since = datetime.fromtimestamp(updated_since / 1000, tz=timezone.utc) - timedelta(days=JQL_DATE_MARGIN_DAYS)
+        jql = f'worklogAuthor = "{self._account_id}" AND updated >= "{since.strftime(DATE_FORMAT)}"'
+        refreshed = 0
+        for page in self._jira_client.search_issues(jql=jql, fields=JIRA_ISSUE_FIELDS, max_results=JIRA_MAX_RESULTS):
+            refreshed += self._store.upsert_issues(self._cloud_id, page)
+        return refreshed
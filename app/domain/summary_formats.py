@@ -0,0 +1,82 @@
+"""Alternative representations of worklog summaries, and their content version."""
+
+import hashlib
+from typing import Any, Dict, List, Optional, Tuple
+
+from app.utils.serialization import dumps_json
+
+
+def issue_sort_key(issue_key: str) -> Tuple[str, int]:
+    """Order issue keys by project, then numerically, so ``PROJ-9`` precedes ``PROJ-10``."""
+    project, _, number = issue_key.rpartition("-")
+    if project and number.isdigit():
+        return project, int(number)
+    return issue_key, 0
+
+
+def summary_version(days: List[Dict[str, Any]], completeness: Dict[str, Any]) -> str:
+    """Return a hash of a summary's days and completeness.
+
+    Identical summaries get the same version, so clients can tell whether a
+    summary changed without comparing bodies. Days, issues, the issue lists
+    in ``completeness`` and object keys are hashed in a canonical order, so
+    the order they were fetched or merged in does not change the version.
+    """
+    canonical_days = [
+        {**day, "issues": sorted(day["issues"], key=lambda issue: issue_sort_key(issue["issueKey"]))}
+        for day in sorted(days, key=lambda day: day["workDate"])
+    ]
+    canonical_completeness = {
+        key: sorted(value, key=issue_sort_key) if isinstance(value, list) else value
+        for key, value in completeness.items()
+    }
+    content = dumps_json([canonical_days, canonical_completeness], sort_keys=True)
+    return hashlib.sha256(content).hexdigest()[:32]
+
+
+def normalize_summary(days: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Return ``{"days", "issues", "people"}`` with each issue and person stored once.
+
+    Day entries reference issues by ``issueKey`` and keep only the per-day
+    ``worklogSummary`` and ``worklogs``. Issue reporters and assignees and
+    worklog authors become account IDs keyed into ``people``; a missing
+    reporter or assignee is ``None``.
+    """
+    issues: Dict[str, Dict[str, Any]] = {}
+    people: Dict[str, Dict[str, Any]] = {}
+
+    def person_ref(person: Optional[Dict[str, Any]]) -> Optional[str]:
+        account_id = (person or {}).get("accountId")
+        if account_id is not None and account_id not in people:
+            people[account_id] = {"displayName": person.get("displayName")}
+        return account_id
+
+    normalized_days = []
+    for day in days:
+        day_issues = []
+        for issue in day["issues"]:
+            issue_key = issue["issueKey"]
+            if issue_key not in issues:
+                issues[issue_key] = {
+                    "issueSummary": issue["issueSummary"],
+                    "reportedBy": person_ref(issue["reportedBy"]),
+                    "assignee": person_ref(issue["assignee"]),
+                    "issueType": issue["issueType"],
+                    "status": issue["status"],
+                    "priority": issue["priority"],
+                    "originalEstimate": issue["originalEstimate"],
+                    "originalEstimateFormatted": issue["originalEstimateFormatted"]
+                }
+            day_issues.append({
+                "issueKey": issue_key,
+                "worklogSummary": issue["worklogSummary"],
+                "worklogs": [{**wl, "author": person_ref(wl["author"])} for wl in issue["worklogs"]]
+            })
+        normalized_days.append({
+            "workDate": day["workDate"],
+            "workDateFormatted": day["workDateFormatted"],
+            "daySummary": day["daySummary"],
+            "issues": day_issues
+        })
+
+    return {"days": normalized_days, "issues": issues, "people": people}
@@ -1,5 +1,7 @@
 """Infrastructure layer: external integrations and implementations."""
 
 from app.infrastructure.jira_client import JiraClient
+from app.infrastructure.async_jira_client import AsyncJiraClient
+from app.infrastructure.worklog_store import SqliteWorklogStore
 
-__all__ = ["JiraClient"]
+__all__ = ["JiraClient", "AsyncJiraClient", "SqliteWorklogStore"]
@@ -0,0 +1,293 @@
+"""Asyncio-native Jira API client implementation."""
+
+import asyncio
+import time
+from typing import List, Dict, Any, AsyncIterator, Optional
+
+import httpx
+
+from app.domain.interfaces import IAsyncJiraClient
+from app.core.logging import get_logger
+from app.core.exceptions import ExternalServiceError, AuthenticationError
+from app.core.deadline import Deadline, current_deadline
+from app.core.config import (
+    JIRA_DOMAIN,
+    JIRA_API_BASE_URL,
+    JIRA_RETRY_MAX_ATTEMPTS
+)
+from app.core.constants import (
+    JIRA_MAX_RESULTS,
+    JIRA_REQUEST_TIMEOUT,
+    JIRA_WORKLOG_PAGE_SIZE
+)
+from app.infrastructure.http_pool import get_transport_registry
+from app.infrastructure.rate_limiter import JiraRateLimiter, RETRY_STATUS_CODES, get_rate_limiter
+from app.infrastructure.circuit_breaker import CircuitBreakerRegistry, get_circuit_breakers
+from app.infrastructure.concurrency import (
+    AdaptiveConcurrencyLimiter,
+    OUTCOME_IGNORED,
+    OUTCOME_OVERLOAD,
+    get_concurrency_limiter,
+    outcome_for_status
+)
+
+logger = get_logger(__name__)
+
+
+class AsyncJiraClient(IAsyncJiraClient):
+    """Async Jira API client on top of the shared, per-site pooled HTTP client, limiters and circuit breaker."""
+
+    def __init__(
+        self,
+        access_token: Optional[str] = None,
+        cloud_id: Optional[str] = None,
+        http_client: Optional[httpx.AsyncClient] = None,
+        rate_limiter: Optional[JiraRateLimiter] = None,
+        concurrency_limiter: Optional[AdaptiveConcurrencyLimiter] = None,
+        circuit_breakers: Optional[CircuitBreakerRegistry] = None
+    ):
+        if not access_token:
+            raise AuthenticationError("No authentication method available. Access token is required.")
+        self.access_token = access_token
+        self.cloud_id = cloud_id
+        self._base_url = self._get_base_url()
+        self._headers = {
+            "Accept": "application/json",
+            "Authorization": f"Bearer {access_token}"
+        }
+        self._http_client = http_client or get_transport_registry().get_async_client(cloud_id)
+        self._rate_limiter = rate_limiter or get_rate_limiter()
+        self._concurrency_limiter = concurrency_limiter or get_concurrency_limiter()
+        self._circuit_breaker = (circuit_breakers or get_circuit_breakers()).get(cloud_id)
+
+    def update_token(self, access_token: str):
+        """Update the access token and refresh headers."""
+        self.access_token = access_token
+        self._headers["Authorization"] = f"Bearer {access_token}"
+
+    def _get_base_url(self) -> str:
+        if self.access_token and self.cloud_id:
+            return f"{JIRA_API_BASE_URL}/ex/jira/{self.cloud_id}"
+        return f"https://{JIRA_DOMAIN}"
+
+    async def _get(self, url: str, params: Optional[Dict[str, Any]] = None) -> httpx.Response:
+        return await self._request("GET", url, params=params)
+
+    async def _request(
+        self,
+        method: str,
+        url: str,
+        params: Optional[Dict[str, Any]] = None,
+        json: Optional[Dict[str, Any]] = None
+    ) -> httpx.Response:
+        """Send a request, retrying throttled and transient failures with backoff.
+
+        Within a ``deadline_scope`` each attempt's timeout is capped to the
+        remaining budget, and a retry that could not finish in time is not made.
+        """
+        deadline = current_deadline()
+        attempt = 0
+        while True:
+            response = await self._attempt(method, url, deadline, params=params, json=json)
+            retry_after = self._rate_limiter.observe(self.cloud_id, response.status_code, response.headers)
+            if response.status_code not in RETRY_STATUS_CODES or attempt >= JIRA_RETRY_MAX_ATTEMPTS:
+                response.raise_for_status()
+                return response
+            delay = self._rate_limiter.backoff(attempt, retry_after)
+            if deadline is not None and delay >= deadline.remaining():
+                response.raise_for_status()
+                return response
+            await asyncio.sleep(delay)
+            attempt += 1
+
+    async def _attempt(
+        self,
+        method: str,
+        url: str,
+        deadline: Optional[Deadline],
+        params: Optional[Dict[str, Any]] = None,
+        json: Optional[Dict[str, Any]] = None
+    ) -> httpx.Response:
+        """Make one request guarded by the site's circuit breaker, concurrency limit and rate limit."""
+        probe = self._circuit_breaker.before_call()
+        try:
+            await self._concurrency_limiter.acquire_async(self.cloud_id)
+        except BaseException:
+            # Cancelled while waiting for a slot: free a half-open probe.
+            self._circuit_breaker.record_cancelled(probe)
+            raise
+        outcome = OUTCOME_IGNORED
+        started = time.monotonic()
+        try:
+            await self._rate_limiter.acquire_async(self.cloud_id, deadline)
+            timeout = deadline.timeout(JIRA_REQUEST_TIMEOUT) if deadline else JIRA_REQUEST_TIMEOUT
+            started = time.monotonic()
+            response = await self._http_client.request(
+                method,
+                url,
+                params=params,
+                json=json,
+                headers=self._headers,
+                timeout=timeout
+            )
+            outcome = outcome_for_status(response.status_code)
+        except httpx.TimeoutException as e:
+            if deadline is not None and deadline.expired:
+                # Our own budget ran out; that says nothing about Jira's health.
+                self._circuit_breaker.record_cancelled(probe)
+                raise deadline.error() from e
+            outcome = OUTCOME_OVERLOAD
+            self._circuit_breaker.record_failure()
+            raise
+        except httpx.TransportError:
+            self._circuit_breaker.record_failure()
+            raise
+        except BaseException:
+            self._circuit_breaker.record_cancelled(probe)
+            raise
+        finally:
+            self._concurrency_limiter.release(self.cloud_id, time.monotonic() - started, outcome)
+
+        if response.status_code >= 500:
+            self._circuit_breaker.record_failure()
+        else:
+            self._circuit_breaker.record_success()
+        return response
+
+    async def search_issues(
+        self,
+        jql: str,
+        fields: List[str],
+        max_results: int = JIRA_MAX_RESULTS
+    ) -> AsyncIterator[List[Dict[str, Any]]]:
+        """Yield pages of issues matching the JQL, following ``nextPageToken`` until the last page."""
+        next_page_token = None
+        while True:
+            data = await self._search_page(jql, fields, max_results, next_page_token)
+            issues = data.get("issues", [])
+            if issues:
+                yield issues
+            next_page_token = data.get("nextPageToken")
+            if data.get("isLast", True) or not next_page_token:
+                return
+
+    async def _search_page(
+        self,
+        jql: str,
+        fields: List[str],
+        max_results: int,
+        next_page_token: Optional[str] = None
+    ) -> Dict[str, Any]:
+        url = f"{self._base_url}/rest/api/3/search/jql"
+        params = {
+            "jql": jql,
+            "fields": ",".join(fields),
+            "maxResults": max_results
+        }
+        if next_page_token:
+            params["nextPageToken"] = next_page_token
+        try:
+            response = await self._get(url, params=params)
+            return response.json()
+        except httpx.HTTPStatusError as e:
+            logger.error(
+                "Jira API error",
+                extra={
+                    "status_code": e.response.status_code,
+                    "url": url,
+                    "jql": jql
+                },
+                exc_info=e
+            )
+            raise ExternalServiceError(
+                message=f"Jira API error: {e.response.text}",
+                service_name="Jira",
+                status_code=e.response.status_code,
+                details={"url": url, "jql": jql}
+            )
+        except ExternalServiceError:
+            raise
+        except Exception as e:
+            logger.error(
+                "Unexpected error in Jira API call",
+                extra={"url": url, "jql": jql},
+                exc_info=e
+            )
+            raise ExternalServiceError(
+                message=f"Failed to query Jira API: {str(e)}",
+                service_name="Jira",
+                details={"url": url}
+            )
+
+    async def get_issue_worklogs(
+        self,
+        issue_key: str,
+        started_after: Optional[int] = None,
+        started_before: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        worklogs = []
+        async for page in self.iter_issue_worklogs(issue_key, started_after, started_before):
+            worklogs.extend(page)
+        return worklogs
+
+    async def iter_issue_worklogs(
+        self,
+        issue_key: str,
+        started_after: Optional[int] = None,
+        started_before: Optional[int] = None,
+        max_results: int = JIRA_WORKLOG_PAGE_SIZE
+    ) -> AsyncIterator[List[Dict[str, Any]]]:
+        """Yield pages of an issue's worklogs, optionally bounded by epoch-millisecond start times."""
+        params = {"startAt": 0, "maxResults": max_results}
+        if started_after is not None:
+            params["startedAfter"] = started_after
+        if started_before is not None:
+            params["startedBefore"] = started_before
+
+        while True:
+            data = await self._worklog_page(issue_key, params)
+            worklogs = data.get("worklogs", [])
+            if worklogs:
+                yield worklogs
+            params["startAt"] += len(worklogs)
+            if not worklogs or params["startAt"] >= data.get("total", 0):
+                return
+
+    async def _worklog_page(self, issue_key: str, params: Dict[str, Any]) -> Dict[str, Any]:
+        url = f"{self._base_url}/rest/api/3/issue/{issue_key}/worklog"
+        try:
+            response = await self._get(url, params=dict(params))
+            return response.json()
+        except httpx.HTTPStatusError as e:
+            logger.error(
+                "Failed to get worklogs",
+                extra={
+                    "issue_key": issue_key,
+                    "status_code": e.response.status_code,
+                    "url": url
+                },
+                exc_info=e
+            )
+            raise ExternalServiceError(
+                message=f"Failed to retrieve worklogs for issue {issue_key}: {e.response.text}",
+                service_name="Jira",
+                status_code=e.response.status_code,
+                details={"issue_key": issue_key, "url": url}
+            )
+        except ExternalServiceError:
+            raise
+        except Exception as e:
+            logger.error(
+                "Unexpected error getting worklogs",
+                extra={"issue_key": issue_key, "url": url},
+                exc_info=e
+            )
+            raise ExternalServiceError(
+                message=f"Failed to retrieve worklogs: {str(e)}",
+                service_name="Jira",
+                details={"issue_key": issue_key}
+            )
+
+    async def get_user_info(self, access_token: str) -> Dict[str, Any]:
+        from app.core.auth import get_user_info as fetch_user_info
+        return await asyncio.to_thread(fetch_user_info, access_token)
@@ -0,0 +1,153 @@
+"""Circuit breakers that fail fast while a Jira site is unhealthy."""
+
+import threading
+import time
+from typing import Any, Dict, Optional
+
+from app.core.logging import get_logger
+from app.core.exceptions import CircuitOpenError
+from app.core.config import (
+    JIRA_BREAKER_FAILURE_THRESHOLD,
+    JIRA_BREAKER_RESET_TIMEOUT
+)
+
+logger = get_logger(__name__)
+
+DEFAULT_SITE_KEY = "default"
+
+STATE_CLOSED = "closed"
+STATE_OPEN = "open"
+STATE_HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:
+    """Three-state circuit breaker.
+
+    ``closed``: calls pass; ``failure_threshold`` consecutive failures open
+    the circuit. ``open``: calls fail immediately with ``CircuitOpenError``
+    until ``reset_timeout`` seconds have passed. ``half_open``: a single
+    probe call is let through; its success closes the circuit, its failure
+    re-opens it.
+    """
+
+    def __init__(self, name: str, failure_threshold: int, reset_timeout: float):
+        self._name = name
+        self._failure_threshold = max(1, failure_threshold)
+        self._reset_timeout = reset_timeout
+        self._lock = threading.Lock()
+        self._state = STATE_CLOSED
+        self._consecutive_failures = 0
+        self._opened_at = 0.0
+        self._probe_in_flight = False
+        self._rejected = 0
+        self._opened = 0
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            return self._state
+
+    def before_call(self) -> bool:
+        """Raise ``CircuitOpenError`` unless a call may be made now.
+
+        Returns True when the admitted call is the half-open probe.
+        """
+        with self._lock:
+            if self._state == STATE_CLOSED:
+                return False
+            retry_in = self._opened_at + self._reset_timeout - time.monotonic()
+            if self._state == STATE_OPEN and retry_in <= 0:
+                self._state = STATE_HALF_OPEN
+            if self._state == STATE_HALF_OPEN and not self._probe_in_flight:
+                self._probe_in_flight = True
+                return True
+            self._rejected += 1
+
+        raise CircuitOpenError(
+            service_name="Jira",
+            retry_after=max(0.0, retry_in),
+            details={"site": self._name}
+        )
+
+    def record_success(self) -> None:
+        with self._lock:
+            if self._state != STATE_CLOSED:
+                logger.info("Jira circuit closed", extra={"site": self._name})
+            self._state = STATE_CLOSED
+            self._consecutive_failures = 0
+            self._probe_in_flight = False
+
+    def record_cancelled(self, probe: bool) -> None:
+        """Release the half-open probe if ``probe`` says the abandoned call was it.
+
+        A call admitted while the circuit was closed may be abandoned after a
+        probe has been let through; it must not free that probe's slot.
+        """
+        if not probe:
+            return
+        with self._lock:
+            self._probe_in_flight = False
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self._consecutive_failures += 1
+            if self._state == STATE_HALF_OPEN or self._consecutive_failures >= self._failure_threshold:
+                if self._state != STATE_OPEN:
+                    self._opened += 1
+                    logger.warning(
+                        "Jira circuit opened",
+                        extra={"site": self._name, "consecutive_failures": self._consecutive_failures}
+                    )
+                self._state = STATE_OPEN
+                self._opened_at = time.monotonic()
+                self._probe_in_flight = False
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            retry_in = 0.0
+            if self._state == STATE_OPEN:
+                retry_in = max(0.0, self._opened_at + self._reset_timeout - time.monotonic())
+            return {
+                "state": self._state,
+                "consecutiveFailures": self._consecutive_failures,
+                "failureThreshold": self._failure_threshold,
+                "resetTimeoutSeconds": self._reset_timeout,
+                "retryInSeconds": round(retry_in, 3),
+                "timesOpened": self._opened,
+                "rejectedCalls": self._rejected
+            }
+
+
+class CircuitBreakerRegistry:
+    """One circuit breaker per Jira ``cloud_id``, so one degraded site does not block others."""
+
+    def __init__(
+        self,
+        failure_threshold: int = JIRA_BREAKER_FAILURE_THRESHOLD,
+        reset_timeout: float = JIRA_BREAKER_RESET_TIMEOUT
+    ):
+        self._failure_threshold = failure_threshold
+        self._reset_timeout = reset_timeout
+        self._lock = threading.Lock()
+        self._breakers: Dict[str, CircuitBreaker] = {}
+
+    def get(self, cloud_id: Optional[str]) -> CircuitBreaker:
+        key = cloud_id or DEFAULT_SITE_KEY
+        with self._lock:
+            breaker = self._breakers.get(key)
+            if breaker is None:
+                breaker = self._breakers[key] = CircuitBreaker(key, self._failure_threshold, self._reset_timeout)
+            return breaker
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            breakers = dict(self._breakers)
+        return {key: breaker.stats() for key, breaker in breakers.items()}
+
+
+_registry = CircuitBreakerRegistry()
+
+
+def get_circuit_breakers() -> CircuitBreakerRegistry:
+    """Get the process-wide Jira circuit breaker registry."""
+    return _registry
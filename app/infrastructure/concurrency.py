@@ -0,0 +1,225 @@
+"""Adaptive (AIMD) concurrency limiting for Jira requests, per site."""
+
+import asyncio
+import threading
+import time
+from collections import deque
+from typing import Any, Callable, Deque, Dict, Optional
+
+from app.core.logging import get_logger
+from app.core.config import (
+    JIRA_CONCURRENCY_INITIAL,
+    JIRA_CONCURRENCY_MIN,
+    JIRA_CONCURRENCY_MAX
+)
+
+logger = get_logger(__name__)
+
+DEFAULT_SITE_KEY = "default"
+
+OUTCOME_OK = "ok"
+OUTCOME_OVERLOAD = "overload"
+OUTCOME_IGNORED = "ignored"
+
+OVERLOAD_STATUS_CODES = {429, 503}
+
+
+def outcome_for_status(status_code: int) -> str:
+    """Classify a response for the concurrency controller."""
+    if status_code in OVERLOAD_STATUS_CODES:
+        return OUTCOME_OVERLOAD
+    if status_code >= 500:
+        return OUTCOME_IGNORED
+    return OUTCOME_OK
+
+
+class _SiteLimit:
+    def __init__(self, initial: int):
+        self.limit = float(initial)
+        self.in_flight = 0
+        self.waiters: Deque[Callable[[], None]] = deque()
+        self.smoothed_latency: Optional[float] = None
+        self.baseline_latency: Optional[float] = None
+        self.last_decrease = 0.0
+        self.increases = 0
+        self.decreases = 0
+        self.events: Deque[Dict[str, Any]] = deque(maxlen=20)
+
+
+class AdaptiveConcurrencyLimiter:
+    """Caps in-flight Jira requests per ``cloud_id`` with an AIMD-controlled limit.
+
+    Successful responses whose latency stays within ``latency_tolerance`` of
+    the observed baseline grow the limit by roughly one per round trip while
+    the limit is actually in use. 429/503 responses and timeouts cut it by
+    ``decrease_factor``, at most once per round trip so one burst of
+    rejections counts as a single congestion signal. The limit stays within
+    ``[floor, ceiling]``. Sync callers block a thread; async callers await,
+    and both share the same per-site limit.
+    """
+
+    def __init__(
+        self,
+        initial: int = JIRA_CONCURRENCY_INITIAL,
+        floor: int = JIRA_CONCURRENCY_MIN,
+        ceiling: int = JIRA_CONCURRENCY_MAX,
+        decrease_factor: float = 0.5,
+        latency_tolerance: float = 2.0
+    ):
+        self._floor = max(1, floor)
+        self._ceiling = max(self._floor, ceiling)
+        self._initial = min(max(initial, self._floor), self._ceiling)
+        self._decrease_factor = decrease_factor
+        self._latency_tolerance = latency_tolerance
+        self._lock = threading.Lock()
+        self._sites: Dict[str, _SiteLimit] = {}
+
+    def _site(self, cloud_id: Optional[str]) -> _SiteLimit:
+        key = cloud_id or DEFAULT_SITE_KEY
+        site = self._sites.get(key)
+        if site is None:
+            site = self._sites[key] = _SiteLimit(self._initial)
+        return site
+
+    def acquire(self, cloud_id: Optional[str], timeout: Optional[float] = None) -> bool:
+        """Block until a request slot for the site is available.
+
+        Returns False, without holding a slot, if ``timeout`` seconds pass first.
+        """
+        with self._lock:
+            site = self._site(cloud_id)
+            if self._try_take(site):
+                return True
+            granted = threading.Event()
+            site.waiters.append(granted.set)
+        if granted.wait(timeout):
+            return True
+        with self._lock:
+            try:
+                site.waiters.remove(granted.set)
+                return False
+            except ValueError:
+                # Handed a slot between the timeout and taking the lock.
+                return True
+
+    async def acquire_async(self, cloud_id: Optional[str]) -> None:
+        """Asyncio counterpart of ``acquire``."""
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            site = self._site(cloud_id)
+            if self._try_take(site):
+                return
+            future = loop.create_future()
+
+            def waiter() -> None:
+                loop.call_soon_threadsafe(self._grant, cloud_id, future)
+
+            site.waiters.append(waiter)
+
+        try:
+            await future
+        except asyncio.CancelledError:
+            with self._lock:
+                try:
+                    site.waiters.remove(waiter)
+                    handed_over = False
+                except ValueError:
+                    handed_over = True
+            if handed_over and future.done() and not future.cancelled():
+                self.release(cloud_id, 0.0, OUTCOME_IGNORED)
+            raise
+
+    def _grant(self, cloud_id: Optional[str], future: asyncio.Future) -> None:
+        if future.cancelled():
+            self.release(cloud_id, 0.0, OUTCOME_IGNORED)
+        else:
+            future.set_result(None)
+
+    def _try_take(self, site: _SiteLimit) -> bool:
+        if not site.waiters and site.in_flight < int(site.limit):
+            site.in_flight += 1
+            return True
+        return False
+
+    def release(self, cloud_id: Optional[str], latency: float, outcome: str) -> None:
+        """Return a slot and feed the request's latency and outcome into the controller."""
+        with self._lock:
+            site = self._site(cloud_id)
+            self._adjust(site, cloud_id, latency, outcome)
+            site.in_flight -= 1
+            while site.waiters and site.in_flight < int(site.limit):
+                site.in_flight += 1
+                site.waiters.popleft()()
+
+    def _adjust(self, site: _SiteLimit, cloud_id: Optional[str], latency: float, outcome: str) -> None:
+        now = time.monotonic()
+        if outcome == OUTCOME_OVERLOAD:
+            round_trip = site.smoothed_latency or 1.0
+            if now - site.last_decrease < round_trip:
+                return
+            site.last_decrease = now
+            self._set_limit(site, cloud_id, max(self._floor, site.limit * self._decrease_factor), "overload")
+            return
+
+        if outcome != OUTCOME_OK:
+            return
+
+        if site.smoothed_latency is None:
+            site.smoothed_latency = latency
+        else:
+            site.smoothed_latency += 0.1 * (latency - site.smoothed_latency)
+        if site.baseline_latency is None or latency < site.baseline_latency:
+            site.baseline_latency = latency
+        else:
+            site.baseline_latency += 0.01 * (latency - site.baseline_latency)
+
+        healthy = latency <= self._latency_tolerance * site.baseline_latency
+        saturated = site.in_flight >= site.limit / 2
+        if healthy and saturated and site.limit < self._ceiling:
+            self._set_limit(site, cloud_id, min(self._ceiling, site.limit + 1 / site.limit), "healthy")
+
+    def _set_limit(self, site: _SiteLimit, cloud_id: Optional[str], new_limit: float, reason: str) -> None:
+        old_limit = int(site.limit)
+        site.limit = new_limit
+        if int(new_limit) == old_limit:
+            return
+        if int(new_limit) > old_limit:
+            site.increases += 1
+        else:
+            site.decreases += 1
+            logger.info(
+                "Reduced Jira concurrency limit",
+                extra={"cloud_id": cloud_id, "from": old_limit, "to": int(new_limit), "reason": reason}
+            )
+        site.events.append({
+            "at": time.time(),
+            "from": old_limit,
+            "to": int(new_limit),
+            "reason": reason
+        })
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                key: {
+                    "limit": int(site.limit),
+                    "inFlight": site.in_flight,
+                    "waiting": len(site.waiters),
+                    "floor": self._floor,
+                    "ceiling": self._ceiling,
+                    "increases": site.increases,
+                    "decreases": site.decreases,
+                    "smoothedLatencySeconds": round(site.smoothed_latency or 0.0, 4),
+                    "baselineLatencySeconds": round(site.baseline_latency or 0.0, 4),
+                    "recentAdjustments": list(site.events)
+                }
+                for key, site in self._sites.items()
+            }
+
+
+_concurrency_limiter = AdaptiveConcurrencyLimiter()
+
+
+def get_concurrency_limiter() -> AdaptiveConcurrencyLimiter:
+    """Get the process-wide adaptive Jira concurrency limiter."""
+    return _concurrency_limiter
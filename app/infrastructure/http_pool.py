@@ -0,0 +1,176 @@
+"""Process-wide pooled HTTP transports for Jira, keyed by cloud ID."""
+
+import asyncio
+import threading
+import time
+from http.cookiejar import CookieJar, DefaultCookiePolicy
+from typing import Dict, Any, Optional, Tuple
+
+import httpx
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from app.core.logging import get_logger
+from app.core.config import (
+    JIRA_HTTP_POOL_SIZE,
+    JIRA_HTTP_KEEPALIVE_EXPIRY,
+    JIRA_HTTP_IDLE_TIMEOUT
+)
+from app.core.constants import JIRA_REQUEST_TIMEOUT
+
+logger = get_logger(__name__)
+
+DEFAULT_POOL_KEY = "default"
+
+
+def _no_cookie_jar() -> CookieJar:
+    """Return a cookie jar that refuses to store cookies for any domain."""
+    return CookieJar(policy=DefaultCookiePolicy(allowed_domains=[]))
+
+
+class JiraTransportRegistry:
+    """Registry of pooled sync and async HTTP transports shared across requests.
+
+    Transports carry no credentials; callers attach the user's bearer token
+    per request. They also keep no cookies, since one transport serves every
+    user of a site and a cookie set for one must not reach the next.
+    Transports unused for longer than ``idle_timeout`` seconds are closed by
+    ``reap_idle`` so sites that stop being queried do not keep sockets open.
+    """
+
+    def __init__(
+        self,
+        pool_size: int = JIRA_HTTP_POOL_SIZE,
+        keepalive_expiry: float = JIRA_HTTP_KEEPALIVE_EXPIRY,
+        idle_timeout: float = JIRA_HTTP_IDLE_TIMEOUT
+    ):
+        self._pool_size = pool_size
+        self._keepalive_expiry = keepalive_expiry
+        self._idle_timeout = idle_timeout
+        self._lock = threading.Lock()
+        self._sessions: Dict[str, Tuple[requests.Session, float]] = {}
+        self._async_clients: Dict[str, Tuple[httpx.AsyncClient, float]] = {}
+
+    @property
+    def idle_timeout(self) -> float:
+        return self._idle_timeout
+
+    def get_session(self, cloud_id: Optional[str]) -> requests.Session:
+        """Get the pooled ``requests`` session for a Jira site."""
+        key = cloud_id or DEFAULT_POOL_KEY
+        with self._lock:
+            entry = self._sessions.get(key)
+            session = entry[0] if entry else self._create_session()
+            self._sessions[key] = (session, time.monotonic())
+            return session
+
+    def get_async_client(self, cloud_id: Optional[str]) -> httpx.AsyncClient:
+        """Get the pooled ``httpx`` async client for a Jira site."""
+        key = cloud_id or DEFAULT_POOL_KEY
+        with self._lock:
+            entry = self._async_clients.get(key)
+            client = entry[0] if entry and not entry[0].is_closed else self._create_async_client()
+            self._async_clients[key] = (client, time.monotonic())
+            return client
+
+    def _create_session(self) -> requests.Session:
+        """Create HTTP session with connection pooling and connection-level retries.
+
+        Throttled and failed responses are retried by the Jira clients through
+        the rate limiter, so they are not retried again here.
+        """
+        session = requests.Session()
+        session.headers.update({"Accept": "application/json"})
+        session.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+
+        retry_strategy = Retry(
+            total=3,
+            backoff_factor=0.3,
+            status=0,
+            allowed_methods=["GET", "POST"]
+        )
+
+        adapter = HTTPAdapter(
+            max_retries=retry_strategy,
+            pool_connections=1,
+            pool_maxsize=self._pool_size
+        )
+
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+
+        return session
+
+    def _create_async_client(self) -> httpx.AsyncClient:
+        return httpx.AsyncClient(
+            timeout=JIRA_REQUEST_TIMEOUT,
+            headers={"Accept": "application/json"},
+            cookies=_no_cookie_jar(),
+            limits=httpx.Limits(
+                max_connections=self._pool_size,
+                max_keepalive_connections=self._pool_size,
+                keepalive_expiry=self._keepalive_expiry
+            ),
+            transport=httpx.AsyncHTTPTransport(retries=3)
+        )
+
+    async def reap_idle(self) -> int:
+        """Close transports that have been idle longer than the idle timeout."""
+        cutoff = time.monotonic() - self._idle_timeout
+        with self._lock:
+            idle_sessions = [key for key, (_, used) in self._sessions.items() if used < cutoff]
+            sessions = [self._sessions.pop(key)[0] for key in idle_sessions]
+            idle_clients = [key for key, (_, used) in self._async_clients.items() if used < cutoff]
+            clients = [self._async_clients.pop(key)[0] for key in idle_clients]
+
+        for session in sessions:
+            session.close()
+        for client in clients:
+            await client.aclose()
+
+        reaped = len(sessions) + len(clients)
+        if reaped:
+            logger.info("Closed idle Jira HTTP transports", extra={"count": reaped})
+        return reaped
+
+    async def run_reaper(self) -> None:
+        """Periodically close idle transports until cancelled."""
+        interval = max(self._idle_timeout / 2, 1)
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                await self.reap_idle()
+            except Exception as e:
+                logger.warning("Failed to reap idle Jira HTTP transports", exc_info=e)
+
+    async def aclose(self) -> None:
+        """Close every pooled transport."""
+        with self._lock:
+            sessions = [session for session, _ in self._sessions.values()]
+            clients = [client for client, _ in self._async_clients.values()]
+            self._sessions.clear()
+            self._async_clients.clear()
+
+        for session in sessions:
+            session.close()
+        for client in clients:
+            await client.aclose()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "sessions": len(self._sessions),
+                "asyncClients": len(self._async_clients),
+                "poolSize": self._pool_size,
+                "keepaliveExpiry": self._keepalive_expiry,
+                "idleTimeout": self._idle_timeout
+            }
+
+
+_registry = JiraTransportRegistry()
+
+
+def get_transport_registry() -> JiraTransportRegistry:
+    """Get the process-wide transport registry."""
+    return _registry
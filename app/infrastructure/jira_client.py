@@ -1,65 +1,66 @@
 """Jira API client implementation."""
 
+import time
+
 import requests
-from requests.adapters import HTTPAdapter
-from urllib3.util.retry import Retry
 from requests.auth import HTTPBasicAuth
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Iterator, Optional
 
 from app.domain.interfaces import IJiraClient
 from app.core.logging import get_logger
 from app.core.exceptions import ExternalServiceError, AuthenticationError
+from app.core.deadline import Deadline, current_deadline
 from app.core.config import (
     JIRA_DOMAIN,
-    JIRA_API_BASE_URL
+    JIRA_API_BASE_URL,
+    JIRA_RETRY_MAX_ATTEMPTS
+)
+from app.core.constants import (
+    JIRA_MAX_RESULTS,
+    JIRA_REQUEST_TIMEOUT,
+    JIRA_WORKLOG_PAGE_SIZE,
+    JIRA_WORKLOG_LIST_BATCH_SIZE
+)
+from app.infrastructure.http_pool import get_transport_registry
+from app.infrastructure.rate_limiter import JiraRateLimiter, RETRY_STATUS_CODES, get_rate_limiter
+from app.infrastructure.circuit_breaker import CircuitBreakerRegistry, get_circuit_breakers
+from app.infrastructure.concurrency import (
+    AdaptiveConcurrencyLimiter,
+    OUTCOME_IGNORED,
+    OUTCOME_OVERLOAD,
+    get_concurrency_limiter,
+    outcome_for_status
 )
 
 logger = get_logger(__name__)
 
 
 class JiraClient(IJiraClient):
-    """Jira API client implementation with connection pooling."""
+    """Jira API client on top of the shared, per-site pooled session, limiters and circuit breaker."""
 
-    def __init__(self, access_token: Optional[str] = None, cloud_id: Optional[str] = None):
+    def __init__(
+        self,
+        access_token: Optional[str] = None,
+        cloud_id: Optional[str] = None,
+        session: Optional[requests.Session] = None,
+        rate_limiter: Optional[JiraRateLimiter] = None,
+        concurrency_limiter: Optional[AdaptiveConcurrencyLimiter] = None,
+        circuit_breakers: Optional[CircuitBreakerRegistry] = None
+    ):
         self.access_token = access_token
         self.cloud_id = cloud_id
         self._base_url = self._get_base_url()
         self._headers = {"Accept": "application/json"}
         self._auth = self._get_auth()
-        self._session = self._create_session()
-    
+        self._session = session or get_transport_registry().get_session(cloud_id)
+        self._rate_limiter = rate_limiter or get_rate_limiter()
+        self._concurrency_limiter = concurrency_limiter or get_concurrency_limiter()
+        self._circuit_breaker = (circuit_breakers or get_circuit_breakers()).get(cloud_id)
+
     def update_token(self, access_token: str):
         """Update the access token and refresh headers."""
         self.access_token = access_token
         self._headers["Authorization"] = f"Bearer {access_token}"
-    
-    def _create_session(self) -> requests.Session:
-        """Create HTTP session with connection pooling and retry strategy."""
-        session = requests.Session()
-        session.headers.update(self._headers)
-        
-        retry_strategy = Retry(
-            total=3,
-            backoff_factor=0.3,
-            status_forcelist=[429, 500, 502, 503, 504],
-            allowed_methods=["GET", "POST"]
-        )
-        
-        adapter = HTTPAdapter(
-            max_retries=retry_strategy,
-            pool_connections=10,
-            pool_maxsize=20
-        )
-        
-        session.mount("http://", adapter)
-        session.mount("https://", adapter)
-        
-        return session
-    
-    def __del__(self):
-        """Cleanup session on object destruction."""
-        if hasattr(self, '_session'):
-            self._session.close()
 
     def _get_base_url(self) -> str:
         if self.access_token and self.cloud_id:
@@ -72,17 +73,105 @@ class JiraClient(IJiraClient):
             return None
         raise AuthenticationError("No authentication method available. Access token is required.")
 
-    def search_issues(self, jql: str, fields: List[str], start_at: int = 0, max_results: int = 100) -> Dict[str, Any]:
+    def _request(self, method: str, url: str, **kwargs) -> requests.Response:
+        """Send a request, retrying throttled and transient failures with backoff.
+
+        Within a ``deadline_scope`` each attempt's timeout is capped to the
+        remaining budget, and a retry that could not finish in time is not made.
+        """
+        deadline = current_deadline()
+        attempt = 0
+        while True:
+            response = self._attempt(method, url, deadline, **kwargs)
+            retry_after = self._rate_limiter.observe(self.cloud_id, response.status_code, response.headers)
+            if response.status_code not in RETRY_STATUS_CODES or attempt >= JIRA_RETRY_MAX_ATTEMPTS:
+                return response
+            delay = self._rate_limiter.backoff(attempt, retry_after)
+            if deadline is not None and delay >= deadline.remaining():
+                return response
+            response.close()
+            time.sleep(delay)
+            attempt += 1
+
+    def _attempt(self, method: str, url: str, deadline: Optional[Deadline], **kwargs) -> requests.Response:
+        """Make one request guarded by the site's circuit breaker, concurrency limit and rate limit."""
+        probe = self._circuit_breaker.before_call()
+        if not self._concurrency_limiter.acquire(self.cloud_id, deadline.remaining() if deadline else None):
+            self._circuit_breaker.record_cancelled(probe)
+            raise deadline.error()
+        outcome = OUTCOME_IGNORED
+        started = time.monotonic()
+        try:
+            self._rate_limiter.acquire(self.cloud_id, deadline)
+            timeout = deadline.timeout(JIRA_REQUEST_TIMEOUT) if deadline else JIRA_REQUEST_TIMEOUT
+            started = time.monotonic()
+            response = self._session.request(
+                method,
+                url,
+                auth=self._auth,
+                headers=self._headers,
+                timeout=timeout,
+                **kwargs
+            )
+            outcome = outcome_for_status(response.status_code)
+        except requests.exceptions.Timeout as e:
+            if deadline is not None and deadline.expired:
+                # Our own budget ran out; that says nothing about Jira's health.
+                self._circuit_breaker.record_cancelled(probe)
+                raise deadline.error() from e
+            outcome = OUTCOME_OVERLOAD
+            self._circuit_breaker.record_failure()
+            raise
+        except requests.exceptions.RequestException:
+            self._circuit_breaker.record_failure()
+            raise
+        except BaseException:
+            self._circuit_breaker.record_cancelled(probe)
+            raise
+        finally:
+            self._concurrency_limiter.release(self.cloud_id, time.monotonic() - started, outcome)
+
+        if response.status_code >= 500:
+            self._circuit_breaker.record_failure()
+        else:
+            self._circuit_breaker.record_success()
+        return response
+
+    def search_issues(
+        self,
+        jql: str,
+        fields: List[str],
+        max_results: int = JIRA_MAX_RESULTS
+    ) -> Iterator[List[Dict[str, Any]]]:
+        """Yield pages of issues matching the JQL, following ``nextPageToken`` until the last page."""
+        next_page_token = None
+        while True:
+            data = self._search_page(jql, fields, max_results, next_page_token)
+            issues = data.get("issues", [])
+            if issues:
+                yield issues
+            next_page_token = data.get("nextPageToken")
+            if data.get("isLast", True) or not next_page_token:
+                return
+
+    def _search_page(
+        self,
+        jql: str,
+        fields: List[str],
+        max_results: int,
+        next_page_token: Optional[str] = None
+    ) -> Dict[str, Any]:
         url = f"{self._base_url}/rest/api/3/search/jql"
         params = {
             "jql": jql,
             "fields": ",".join(fields),
-            "startAt": start_at,
             "maxResults": max_results
         }
+        if next_page_token:
+            params["nextPageToken"] = next_page_token
         response = None
         try:
-            response = self._session.get(url, auth=self._auth, params=params, timeout=30)
+            response = self._request("GET", url, params=params)
             response.raise_for_status()
             data = response.json()
             return data
@@ -102,6 +191,8 @@ class JiraClient(IJiraClient):
                 status_code=e.response.status_code,
                 details={"url": url, "jql": jql}
             )
+        except ExternalServiceError:
+            raise
         except Exception as e:
             logger.error(
                 "Unexpected error in Jira API call",
@@ -117,13 +208,47 @@ class JiraClient(IJiraClient):
             if response:
                 response.close()
 
-    def get_issue_worklogs(self, issue_key: str) -> List[Dict[str, Any]]:
+    def get_issue_worklogs(
+        self,
+        issue_key: str,
+        started_after: Optional[int] = None,
+        started_before: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        worklogs = []
+        for page in self.iter_issue_worklogs(issue_key, started_after, started_before):
+            worklogs.extend(page)
+        return worklogs
+
+    def iter_issue_worklogs(
+        self,
+        issue_key: str,
+        started_after: Optional[int] = None,
+        started_before: Optional[int] = None,
+        max_results: int = JIRA_WORKLOG_PAGE_SIZE
+    ) -> Iterator[List[Dict[str, Any]]]:
+        """Yield pages of an issue's worklogs, optionally bounded by epoch-millisecond start times."""
+        params = {"startAt": 0, "maxResults": max_results}
+        if started_after is not None:
+            params["startedAfter"] = started_after
+        if started_before is not None:
+            params["startedBefore"] = started_before
+
+        while True:
+            data = self._worklog_page(issue_key, params)
+            worklogs = data.get("worklogs", [])
+            if worklogs:
+                yield worklogs
+            params["startAt"] += len(worklogs)
+            if not worklogs or params["startAt"] >= data.get("total", 0):
+                return
+
+    def _worklog_page(self, issue_key: str, params: Dict[str, Any]) -> Dict[str, Any]:
         url = f"{self._base_url}/rest/api/3/issue/{issue_key}/worklog"
         response = None
         try:
-            response = self._session.get(url, auth=self._auth, timeout=30)
+            response = self._request("GET", url, params=params)
             response.raise_for_status()
-            data = response.json().get("worklogs", [])
+            data = response.json()
             return data
         except requests.exceptions.HTTPError as e:
             logger.error(
@@ -141,6 +266,8 @@ class JiraClient(IJiraClient):
                 status_code=e.response.status_code,
                 details={"issue_key": issue_key, "url": url}
             )
+        except ExternalServiceError:
+            raise
         except Exception as e:
             logger.error(
                 "Unexpected error getting worklogs",
@@ -156,6 +283,74 @@ class JiraClient(IJiraClient):
             if response:
                 response.close()
 
+    def iter_updated_worklogs(self, since: int) -> Iterator[Dict[str, Any]]:
+        """Yield pages of ``/worklog/updated``, following ``until`` until the last page."""
+        yield from self._iter_worklog_feed("updated", since)
+
+    def iter_deleted_worklogs(self, since: int) -> Iterator[Dict[str, Any]]:
+        """Yield pages of ``/worklog/deleted``, following ``until`` until the last page."""
+        yield from self._iter_worklog_feed("deleted", since)
+
+    def _iter_worklog_feed(self, feed: str, since: int) -> Iterator[Dict[str, Any]]:
+        url = f"{self._base_url}/rest/api/3/worklog/{feed}"
+        while True:
+            data = self._send("GET", url, f"{feed} worklog feed", params={"since": since})
+            yield data
+            if data.get("lastPage", True) or data.get("until") is None:
+                return
+            since = data["until"]
+
+    def get_worklogs_by_ids(self, worklog_ids: List[int]) -> List[Dict[str, Any]]:
+        url = f"{self._base_url}/rest/api/3/worklog/list"
+        worklog_ids = list(worklog_ids)
+        worklogs = []
+        for offset in range(0, len(worklog_ids), JIRA_WORKLOG_LIST_BATCH_SIZE):
+            batch = worklog_ids[offset:offset + JIRA_WORKLOG_LIST_BATCH_SIZE]
+            worklogs.extend(self._send("POST", url, "worklogs by ID", json={"ids": batch}))
+        return worklogs
+
+    def _send(
+        self,
+        method: str,
+        url: str,
+        description: str,
+        params: Optional[Dict[str, Any]] = None,
+        json: Optional[Dict[str, Any]] = None
+    ) -> Any:
+        response = None
+        try:
+            response = self._request(method, url, params=params, json=json)
+            response.raise_for_status()
+            return response.json()
+        except requests.exceptions.HTTPError as e:
+            logger.error(
+                f"Failed to get {description}",
+                extra={"status_code": e.response.status_code, "url": url},
+                exc_info=e
+            )
+            raise ExternalServiceError(
+                message=f"Failed to retrieve {description}: {e.response.text}",
+                service_name="Jira",
+                status_code=e.response.status_code,
+                details={"url": url}
+            )
+        except ExternalServiceError:
+            raise
+        except Exception as e:
+            logger.error(
+                f"Unexpected error getting {description}",
+                extra={"url": url},
+                exc_info=e
+            )
+            raise ExternalServiceError(
+                message=f"Failed to retrieve {description}: {str(e)}",
+                service_name="Jira",
+                details={"url": url}
+            )
+        finally:
+            if response:
+                response.close()
+
     def get_user_info(self, access_token: str) -> Dict[str, Any]:
         from app.core.auth import get_cloud_id, get_user_info as fetch_user_info
         return fetch_user_info(access_token)
@@ -0,0 +1,288 @@
+"""Per-site request scheduling against Jira's rate limits."""
+
+import asyncio
+import random
+import threading
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Any, Dict, Mapping, Optional
+
+from app.core.logging import get_logger
+from app.core.deadline import Deadline
+from app.core.config import (
+    JIRA_RATE_LIMIT_PER_SECOND,
+    JIRA_RATE_LIMIT_BURST,
+    JIRA_RETRY_BACKOFF_BASE,
+    JIRA_RETRY_BACKOFF_MAX
+)
+
+logger = get_logger(__name__)
+
+DEFAULT_SITE_KEY = "default"
+RETRY_STATUS_CODES = {429, 500, 502, 503, 504}
+
+
+class TokenBucket:
+    """Token bucket that hands out reservations instead of rejecting callers.
+
+    Each ``reserve`` takes a token and returns how long the caller must wait
+    for it. Tokens may go negative, which queues callers at ``rate`` per
+    second. ``pause`` stops issuing tokens until a point in time; callers
+    that reserve during the pause are queued at ``rate`` from its end.
+    Reservations made before the pause keep their wait, so
+    ``JiraRateLimiter`` holds those callers until the pause ends, and they
+    then proceed together.
+    """
+
+    def __init__(self, rate: float, capacity: float):
+        self._rate = max(rate, 0.001)
+        self._capacity = max(capacity, 1.0)
+        self._tokens = self._capacity
+        self._updated_at = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self, max_wait: Optional[float] = None) -> Optional[float]:
+        """Take a token and return the wait for it.
+
+        Returns ``None``, without taking a token, if the wait would exceed ``max_wait``.
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            start = max(now, self._updated_at)
+            wait = (start - now) + max(0.0, 1 - self._tokens) / self._rate
+            if max_wait is not None and wait > max_wait:
+                return None
+            self._tokens -= 1
+            return wait
+
+    def pause(self, seconds: float) -> None:
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            resume_at = now + seconds
+            if resume_at > self._updated_at:
+                self._updated_at = resume_at
+                self._tokens = min(self._tokens, 0.0)
+
+    def drain(self) -> None:
+        """Drop any accumulated burst so callers proceed at the steady rate."""
+        with self._lock:
+            self._refill(time.monotonic())
+            self._tokens = min(self._tokens, 0.0)
+
+    def paused_for(self) -> float:
+        with self._lock:
+            return max(0.0, self._updated_at - time.monotonic())
+
+    def _refill(self, now: float) -> None:
+        if now > self._updated_at:
+            self._tokens = min(self._capacity, self._tokens + (now - self._updated_at) * self._rate)
+            self._updated_at = now
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "rate": self._rate,
+                "burst": self._capacity,
+                "tokens": round(self._tokens, 3)
+            }
+
+
+class _SiteState:
+    def __init__(self, rate: float, burst: float):
+        self.bucket = TokenBucket(rate, burst)
+        self.waiting = 0
+        self.requests = 0
+        self.delayed = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+        self.throttled = 0
+        self.pauses = 0
+
+
+class JiraRateLimiter:
+    """Schedules Jira requests through a token bucket per ``cloud_id``.
+
+    All users of a site share its bucket, so parallel requests are spread out
+    instead of bursting into 429s together. Throttling signals from Jira
+    (``Retry-After``, ``X-RateLimit-Remaining``/``X-RateLimit-Reset`` and
+    ``X-RateLimit-NearLimit``) pause or slow the whole site, and retries use
+    jittered exponential backoff.
+    """
+
+    def __init__(
+        self,
+        rate: float = JIRA_RATE_LIMIT_PER_SECOND,
+        burst: float = JIRA_RATE_LIMIT_BURST,
+        backoff_base: float = JIRA_RETRY_BACKOFF_BASE,
+        backoff_max: float = JIRA_RETRY_BACKOFF_MAX
+    ):
+        self._rate = rate
+        self._burst = burst
+        self._backoff_base = backoff_base
+        self._backoff_max = backoff_max
+        self._lock = threading.Lock()
+        self._sites: Dict[str, _SiteState] = {}
+
+    def _site(self, cloud_id: Optional[str]) -> _SiteState:
+        key = cloud_id or DEFAULT_SITE_KEY
+        with self._lock:
+            site = self._sites.get(key)
+            if site is None:
+                site = self._sites[key] = _SiteState(self._rate, self._burst)
+            return site
+
+    def acquire(self, cloud_id: Optional[str], deadline: Optional[Deadline] = None) -> float:
+        """Block until a request to the site may be sent; return the time waited.
+
+        Raises the ``deadline``'s ``DeadlineExceededError`` instead of waiting,
+        or pausing for ``Retry-After``, past it.
+        """
+        site = self._site(cloud_id)
+        wait = self._reserve(site, deadline)
+        if wait > 0:
+            self._enter_queue(site)
+            try:
+                time.sleep(wait)
+                while (paused := self._paused_for(site, deadline)) > 0:
+                    time.sleep(paused)
+            finally:
+                self._leave_queue(site)
+        return wait
+
+    async def acquire_async(self, cloud_id: Optional[str], deadline: Optional[Deadline] = None) -> float:
+        """Asyncio counterpart of ``acquire``."""
+        site = self._site(cloud_id)
+        wait = self._reserve(site, deadline)
+        if wait > 0:
+            self._enter_queue(site)
+            try:
+                await asyncio.sleep(wait)
+                while (paused := self._paused_for(site, deadline)) > 0:
+                    await asyncio.sleep(paused)
+            finally:
+                self._leave_queue(site)
+        return wait
+
+    def _reserve(self, site: _SiteState, deadline: Optional[Deadline]) -> float:
+        wait = site.bucket.reserve(deadline.remaining() if deadline is not None else None)
+        if wait is None:
+            raise deadline.error()
+        with self._lock:
+            site.requests += 1
+            if wait > 0:
+                site.delayed += 1
+                site.total_wait += wait
+                site.max_wait = max(site.max_wait, wait)
+        return wait
+
+    def _paused_for(self, site: _SiteState, deadline: Optional[Deadline]) -> float:
+        """Return how long a pause that began while waiting still holds the site."""
+        paused = site.bucket.paused_for()
+        if deadline is not None and paused > deadline.remaining():
+            raise deadline.error()
+        return paused
+
+    def _enter_queue(self, site: _SiteState) -> None:
+        with self._lock:
+            site.waiting += 1
+
+    def _leave_queue(self, site: _SiteState) -> None:
+        with self._lock:
+            site.waiting -= 1
+
+    def observe(self, cloud_id: Optional[str], status_code: int, headers: Mapping[str, str]) -> Optional[float]:
+        """Apply a response's rate-limit signals to the site.
+
+        Returns the server-requested delay in seconds, if any.
+        """
+        site = self._site(cloud_id)
+        retry_after = parse_retry_after(headers.get("Retry-After"))
+
+        if retry_after is None and headers.get("X-RateLimit-Remaining") == "0":
+            retry_after = seconds_until(headers.get("X-RateLimit-Reset"))
+
+        if status_code in (429, 503):
+            with self._lock:
+                site.throttled += 1
+
+        if retry_after is not None and retry_after > 0:
+            site.bucket.pause(retry_after)
+            with self._lock:
+                site.pauses += 1
+            logger.warning(
+                "Jira rate limit reached, pausing requests to site",
+                extra={"cloud_id": cloud_id, "status_code": status_code, "retry_after": retry_after}
+            )
+        elif str(headers.get("X-RateLimit-NearLimit", "")).lower() == "true":
+            site.bucket.drain()
+
+        return retry_after
+
+    def backoff(self, attempt: int, retry_after: Optional[float] = None) -> float:
+        """Delay before retry ``attempt`` (0-based), with jitter so callers do not retry in lockstep."""
+        if retry_after is not None:
+            return min(retry_after, self._backoff_max) + random.uniform(0, self._backoff_base)
+        return random.uniform(0, min(self._backoff_max, self._backoff_base * (2 ** attempt)))
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            sites = list(self._sites.items())
+        result = {}
+        for key, site in sites:
+            with self._lock:
+                counters = {
+                    "waiting": site.waiting,
+                    "requests": site.requests,
+                    "delayed": site.delayed,
+                    "totalWaitSeconds": round(site.total_wait, 3),
+                    "maxWaitSeconds": round(site.max_wait, 3),
+                    "throttled": site.throttled,
+                    "pauses": site.pauses
+                }
+            result[key] = {
+                **counters,
+                **site.bucket.stats(),
+                "pausedForSeconds": round(site.bucket.paused_for(), 3)
+            }
+        return result
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Parse a ``Retry-After`` header given as delta-seconds or an HTTP date."""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+
+def seconds_until(timestamp: Optional[str]) -> Optional[float]:
+    """Seconds from now until an ISO 8601 timestamp such as ``X-RateLimit-Reset``."""
+    if not timestamp:
+        return None
+    try:
+        reset_at = datetime.fromisoformat(timestamp.replace("Z", "+00:00"))
+    except ValueError:
+        return None
+    if reset_at.tzinfo is None:
+        reset_at = reset_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (reset_at - datetime.now(timezone.utc)).total_seconds())
+
+
+_rate_limiter = JiraRateLimiter()
+
+
+def get_rate_limiter() -> JiraRateLimiter:
+    """Get the process-wide Jira rate limiter."""
+    return _rate_limiter
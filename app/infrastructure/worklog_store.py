@@ -0,0 +1,196 @@
+"""SQLite-backed local worklog store."""
+
+import json
+import sqlite3
+import threading
+from contextlib import contextmanager
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from app.domain.interfaces import IWorklogStore
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS issues (
+    cloud_id TEXT NOT NULL,
+    issue_id TEXT NOT NULL,
+    issue_key TEXT NOT NULL,
+    data TEXT NOT NULL,
+    PRIMARY KEY (cloud_id, issue_id)
+);
+
+CREATE TABLE IF NOT EXISTS worklogs (
+    cloud_id TEXT NOT NULL,
+    worklog_id TEXT NOT NULL,
+    issue_id TEXT NOT NULL,
+    author_account_id TEXT,
+    started_date TEXT NOT NULL,
+    updated TEXT,
+    data TEXT NOT NULL,
+    PRIMARY KEY (cloud_id, worklog_id)
+);
+
+CREATE INDEX IF NOT EXISTS idx_worklogs_author_started
+    ON worklogs (cloud_id, author_account_id, started_date);
+
+CREATE INDEX IF NOT EXISTS idx_worklogs_issue
+    ON worklogs (cloud_id, issue_id);
+
+CREATE INDEX IF NOT EXISTS idx_issues_key
+    ON issues (cloud_id, issue_key);
+
+CREATE TABLE IF NOT EXISTS sync_state (
+    cloud_id TEXT NOT NULL,
+    account_id TEXT NOT NULL,
+    updated_since INTEGER NOT NULL,
+    deleted_since INTEGER NOT NULL,
+    issues_since INTEGER NOT NULL,
+    horizon_date TEXT NOT NULL,
+    synced_at REAL NOT NULL,
+    PRIMARY KEY (cloud_id, account_id)
+);
+"""
+
+
+class SqliteWorklogStore(IWorklogStore):
+    """Persistent worklog store answering date-range queries from indexed local reads.
+
+    Rows are partitioned by Jira ``cloud_id``. Worklogs are indexed on
+    (author, started date) for summary queries and on issue for metadata joins.
+    """
+
+    def __init__(self, path: str):
+        self._path = path
+        self._write_lock = threading.Lock()
+        with self._connect() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript(SCHEMA)
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        conn = sqlite3.connect(self._path, timeout=30)
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    def upsert_issues(self, cloud_id: str, issues: Iterable[Dict[str, Any]]) -> int:
+        rows = [
+            (cloud_id, str(issue["id"]), issue["key"], json.dumps(issue.get("fields", {})))
+            for issue in issues
+        ]
+        if not rows:
+            return 0
+        with self._write_lock, self._connect() as conn:
+            conn.executemany(
+                "INSERT INTO issues (cloud_id, issue_id, issue_key, data) VALUES (?, ?, ?, ?) "
+                "ON CONFLICT (cloud_id, issue_id) DO UPDATE SET issue_key = excluded.issue_key, data = excluded.data",
+                rows
+            )
+        return len(rows)
+
+    def upsert_worklogs(self, cloud_id: str, worklogs: Iterable[Dict[str, Any]]) -> int:
+        rows = [
+            (
+                cloud_id,
+                str(wl["id"]),
+                str(wl["issueId"]),
+                (wl.get("author") or {}).get("accountId"),
+                wl["started"][:10],
+                wl.get("updated"),
+                json.dumps(wl)
+            )
+            for wl in worklogs
+        ]
+        if not rows:
+            return 0
+        with self._write_lock, self._connect() as conn:
+            conn.executemany(
+                "INSERT INTO worklogs (cloud_id, worklog_id, issue_id, author_account_id, started_date, updated, data) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?) "
+                "ON CONFLICT (cloud_id, worklog_id) DO UPDATE SET "
+                "issue_id = excluded.issue_id, author_account_id = excluded.author_account_id, "
+                "started_date = excluded.started_date, updated = excluded.updated, data = excluded.data",
+                rows
+            )
+        return len(rows)
+
+    def delete_worklogs(self, cloud_id: str, worklog_ids: Iterable[Any]) -> int:
+        rows = [(cloud_id, str(worklog_id)) for worklog_id in worklog_ids]
+        if not rows:
+            return 0
+        with self._write_lock, self._connect() as conn:
+            conn.executemany("DELETE FROM worklogs WHERE cloud_id = ? AND worklog_id = ?", rows)
+        return len(rows)
+
+    def get_issue_ids_without_metadata(self, cloud_id: str) -> List[str]:
+        with self._connect() as conn:
+            rows = conn.execute(
+                "SELECT DISTINCT w.issue_id FROM worklogs w "
+                "LEFT JOIN issues i ON i.cloud_id = w.cloud_id AND i.issue_id = w.issue_id "
+                "WHERE w.cloud_id = ? AND i.issue_id IS NULL",
+                (cloud_id,)
+            ).fetchall()
+        return [row[0] for row in rows]
+
+    def get_worklogs_by_date_range(
+        self,
+        cloud_id: str,
+        account_id: str,
+        start_date: str,
+        end_date: str
+    ) -> List[Tuple[Dict[str, Any], List[Dict[str, Any]]]]:
+        """Return ``(issue, worklogs)`` pairs for an author's worklogs started within the range."""
+        with self._connect() as conn:
+            rows = conn.execute(
+                "SELECT i.issue_id, i.issue_key, i.data, w.data FROM worklogs w "
+                "JOIN issues i ON i.cloud_id = w.cloud_id AND i.issue_id = w.issue_id "
+                "WHERE w.cloud_id = ? AND w.author_account_id = ? AND w.started_date BETWEEN ? AND ? "
+                "ORDER BY i.issue_key, w.started_date, w.worklog_id",
+                (cloud_id, account_id, start_date, end_date)
+            ).fetchall()
+
+        grouped: Dict[str, Tuple[Dict[str, Any], List[Dict[str, Any]]]] = {}
+        for issue_id, issue_key, issue_data, worklog_data in rows:
+            if issue_id not in grouped:
+                grouped[issue_id] = ({"id": issue_id, "key": issue_key, "fields": json.loads(issue_data)}, [])
+            grouped[issue_id][1].append(json.loads(worklog_data))
+        return list(grouped.values())
+
+    def get_sync_state(self, cloud_id: str, account_id: str) -> Optional[Dict[str, Any]]:
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT updated_since, deleted_since, issues_since, horizon_date, synced_at FROM sync_state "
+                "WHERE cloud_id = ? AND account_id = ?",
+                (cloud_id, account_id)
+            ).fetchone()
+        if row is None:
+            return None
+        return {
+            "updatedSince": row[0],
+            "deletedSince": row[1],
+            "issuesSince": row[2],
+            "horizonDate": row[3],
+            "syncedAt": row[4]
+        }
+
+    def set_sync_state(
+        self,
+        cloud_id: str,
+        account_id: str,
+        updated_since: int,
+        deleted_since: int,
+        issues_since: int,
+        horizon_date: str,
+        synced_at: float
+    ) -> None:
+        with self._write_lock, self._connect() as conn:
+            conn.execute(
+                "INSERT INTO sync_state "
+                "(cloud_id, account_id, updated_since, deleted_since, issues_since, horizon_date, synced_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?) "
+                "ON CONFLICT (cloud_id, account_id) DO UPDATE SET "
+                "updated_since = excluded.updated_since, deleted_since = excluded.deleted_since, "
+                "issues_since = excluded.issues_since, horizon_date = excluded.horizon_date, "
+                "synced_at = excluded.synced_at",
+                (cloud_id, account_id, updated_since, deleted_since, issues_since, horizon_date, synced_at)
+            )
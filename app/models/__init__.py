@@ -1,5 +1,5 @@
 """Data models and schemas."""
 
-from app.models.worklog import WorklogRequest
+from app.models.worklog import SummaryFormat, WorklogRequest
 
-__all__ = ["WorklogRequest"]
+__all__ = ["SummaryFormat", "WorklogRequest"]
@@ -2,11 +2,26 @@
 
 from pydantic import BaseModel, Field, field_validator
 from datetime import date
+from enum import Enum
 from typing import Optional
 
 from app.core.validators import validate_date_range
 
 
+class SummaryFormat(str, Enum):
+    """Response formats of the worklog summary API.
+
+    ``json`` returns days of issues of worklogs in one document.
+    ``normalized`` returns the same days referencing shared ``issues`` and
+    ``people`` maps instead of repeating them. ``ndjson`` streams one flat
+    worklog record per line, for consumers of long ranges.
+    """
+
+    JSON = "json"
+    NORMALIZED = "normalized"
+    NDJSON = "ndjson"
+
+
 class WorklogRequest(BaseModel):
     """Request model for worklog summary.
     
@@ -14,6 +29,7 @@ class WorklogRequest(BaseModel):
         accountId: Optional Jira account ID. If not provided, uses authenticated user's ID.
         startDate: Start date for worklog query (inclusive).
         endDate: End date for worklog query (inclusive).
+        timeoutSeconds: Optional time budget for fetching from Jira, capped by the server.
     """
     
     accountId: Optional[str] = Field(
@@ -26,6 +42,11 @@ class WorklogRequest(BaseModel):
     endDate: date = Field(
         description="End date for worklog query (inclusive)"
     )
+    timeoutSeconds: Optional[float] = Field(
+        default=None,
+        gt=0,
+        description="Time budget in seconds for fetching from Jira. Capped at the server's configured deadline."
+    )
     
     @field_validator("endDate")
     @classmethod
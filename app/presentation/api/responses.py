@@ -0,0 +1,24 @@
+"""JSON responses for summary payloads.
+
+Summaries are built from plain dicts, lists, strings and numbers, so they can
+be encoded directly instead of first being copied by FastAPI's
+``jsonable_encoder``.
+"""
+
+from typing import Any
+
+from fastapi.responses import JSONResponse
+
+from app.utils.serialization import dumps_json
+
+
+class SummaryJSONResponse(JSONResponse):
+    """``JSONResponse`` rendered with ``dumps_json``, on orjson when it is installed.
+
+    FastAPI passes a returned ``Response`` through unchanged, so endpoints
+    that return this class directly skip ``jsonable_encoder``. Content must
+    already be JSON-native.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return dumps_json(content)
@@ -0,0 +1,27 @@
+"""Operational metrics endpoints."""
+
+from fastapi import APIRouter, Depends
+
+from app.core.auth import get_auth_cache_stats
+from app.core.constants import API_TAGS, ROUTES
+from app.core.container import Container
+from app.core.dependencies import get_current_user, AuthenticatedUser
+from app.infrastructure.http_pool import get_transport_registry
+from app.infrastructure.rate_limiter import get_rate_limiter
+from app.infrastructure.concurrency import get_concurrency_limiter
+from app.infrastructure.circuit_breaker import get_circuit_breakers
+
+router = APIRouter(tags=[API_TAGS["METRICS"]])
+
+
+@router.get(ROUTES["API_METRICS"], description="Cache, connection pool, rate limiter, concurrency and circuit breaker statistics")
+def get_metrics(user: AuthenticatedUser = Depends(get_current_user)):
+    return {
+        "summaryCache": Container.get_summary_cache().stats(),
+        "summaryCoalescing": Container.get_async_summary_single_flight().stats(),
+        "authCache": get_auth_cache_stats(),
+        "httpPool": get_transport_registry().stats(),
+        "rateLimiter": get_rate_limiter().stats(),
+        "concurrency": get_concurrency_limiter().stats(),
+        "circuitBreakers": get_circuit_breakers().stats()
+    }
@@ -1,18 +1,27 @@
 """Worklog API endpoints."""
 
-from fastapi import APIRouter, Depends, Request
-from fastapi.responses import RedirectResponse
+from datetime import date
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Optional, Tuple
 
-from app.models.worklog import WorklogRequest
+from fastapi import APIRouter, Depends, Header, Query, Request, Response
+from fastapi.responses import RedirectResponse, StreamingResponse
+from starlette.concurrency import run_in_threadpool
+
+from app.models.worklog import SummaryFormat, WorklogRequest
 from app.core.dependencies import get_current_user, AuthenticatedUser
 from app.core.container import Container
 from app.core.error_handler import handle_exceptions
-from app.core.exceptions import AuthenticationError, ExternalServiceError, ServiceError
+from app.core.exceptions import AuthenticationError, BaseApplicationException, ExternalServiceError, ServiceError
 from app.core.session import get_refresh_token, set_access_token, set_refresh_token
 from app.core.auth import refresh_access_token
 from app.core.logging import get_logger
-from app.core.constants import API_TAGS
-from app.domain.interfaces import IWorklogService
+from app.core.config import SUMMARY_CACHE_TTL, SUMMARY_CACHE_STALE_WHILE_REVALIDATE
+from app.core.constants import API_TAGS, RECORD_TYPE_ERROR, SUMMARY_EVENT_ERROR
+from app.core.deadline import resolve_deadline
+from app.domain.interfaces import IAsyncWorklogService
+from app.domain.summary_formats import normalize_summary
+from app.presentation.api.responses import SummaryJSONResponse
+from app.utils.serialization import dumps_json
 
 logger = get_logger(__name__)
 
@@ -21,62 +30,410 @@ router = APIRouter(prefix="/api/v1/jira-worklogs", tags=[API_TAGS["WORKLOGS"]])
 
 def get_worklog_service(
     user: AuthenticatedUser = Depends(get_current_user)
-) -> IWorklogService:
+) -> IAsyncWorklogService:
     """Dependency to get worklog service for authenticated user."""
     if isinstance(user, RedirectResponse):
         raise AuthenticationError("Not authenticated")
-    return Container.get_worklog_service_for_user(user)
+    return Container.get_async_worklog_service_for_user(user)
+
+
+def get_worklog_request_from_query(
+    start_date: date = Query(alias="startDate", description="Start date for worklog query (inclusive)"),
+    end_date: date = Query(alias="endDate", description="End date for worklog query (inclusive)"),
+    account_id: Optional[str] = Query(
+        None,
+        alias="accountId",
+        description="Jira account ID. If not provided, uses authenticated user's ID."
+    ),
+    timeout_seconds: Optional[float] = Query(
+        None,
+        alias="timeoutSeconds",
+        gt=0,
+        description="Time budget in seconds for fetching from Jira. Capped at the server's configured deadline."
+    )
+) -> WorklogRequest:
+    """Dependency building a ``WorklogRequest`` from query parameters."""
+    return WorklogRequest(
+        accountId=account_id,
+        startDate=start_date,
+        endDate=end_date,
+        timeoutSeconds=timeout_seconds
+    )
+
+
+async def _fetch_summary(
+    service: IAsyncWorklogService,
+    envelope: bool,
+    response_format: SummaryFormat,
+    if_none_match: Optional[str] = None,
+    cacheable: bool = False,
+    **kwargs
+) -> Response:
+    """Fetch a summary as a response validated by its ``ETag``.
+
+    The summary's age is reported in the ``Age`` and ``X-Summary-Stale``
+    headers. A request whose ``If-None-Match`` already names the summary's
+    ETag gets ``304 Not Modified`` without a body. ``cacheable`` responses
+    also get a ``Cache-Control`` lifetime matching the server-side cache.
+    """
+    summary = await service.get_worklog_summary_envelope(allow_partial=envelope, **kwargs)
+    freshness = summary["freshness"]
+    etag = _summary_etag(summary["version"], envelope, response_format)
+    headers = {
+        "Age": str(int(freshness["ageSeconds"])),
+        "X-Summary-Stale": "true" if freshness["stale"] else "false",
+        "ETag": etag
+    }
+    if cacheable:
+        headers["Cache-Control"] = _summary_cache_control(summary)
+        headers["Vary"] = "Cookie"
+    if _etag_matches(if_none_match, etag):
+        return Response(status_code=304, headers=headers)
+
+    if response_format == SummaryFormat.NORMALIZED:
+        normalized = normalize_summary(summary["days"])
+        content = {**summary, **normalized} if envelope else normalized
+    else:
+        content = summary if envelope else summary["days"]
+    return SummaryJSONResponse(content, headers=headers)
+
+
+def _summary_etag(version: str, envelope: bool, response_format: SummaryFormat) -> str:
+    # Weak, since envelope bodies carry a freshness block that changes with age.
+    variant = f"{response_format.value}-envelope" if envelope else response_format.value
+    return f'W/"{version}-{variant}"'
+
+
+def _etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Weak comparison of ``etag`` against an ``If-None-Match`` header."""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    opaque_tag = etag[2:] if etag.startswith("W/") else etag
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if (candidate[2:] if candidate.startswith("W/") else candidate) == opaque_tag:
+            return True
+    return False
+
+
+def _summary_cache_control(summary: Dict[str, Any]) -> str:
+    """Let private caches keep a complete, fresh summary for as long as the server would.
+
+    A stale summary has already used the server's revalidation window, so
+    browsers must revalidate it rather than serve it stale again.
+    """
+    freshness = summary["freshness"]
+    if not summary["completeness"]["complete"] or freshness["stale"]:
+        return "private, no-cache"
+    max_age = max(0, int(SUMMARY_CACHE_TTL - freshness["ageSeconds"]))
+    cache_control = f"private, max-age={max_age}"
+    if SUMMARY_CACHE_STALE_WHILE_REVALIDATE > 0:
+        cache_control += f", stale-while-revalidate={int(SUMMARY_CACHE_STALE_WHILE_REVALIDATE)}"
+    return cache_control
+
+
+async def _summary_response(
+    http_request: Request,
+    request: WorklogRequest,
+    refresh: bool,
+    envelope: bool,
+    response_format: SummaryFormat,
+    request_timeout: Optional[float],
+    if_none_match: Optional[str],
+    service: IAsyncWorklogService,
+    user: AuthenticatedUser,
+    cacheable: bool
+) -> Response:
+    if isinstance(user, RedirectResponse):
+        raise AuthenticationError("Not authenticated")
+
+    summary_kwargs = {
+        "account_id": request.accountId or user.account_id,
+        "start_date": str(request.startDate),
+        "end_date": str(request.endDate),
+        "deadline": resolve_deadline(request.timeoutSeconds or request_timeout)
+    }
+
+    if response_format == SummaryFormat.NDJSON:
+        first, records = await _with_token_refresh(
+            http_request,
+            user,
+            service,
+            lambda s: _open_stream(s.stream_worklog_records(**summary_kwargs))
+        )
+        return StreamingResponse(
+            _stream_body(first, records, _format_record, _format_record_error),
+            media_type="application/x-ndjson",
+            headers={"X-Accel-Buffering": "no"}
+        )
+
+    return await _with_token_refresh(
+        http_request,
+        user,
+        service,
+        lambda s: _fetch_summary(
+            s,
+            envelope,
+            response_format,
+            if_none_match=if_none_match,
+            cacheable=cacheable,
+            refresh=refresh,
+            **summary_kwargs
+        )
+    )
 
 
-@router.post("/summary", description="Fetch worklog summary for authenticated user")
+@router.post(
+    "/summary",
+    description="Fetch worklog summary for authenticated user",
+    response_class=SummaryJSONResponse
+)
 @handle_exceptions
-def get_summary(
+async def get_summary(
     http_request: Request,
     request: WorklogRequest,
-    service: IWorklogService = Depends(get_worklog_service),
+    refresh: bool = Query(False, description="Bypass the summary cache and fetch fresh data from Jira"),
+    envelope: bool = Query(
+        False,
+        description=(
+            "Return {days, completeness, version, freshness}; issues not fetched before the deadline "
+            "are listed instead of failing the request"
+        )
+    ),
+    response_format: SummaryFormat = Query(
+        SummaryFormat.JSON,
+        alias="format",
+        description=(
+            "json: one summary document; normalized: days referencing shared issues and people "
+            "maps; ndjson: one flat worklog record per line, streamed as worklogs are fetched "
+            "and ending with a completeness record"
+        )
+    ),
+    request_timeout: Optional[float] = Header(
+        None,
+        alias="X-Request-Timeout",
+        description="Time budget in seconds for fetching from Jira; capped at REQUEST_DEADLINE_SECONDS"
+    ),
+    if_none_match: Optional[str] = Header(
+        None,
+        alias="If-None-Match",
+        description="ETag of a summary the client already has; answered with 304 if it is unchanged"
+    ),
+    service: IAsyncWorklogService = Depends(get_worklog_service),
     user: AuthenticatedUser = Depends(get_current_user)
 ):
     """Fetch and summarize Jira work logs for a user within a date range."""
+    return await _summary_response(
+        http_request,
+        request,
+        refresh,
+        envelope,
+        response_format,
+        request_timeout,
+        if_none_match,
+        service,
+        user,
+        cacheable=False
+    )
+
+
+@router.get(
+    "/summary",
+    description="Fetch worklog summary for authenticated user; cacheable by browsers and proxies",
+    response_class=SummaryJSONResponse
+)
+@handle_exceptions
+async def get_summary_by_query(
+    http_request: Request,
+    request: WorklogRequest = Depends(get_worklog_request_from_query),
+    refresh: bool = Query(False, description="Bypass the summary cache and fetch fresh data from Jira"),
+    envelope: bool = Query(
+        False,
+        description=(
+            "Return {days, completeness, version, freshness}; issues not fetched before the deadline "
+            "are listed instead of failing the request"
+        )
+    ),
+    response_format: SummaryFormat = Query(
+        SummaryFormat.JSON,
+        alias="format",
+        description=(
+            "json: one summary document; normalized: days referencing shared issues and people "
+            "maps; ndjson: one flat worklog record per line, streamed as worklogs are fetched "
+            "and ending with a completeness record"
+        )
+    ),
+    request_timeout: Optional[float] = Header(
+        None,
+        alias="X-Request-Timeout",
+        description="Time budget in seconds for fetching from Jira; capped at REQUEST_DEADLINE_SECONDS"
+    ),
+    if_none_match: Optional[str] = Header(
+        None,
+        alias="If-None-Match",
+        description="ETag of a summary the client already has; answered with 304 if it is unchanged"
+    ),
+    service: IAsyncWorklogService = Depends(get_worklog_service),
+    user: AuthenticatedUser = Depends(get_current_user)
+):
+    """Same as ``POST /summary``, with the request fields as query parameters.
+
+    Responses carry ``Cache-Control: private`` with a lifetime matching the
+    server-side summary cache, so browsers can reuse them and revalidate with
+    ``If-None-Match``.
+    """
+    return await _summary_response(
+        http_request,
+        request,
+        refresh,
+        envelope,
+        response_format,
+        request_timeout,
+        if_none_match,
+        service,
+        user,
+        cacheable=True
+    )
+
+
+@router.post(
+    "/summary/stream",
+    description="Stream the worklog summary as server-sent events while issues are fetched",
+    response_class=StreamingResponse
+)
+@handle_exceptions
+async def stream_summary(
+    http_request: Request,
+    request: WorklogRequest,
+    refresh: bool = Query(False, description="Bypass the summary cache and fetch fresh data from Jira"),
+    request_timeout: Optional[float] = Header(
+        None,
+        alias="X-Request-Timeout",
+        description="Time budget in seconds for fetching from Jira; capped at REQUEST_DEADLINE_SECONDS"
+    ),
+    service: IAsyncWorklogService = Depends(get_worklog_service),
+    user: AuthenticatedUser = Depends(get_current_user)
+):
+    """Stream a worklog summary as ``text/event-stream``.
+
+    Each ``fragment`` event carries ``{"days": [...]}`` for the issues fetched
+    so far, with every day holding only those issues; the final ``totals``
+    event carries per-day and overall totals plus the ``completeness`` and
+    ``freshness`` blocks. Failures before the first event are returned as
+    regular error responses; later ones end the stream with an ``error`` event.
+    """
     if isinstance(user, RedirectResponse):
         raise AuthenticationError("Not authenticated")
 
-    account_id = request.accountId or user.account_id
-    
+    stream_kwargs = {
+        "account_id": request.accountId or user.account_id,
+        "start_date": str(request.startDate),
+        "end_date": str(request.endDate),
+        "refresh": refresh,
+        "deadline": resolve_deadline(request.timeoutSeconds or request_timeout)
+    }
+
+    first, events = await _with_token_refresh(
+        http_request,
+        user,
+        service,
+        lambda s: _open_stream(s.stream_worklog_summary(**stream_kwargs))
+    )
+    return StreamingResponse(
+        _stream_body(first, events, _format_event, _format_event_error),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+
+async def _open_stream(items: AsyncIterator[Any]) -> Tuple[Any, AsyncIterator[Any]]:
+    """Wait for the first item of a stream, so failures before it become HTTP errors."""
+    return await items.__anext__(), items
+
+
+async def _stream_body(
+    first: Any,
+    items: AsyncIterator[Any],
+    encode: Callable[[Any], bytes],
+    encode_error: Callable[[Dict[str, Any]], bytes]
+) -> AsyncIterator[bytes]:
+    """Encode a stream's items, ending it with an encoded error if producing them fails."""
     try:
-        return service.get_worklog_summary(
-            account_id=account_id,
-            start_date=str(request.startDate),
-            end_date=str(request.endDate)
+        yield encode(first)
+        async for item in items:
+            yield encode(item)
+    except BaseApplicationException as e:
+        logger.error(
+            "Application error while streaming summary",
+            extra={"error_code": e.error_code, "status_code": e.status_code, "details": e.details}
         )
+        yield encode_error({"error": e.error_code, "message": e.message, "details": e.details})
+    except Exception as e:
+        logger.error("Unexpected error while streaming summary", exc_info=e)
+        yield encode_error({"error": "INTERNAL_ERROR", "message": "An unexpected error occurred"})
+    finally:
+        await items.aclose()
+
+
+def _format_event(event: Tuple[str, Dict[str, Any]]) -> bytes:
+    name, payload = event
+    return b"event: " + name.encode() + b"\ndata: " + dumps_json(payload) + b"\n\n"
+
+
+def _format_event_error(error: Dict[str, Any]) -> bytes:
+    return _format_event((SUMMARY_EVENT_ERROR, error))
+
+
+def _format_record(record: Tuple[str, Dict[str, Any]]) -> bytes:
+    record_type, payload = record
+    return dumps_json({"type": record_type, **payload}) + b"\n"
+
+
+def _format_record_error(error: Dict[str, Any]) -> bytes:
+    return _format_record((RECORD_TYPE_ERROR, error))
+
+
+async def _with_token_refresh(
+    http_request: Request,
+    user: AuthenticatedUser,
+    service: IAsyncWorklogService,
+    call: Callable[[IAsyncWorklogService], Awaitable[Any]]
+) -> Any:
+    """Run ``call(service)``, retrying once with a refreshed access token if Jira rejects the current one."""
+    try:
+        return await call(service)
     except (ExternalServiceError, ServiceError) as e:
-        if getattr(e, 'status_code', None) == 401:
-            refresh_token = get_refresh_token(http_request)
-            if not refresh_token:
-                raise AuthenticationError("Session expired. Please login again.")
-            
-            try:
-                new_tokens = refresh_access_token(refresh_token)
-                set_access_token(http_request, new_tokens["access_token"])
-                if "refresh_token" in new_tokens:
-                    set_refresh_token(http_request, new_tokens["refresh_token"])
-                
-                updated_user = AuthenticatedUser(
-                    account_id=user.account_id,
-                    display_name=user.display_name,
-                    email=user.email,
-                    access_token=new_tokens["access_token"],
-                    cloud_id=user.cloud_id
-                )
-                
-                service = Container.get_worklog_service_for_user(updated_user)
-                logger.info("Token refreshed and request retried successfully")
-                return service.get_worklog_summary(
-                    account_id=account_id,
-                    start_date=str(request.startDate),
-                    end_date=str(request.endDate)
-                )
-            except Exception as refresh_error:
-                logger.error("Token refresh failed", exc_info=refresh_error)
-                raise AuthenticationError("Session expired. Please login again.")
-        else:
+        if getattr(e, 'status_code', None) != 401:
             raise
+    result = await call(await _refreshed_service(http_request, user))
+    logger.info("Token refreshed and request retried successfully")
+    return result
+
+
+async def _refreshed_service(http_request: Request, user: AuthenticatedUser) -> IAsyncWorklogService:
+    """Refresh the user's access token and build a worklog service with the new one."""
+    refresh_token = get_refresh_token(http_request)
+    if not refresh_token:
+        raise AuthenticationError("Session expired. Please login again.")
+
+    try:
+        new_tokens = await run_in_threadpool(refresh_access_token, refresh_token)
+    except Exception as refresh_error:
+        logger.error("Token refresh failed", exc_info=refresh_error)
+        raise AuthenticationError("Session expired. Please login again.")
+
+    set_access_token(http_request, new_tokens["access_token"])
+    if "refresh_token" in new_tokens:
+        set_refresh_token(http_request, new_tokens["refresh_token"])
+
+    updated_user = AuthenticatedUser(
+        account_id=user.account_id,
+        display_name=user.display_name,
+        email=user.email,
+        access_token=new_tokens["access_token"],
+        cloud_id=user.cloud_id,
+        time_zone=user.time_zone
+    )
+    return Container.get_async_worklog_service_for_user(updated_user)
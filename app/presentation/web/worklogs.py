@@ -2,9 +2,10 @@
 
 from pathlib import Path
 from datetime import date, timedelta
-from fastapi import APIRouter, Request, Form, Depends
+from fastapi import APIRouter, Request, Form, Depends, Query
 from fastapi.responses import RedirectResponse
 from fastapi.templating import Jinja2Templates
+from starlette.concurrency import run_in_threadpool
 from typing import Union, Optional
 
 from app.core.dependencies import get_current_user, AuthenticatedUser
@@ -19,8 +20,10 @@ from app.core.container import Container
 from app.core.exceptions import AuthenticationError, ExternalServiceError, ServiceError
 from app.core.validators import validate_date_range
 from app.core.constants import API_TAGS, ROUTES
+from app.core.deadline import resolve_deadline
 from app.core.logging import get_logger
-from app.domain.interfaces import IWorklogService
+from app.domain.interfaces import IAsyncWorklogService
+from app.domain.summary_formats import normalize_summary
 
 logger = get_logger(__name__)
 
@@ -45,11 +48,11 @@ def _build_user_context(user: AuthenticatedUser, request: Request) -> dict:
 
 def get_worklog_service(
     user: AuthenticatedUser = Depends(get_current_user)
-) -> IWorklogService:
+) -> IAsyncWorklogService:
     """Dependency to get worklog service for authenticated user."""
     if isinstance(user, RedirectResponse):
         raise AuthenticationError("Not authenticated")
-    return Container.get_worklog_service_for_user(user)
+    return Container.get_async_worklog_service_for_user(user)
 
 
 def _get_current_week_dates():
@@ -62,30 +65,34 @@ def _get_current_week_dates():
 
 
 @router.get(ROUTES["UI_WORKLOGS"], tags=[API_TAGS["UI"]])
-def worklog_form(
+async def worklog_form(
     request: Request,
+    refresh: bool = Query(False),
     user: Union[AuthenticatedUser, RedirectResponse] = Depends(get_current_user)
 ):
     if isinstance(user, RedirectResponse):
         return user
     
     start_date, end_date = _get_current_week_dates()
-    data = None
+    envelope = None
     
-    service = Container.get_worklog_service_for_user(user)
+    service = Container.get_async_worklog_service_for_user(user)
+    deadline = resolve_deadline()
     
     try:
-        data = service.get_worklog_summary(
+        envelope = await service.get_worklog_summary_envelope(
             account_id=user.account_id,
             start_date=start_date,
-            end_date=end_date
+            end_date=end_date,
+            refresh=refresh,
+            deadline=deadline
         )
     except (ExternalServiceError, ServiceError) as e:
         if getattr(e, 'status_code', None) == 401:
             refresh_token = get_refresh_token(request)
             if refresh_token:
                 try:
-                    new_tokens = refresh_access_token(refresh_token)
+                    new_tokens = await run_in_threadpool(refresh_access_token, refresh_token)
                     set_access_token(request, new_tokens["access_token"])
                     if "refresh_token" in new_tokens:
                         set_refresh_token(request, new_tokens["refresh_token"])
@@ -95,14 +102,17 @@ def worklog_form(
                         display_name=user.display_name,
                         email=user.email,
                         access_token=new_tokens["access_token"],
-                        cloud_id=user.cloud_id
+                        cloud_id=user.cloud_id,
+                        time_zone=user.time_zone
                     )
                     
-                    service = Container.get_worklog_service_for_user(updated_user)
-                    data = service.get_worklog_summary(
+                    service = Container.get_async_worklog_service_for_user(updated_user)
+                    envelope = await service.get_worklog_summary_envelope(
                         account_id=user.account_id,
                         start_date=start_date,
-                        end_date=end_date
+                        end_date=end_date,
+                        refresh=refresh,
+                        deadline=deadline
                     )
                     logger.info("Token refreshed and current week data loaded")
                 except Exception as refresh_error:
@@ -114,7 +124,10 @@ def worklog_form(
         "worklog_summary.html",
         {
             "request": request,
-            "data": data,
+            "data": envelope["days"] if envelope else None,
+            "serverData": normalize_summary(envelope["days"]) if envelope else None,
+            "completeness": envelope["completeness"] if envelope else None,
+            "freshness": envelope["freshness"] if envelope else None,
             "startDate": start_date,
             "endDate": end_date,
             "user": _build_user_context(user, request)
@@ -123,10 +136,11 @@ def worklog_form(
 
 
 @router.post(ROUTES["UI_WORKLOGS"], tags=[API_TAGS["UI"]])
-def render_worklog_summary(
+async def render_worklog_summary(
     request: Request,
     startDate: str = Form(...),
     endDate: str = Form(...),
+    refresh: bool = Query(False),
     user: Union[AuthenticatedUser, RedirectResponse] = Depends(get_current_user)
 ):
     if isinstance(user, RedirectResponse):
@@ -134,13 +148,16 @@ def render_worklog_summary(
     
     validate_date_range(startDate, endDate)
 
-    service = Container.get_worklog_service_for_user(user)
+    service = Container.get_async_worklog_service_for_user(user)
+    deadline = resolve_deadline()
     
     try:
-        data = service.get_worklog_summary(
+        envelope = await service.get_worklog_summary_envelope(
             account_id=user.account_id,
             start_date=startDate,
-            end_date=endDate
+            end_date=endDate,
+            refresh=refresh,
+            deadline=deadline
         )
     except (ExternalServiceError, ServiceError) as e:
         if getattr(e, 'status_code', None) == 401:
@@ -149,7 +166,7 @@ def render_worklog_summary(
                 raise AuthenticationError("Session expired. Please login again.")
             
             try:
-                new_tokens = refresh_access_token(refresh_token)
+                new_tokens = await run_in_threadpool(refresh_access_token, refresh_token)
                 set_access_token(request, new_tokens["access_token"])
                 if "refresh_token" in new_tokens:
                     set_refresh_token(request, new_tokens["refresh_token"])
@@ -159,14 +176,17 @@ def render_worklog_summary(
                     display_name=user.display_name,
                     email=user.email,
                     access_token=new_tokens["access_token"],
-                    cloud_id=user.cloud_id
+                    cloud_id=user.cloud_id,
+                    time_zone=user.time_zone
                 )
                 
-                service = Container.get_worklog_service_for_user(updated_user)
-                data = service.get_worklog_summary(
+                service = Container.get_async_worklog_service_for_user(updated_user)
+                envelope = await service.get_worklog_summary_envelope(
                     account_id=user.account_id,
                     start_date=startDate,
-                    end_date=endDate
+                    end_date=endDate,
+                    refresh=refresh,
+                    deadline=deadline
                 )
                 logger.info("Token refreshed and request retried successfully")
             except Exception as refresh_error:
@@ -179,7 +199,10 @@ def render_worklog_summary(
         "worklog_summary.html",
         {
             "request": request,
-            "data": data,
+            "data": envelope["days"] if envelope else None,
+            "serverData": normalize_summary(envelope["days"]) if envelope else None,
+            "completeness": envelope["completeness"] if envelope else None,
+            "freshness": envelope["freshness"] if envelope else None,
             "accountId": user.account_id,
             "startDate": startDate,
             "endDate": endDate,
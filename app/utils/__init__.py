@@ -1,5 +1,14 @@
 """Utility functions and helpers."""
 
 from app.utils.helpers import extract_comment, format_seconds
+from app.utils.serialization import dumps_json
+from app.utils.timestamps import TimestampFormatter, format_display_date, parse_jira_timestamp
 
-__all__ = ["extract_comment", "format_seconds"]
+__all__ = [
+    "extract_comment",
+    "format_seconds",
+    "dumps_json",
+    "TimestampFormatter",
+    "format_display_date",
+    "parse_jira_timestamp"
+]
@@ -0,0 +1,27 @@
+"""Compact JSON encoding, with orjson when it is installed."""
+
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+
+def dumps_json(content: Any, sort_keys: bool = False) -> bytes:
+    """Encode JSON-native ``content`` as compact UTF-8 JSON, with object keys sorted if ``sort_keys``."""
+    if orjson is not None:
+        return orjson.dumps(content, option=orjson.OPT_SORT_KEYS if sort_keys else None)
+    return json.dumps(
+        content,
+        ensure_ascii=False,
+        allow_nan=False,
+        separators=(",", ":"),
+        sort_keys=sort_keys
+    ).encode("utf-8")
+
+
+def json_size(content: Any) -> int:
+    """Return the length in bytes of ``content`` encoded by ``dumps_json``."""
+    return len(dumps_json(content))
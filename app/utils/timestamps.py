@@ -0,0 +1,113 @@
+"""Parsing, time zone conversion and display formatting for Jira worklog timestamps."""
+
+from datetime import date, datetime, tzinfo
+from functools import lru_cache
+from typing import Optional, Tuple
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+
+from app.core.constants import DATE_FORMAT_DISPLAY
+
+# Jira's fixed timestamp shape: ``YYYY-MM-DDTHH:MM:SS.mmm+ZZZZ``.
+JIRA_TIMESTAMP_LENGTH = 28
+
+
+def _is_jira_timestamp(value: str) -> bool:
+    return (
+        len(value) == JIRA_TIMESTAMP_LENGTH
+        and value[10] == "T"
+        and value[19] == "."
+        and value[23] in "+-"
+    )
+
+
+def parse_jira_timestamp(value: str) -> Optional[datetime]:
+    """Parse a Jira timestamp into an aware datetime.
+
+    ``datetime.fromisoformat`` reads Jira's format directly on Python 3.11+.
+    Older versions only accept ``+HH:MM`` offsets, so the offset is rewritten
+    for them; a trailing ``Z`` is accepted as UTC.
+
+    Args:
+        value: Timestamp as returned by Jira, e.g. ``2026-01-15T09:30:00.000+0530``.
+
+    Returns:
+        The parsed datetime, or ``None`` if ``value`` is not a valid timestamp.
+    """
+    try:
+        return datetime.fromisoformat(value)
+    except ValueError:
+        pass
+    if _is_jira_timestamp(value):
+        value = f"{value[:26]}:{value[26:]}"
+    try:
+        return datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except ValueError:
+        return None
+
+
+@lru_cache(maxsize=128)
+def resolve_time_zone(name: Optional[str]) -> Optional[tzinfo]:
+    """Look up an IANA time zone such as ``Europe/Berlin``.
+
+    Returns:
+        The zone, or ``None`` when ``name`` is empty or not a known zone.
+    """
+    if not name:
+        return None
+    try:
+        return ZoneInfo(name)
+    except (ZoneInfoNotFoundError, ValueError):
+        return None
+
+
+@lru_cache(maxsize=4096)
+def format_display_date(work_date: str) -> str:
+    """Format a ``YYYY-MM-DD`` date for display, e.g. ``15-01-2026``.
+
+    Results are cached, since a summary repeats the same few dates for every
+    worklog on them.
+    """
+    return date.fromisoformat(work_date).strftime(DATE_FORMAT_DISPLAY)
+
+
+class TimestampFormatter:
+    """Buckets and formats Jira timestamps in one user's time zone.
+
+    Without a time zone, or with one that is not known, timestamps keep the
+    wall-clock time of the offset Jira returned them in, and Jira-format
+    values are sliced without being parsed.
+    """
+
+    def __init__(self, time_zone: Optional[str] = None):
+        self._tz = resolve_time_zone(time_zone)
+
+    @property
+    def time_zone(self) -> Optional[tzinfo]:
+        return self._tz
+
+    def local_parts(self, value: str) -> Optional[Tuple[str, str]]:
+        """Split a timestamp into its local ``YYYY-MM-DD`` date and ``HH:MM`` time.
+
+        Returns:
+            The date and time, or ``None`` if ``value`` is not a valid timestamp.
+        """
+        if self._tz is None and _is_jira_timestamp(value):
+            return value[:10], value[11:16]
+        parsed = parse_jira_timestamp(value)
+        if parsed is None:
+            return None
+        if self._tz is not None and parsed.tzinfo is not None:
+            parsed = parsed.astimezone(self._tz)
+        return parsed.date().isoformat(), parsed.time().isoformat("minutes")
+
+    def work_date(self, started: str) -> str:
+        """Return the local ``YYYY-MM-DD`` date a worklog counts towards."""
+        parts = self.local_parts(started)
+        return parts[0] if parts else started[:10]
+
+    def display_datetime(self, value: str) -> str:
+        """Format a timestamp as local ``DD-MM-YYYY HH:MM``, or return it truncated if it cannot be parsed."""
+        parts = self.local_parts(value)
+        if parts is None:
+            return value[:16]
+        return f"{format_display_date(parts[0])} {parts[1]}"
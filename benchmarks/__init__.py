@@ -0,0 +1,15 @@
+"""Micro-benchmarks for the worklog summary hot paths.
+
+Run them from the repository root as modules, e.g.
+``python -m benchmarks.aggregation``. They use synthetic Jira payloads and
+make no network calls.
+"""
+
+import os
+
+# app.core.config refuses to import without Jira settings; benchmarks never talk to Jira.
+for _name in ("JIRA_DOMAIN", "JIRA_OAUTH_CLIENT_ID", "JIRA_OAUTH_CLIENT_SECRET"):
+    os.environ.setdefault(_name, "benchmark")
+
+# Load the core package first, as app.main does; app.domain and app.core import each other.
+import app.core  # noqa: E402,F401
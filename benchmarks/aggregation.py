@@ -0,0 +1,194 @@
+"""Aggregation benchmark: slotted records vs. the previous nested-dict collector.
+
+Usage: ``python -m benchmarks.aggregation [--issues 500] [--worklogs-per-issue 24]``
+
+Reports wall time for collecting worklogs and formatting the summary, the
+number of memory blocks and bytes still held once collection finishes, and
+the peak traced memory across collection and formatting.
+"""
+
+import argparse
+import gc
+import time
+import tracemalloc
+from datetime import datetime
+from typing import Any, Callable, Dict, List
+
+import benchmarks  # noqa: F401  (sets placeholder Jira settings)
+from benchmarks.data import ACCOUNT_ID, make_issue_worklogs
+from app.domain.aggregation import WorklogAggregator
+from app.utils.helpers import extract_comment, format_seconds
+
+
+def dict_collect(daily_data, issue, worklogs, account_id, start_date, end_date):
+    """The nested-dict collector ``WorklogRepository`` used before switching to records."""
+    issue_key = issue["key"]
+    fields = issue["fields"]
+    reporter = fields.get("reporter", {})
+    assignee = fields.get("assignee", {})
+    issue_type = fields.get("issuetype", {})
+    status = fields.get("status", {})
+    priority = fields.get("priority", {})
+    original_estimate = fields.get("timeoriginalestimate")
+    reporter_info = {
+        "accountId": reporter.get("accountId") if reporter else None,
+        "displayName": reporter.get("displayName") if reporter else "Unknown"
+    }
+    assignee_info = {
+        "accountId": assignee.get("accountId") if assignee else None,
+        "displayName": assignee.get("displayName") if assignee else "Unassigned"
+    }
+    issue_type_info = {
+        "name": issue_type.get("name") if issue_type else "Unknown",
+        "iconUrl": issue_type.get("iconUrl") if issue_type else None
+    }
+    status_info = {
+        "name": status.get("name") if status else "Unknown",
+        "statusCategory": status.get("statusCategory", {}).get("name") if status else None
+    }
+    priority_info = {
+        "name": priority.get("name") if priority else "Unknown",
+        "iconUrl": priority.get("iconUrl") if priority else None
+    }
+
+    for wl in worklogs:
+        if wl["author"]["accountId"] != account_id:
+            continue
+        worklog_date = wl["started"][:10]
+        if not (start_date <= worklog_date <= end_date):
+            continue
+        formatted_date = datetime.strptime(worklog_date, "%Y-%m-%d").strftime("%d-%m-%Y")
+        daily_data.setdefault(worklog_date, {
+            "workDate": worklog_date,
+            "workDateFormatted": formatted_date,
+            "daySummary": {"totalTimeSpentSeconds": 0},
+            "issues": {}
+        })
+        day_entry = daily_data[worklog_date]
+        day_entry["issues"].setdefault(issue_key, {
+            "issueKey": issue_key,
+            "issueSummary": fields["summary"],
+            "reportedBy": reporter_info,
+            "assignee": assignee_info,
+            "issueType": issue_type_info,
+            "status": status_info,
+            "priority": priority_info,
+            "originalEstimate": original_estimate,
+            "originalEstimateFormatted": format_seconds(original_estimate) if original_estimate else None,
+            "worklogSummary": {"totalTimeSpentSeconds": 0},
+            "worklogs": []
+        })
+        issue_entry = day_entry["issues"][issue_key]
+        time_seconds = wl["timeSpentSeconds"]
+        worklog_author = wl.get("author", {})
+        worklog_author_info = {
+            "accountId": worklog_author.get("accountId"),
+            "displayName": worklog_author.get("displayName", "Unknown")
+        }
+        started_raw = wl.get("started", "")
+        started_time = ""
+        if len(started_raw) >= 19:
+            try:
+                started_time = datetime.fromisoformat(started_raw.replace("Z", "+00:00").split("+")[0]).strftime("%H:%M")
+            except ValueError:
+                started_time = started_raw[11:16] if len(started_raw) > 16 else ""
+        updated_raw = wl.get("updated", "")
+        updated_formatted = ""
+        if updated_raw:
+            try:
+                updated_formatted = datetime.fromisoformat(
+                    updated_raw.replace("Z", "+00:00").split("+")[0]
+                ).strftime("%d-%m-%Y %H:%M")
+            except ValueError:
+                updated_formatted = updated_raw[:16] if len(updated_raw) > 16 else updated_raw
+        issue_entry["worklogs"].append({
+            "worklogId": wl["id"],
+            "comment": extract_comment(wl.get("comment")),
+            "timeSpentSeconds": time_seconds,
+            "timeSpentFormatted": format_seconds(time_seconds),
+            "started": started_raw,
+            "startedDate": started_raw[:10] if started_raw else "",
+            "startedTime": started_time,
+            "updated": updated_raw,
+            "updatedFormatted": updated_formatted,
+            "author": worklog_author_info
+        })
+        issue_entry["worklogSummary"]["totalTimeSpentSeconds"] += time_seconds
+        day_entry["daySummary"]["totalTimeSpentSeconds"] += time_seconds
+
+
+def dict_format(daily_data):
+    result = []
+    for day in sorted(daily_data):
+        day_entry = daily_data[day]
+        issues_list = []
+        for issue in day_entry["issues"].values():
+            total_seconds = issue["worklogSummary"]["totalTimeSpentSeconds"]
+            issue["worklogSummary"]["totalTimeSpentFormatted"] = format_seconds(total_seconds)
+            issues_list.append(issue)
+        day_entry["daySummary"]["totalTimeSpentFormatted"] = format_seconds(day_entry["daySummary"]["totalTimeSpentSeconds"])
+        day_entry["issues"] = issues_list
+        result.append(day_entry)
+    return result
+
+
+def measure(name: str, collect: Callable, format_: Callable, pairs, start_date: str, end_date: str, rounds: int) -> List[Dict[str, Any]]:
+    timings = []
+    for _ in range(rounds):
+        daily_data = {}
+        started = time.perf_counter()
+        for issue, worklogs in pairs:
+            collect(daily_data, issue, worklogs, ACCOUNT_ID, start_date, end_date)
+        collected = time.perf_counter()
+        summary = format_(daily_data)
+        finished = time.perf_counter()
+        timings.append((collected - started, finished - collected))
+        del daily_data, summary
+
+    gc.collect()
+    tracemalloc.start()
+    baseline_blocks = sum(stat.count for stat in tracemalloc.take_snapshot().statistics("filename"))
+    daily_data = {}
+    for issue, worklogs in pairs:
+        collect(daily_data, issue, worklogs, ACCOUNT_ID, start_date, end_date)
+    held_bytes = tracemalloc.get_traced_memory()[0]
+    held_blocks = sum(stat.count for stat in tracemalloc.take_snapshot().statistics("filename")) - baseline_blocks
+    summary = format_(daily_data)
+    peak_bytes = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    collect_time, format_time = min(timings, key=sum)
+    print(
+        f"{name:<8} collect {collect_time * 1000:7.1f} ms  format {format_time * 1000:7.1f} ms  "
+        f"held after collect {held_blocks:>8,} blocks / {held_bytes / 1e6:6.2f} MB  "
+        f"peak {peak_bytes / 1e6:6.2f} MB"
+    )
+    return summary
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--issues", type=int, default=500)
+    parser.add_argument("--worklogs-per-issue", type=int, default=24)
+    parser.add_argument("--rounds", type=int, default=5)
+    args = parser.parse_args()
+
+    pairs, start_date, end_date = make_issue_worklogs(args.issues, args.worklogs_per_issue)
+    print(f"{args.issues * args.worklogs_per_issue:,} worklogs on {args.issues:,} issues, {start_date}..{end_date}")
+
+    aggregator = WorklogAggregator()
+    dicts = measure("dicts", dict_collect, dict_format, pairs, start_date, end_date, args.rounds)
+    records = measure(
+        "records",
+        aggregator.collect_worklogs,
+        aggregator.format_response,
+        pairs,
+        start_date,
+        end_date,
+        args.rounds
+    )
+    assert records == dicts, "record-based summary differs from the dict-based one"
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+"""Synthetic Jira payloads shaped like search and worklog API responses."""
+
+import random
+from datetime import date, timedelta
+from typing import Any, Dict, List, Tuple
+
+ACCOUNT_ID = "557058:benchmark-user"
+START_DATE = date(2026, 1, 1)
+
+
+def jira_timestamp(day: date, minute_of_day: int) -> str:
+    return f"{day.isoformat()}T{minute_of_day // 60:02d}:{minute_of_day % 60:02d}:00.000+0000"
+
+
+def make_issue_worklogs(
+    issues: int = 500,
+    worklogs_per_issue: int = 24,
+    days: int = 90,
+    seed: int = 7
+) -> Tuple[List[Tuple[Dict[str, Any], List[Dict[str, Any]]]], str, str]:
+    """Return ``(pairs, start_date, end_date)`` with ``issues * worklogs_per_issue`` worklogs by ``ACCOUNT_ID``."""
+    rng = random.Random(seed)
+    people = [
+        {"accountId": f"557058:person-{i}", "displayName": f"Person {i}"}
+        for i in range(20)
+    ]
+    author = {"accountId": ACCOUNT_ID, "displayName": "Benchmark User"}
+    pairs = []
+    for n in range(issues):
+        issue = {
+            "id": str(10000 + n),
+            "key": f"PROJ-{n}",
+            "fields": {
+                "summary": f"Implement reporting improvement number {n} for the quarterly review",
+                "reporter": rng.choice(people),
+                "assignee": rng.choice(people + [None]),
+                "issuetype": {
+                    "name": "Story",
+                    "iconUrl": "https://benchmark.atlassian.net/rest/api/2/universal_avatar/view/type/issuetype/avatar/10315"
+                },
+                "status": {"name": "In Progress", "statusCategory": {"name": "In Progress"}},
+                "priority": {
+                    "name": "Medium",
+                    "iconUrl": "https://benchmark.atlassian.net/images/icons/priorities/medium.svg"
+                },
+                "timeoriginalestimate": 28800
+            }
+        }
+        worklogs = []
+        for i in range(worklogs_per_issue):
+            day = START_DATE + timedelta(days=rng.randrange(days))
+            worklogs.append({
+                "id": f"{n}{i:04d}",
+                "issueId": issue["id"],
+                "author": author,
+                "started": jira_timestamp(day, rng.randrange(8 * 60, 18 * 60)),
+                "updated": jira_timestamp(day, 18 * 60 + 30),
+                "timeSpentSeconds": rng.choice([900, 1800, 3600, 5400]),
+                "comment": {
+                    "type": "doc",
+                    "content": [{"type": "paragraph", "content": [{"type": "text", "text": f"Worked on part {i}"}]}]
+                }
+            })
+        pairs.append((issue, worklogs))
+    end_date = START_DATE + timedelta(days=days - 1)
+    return pairs, START_DATE.isoformat(), end_date.isoformat()
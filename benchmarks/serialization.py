@@ -0,0 +1,93 @@
+"""Serialization benchmark: summary responses with and without ``jsonable_encoder``.
+
+Usage: ``python -m benchmarks.serialization [--worklogs 5000]``
+
+Renders the body of a summary response the way FastAPI did before
+``SummaryJSONResponse`` (``jsonable_encoder`` followed by ``JSONResponse``)
+and with ``SummaryJSONResponse`` on the standard library encoder and, when it
+is installed, on orjson. Reports the best time and throughput in MB/s of
+response body for the nested and normalized formats.
+"""
+
+import argparse
+import json
+import time
+from typing import Any, Callable, Dict
+
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+
+import benchmarks  # noqa: F401  (sets placeholder Jira settings)
+from benchmarks.data import ACCOUNT_ID, make_issue_worklogs
+from app.domain.aggregation import WorklogAggregator
+from app.domain.summary_formats import normalize_summary
+from app.presentation.api.responses import SummaryJSONResponse
+from app.utils import serialization
+
+
+def encoder_walk(content: Any) -> bytes:
+    return JSONResponse(jsonable_encoder(content)).body
+
+
+def summary_response(content: Any) -> bytes:
+    return SummaryJSONResponse(content).body
+
+
+def stdlib_summary_response(content: Any) -> bytes:
+    orjson, serialization.orjson = serialization.orjson, None
+    try:
+        return SummaryJSONResponse(content).body
+    finally:
+        serialization.orjson = orjson
+
+
+def measure(name: str, render: Callable[[Any], bytes], content: Any, rounds: int) -> bytes:
+    best = float("inf")
+    for _ in range(rounds):
+        started = time.perf_counter()
+        body = render(content)
+        best = min(best, time.perf_counter() - started)
+    print(f"  {name:<28} {best * 1000:7.1f} ms  {len(body) / best / 1e6:7.1f} MB/s  ({len(body) / 1e6:.2f} MB)")
+    return body
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--worklogs", type=int, default=5000)
+    parser.add_argument("--rounds", type=int, default=7)
+    args = parser.parse_args()
+
+    worklogs_per_issue = 20
+    pairs, start_date, end_date = make_issue_worklogs(
+        issues=max(1, args.worklogs // worklogs_per_issue),
+        worklogs_per_issue=worklogs_per_issue
+    )
+    aggregator = WorklogAggregator()
+    daily_data = {}
+    for issue, worklogs in pairs:
+        aggregator.collect_worklogs(daily_data, issue, worklogs, ACCOUNT_ID, start_date, end_date)
+    days = aggregator.format_response(daily_data)
+    payloads: Dict[str, Any] = {"json": days, "normalized": normalize_summary(days)}
+
+    renderers = [
+        ("jsonable_encoder + json", encoder_walk),
+        ("SummaryJSONResponse (json)", stdlib_summary_response)
+    ]
+    if serialization.orjson is not None:
+        renderers.append(("SummaryJSONResponse (orjson)", summary_response))
+    else:
+        print("orjson is not installed; skipping it")
+
+    print(f"{len(pairs) * worklogs_per_issue:,} worklogs")
+    for format_name, content in payloads.items():
+        print(f"format={format_name}")
+        expected = None
+        for name, render in renderers:
+            decoded = json.loads(measure(name, render, content, args.rounds))
+            if expected is None:
+                expected = decoded
+            assert decoded == expected, f"{name} encodes a different document"
+
+
+if __name__ == "__main__":
+    main()
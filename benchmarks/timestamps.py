@@ -0,0 +1,98 @@
+"""Timestamp benchmark: ``app.utils.timestamps`` vs. the previous per-worklog parsing.
+
+Usage: ``python -m benchmarks.timestamps [--worklogs 12000] [--time-zone Europe/Berlin]``
+
+Times bucketing and formatting every worklog's ``started``/``updated``
+timestamps: the work date and its display string, ``startedTime`` and
+``updatedFormatted``. The previous code ran ``strptime``/``strftime`` for the
+display date and ``fromisoformat`` after string surgery for both timestamps.
+"""
+
+import argparse
+import time
+from datetime import datetime
+from typing import Callable, List, Tuple
+
+import benchmarks  # noqa: F401  (sets placeholder Jira settings)
+from benchmarks.data import make_issue_worklogs
+from app.utils.timestamps import TimestampFormatter, format_display_date
+
+Formatted = Tuple[str, str, str, str]
+
+
+def previous(worklogs: List[dict]) -> List[Formatted]:
+    """The parsing ``WorklogRepository`` did per worklog before ``app.utils.timestamps``."""
+    result = []
+    for wl in worklogs:
+        started_raw = wl["started"]
+        worklog_date = started_raw[:10]
+        formatted_date = datetime.strptime(worklog_date, "%Y-%m-%d").strftime("%d-%m-%Y")
+        started_time = ""
+        if len(started_raw) >= 19:
+            try:
+                started_dt = datetime.fromisoformat(started_raw.replace("Z", "+00:00").split("+")[0])
+                started_time = started_dt.strftime("%H:%M")
+            except ValueError:
+                started_time = started_raw[11:16] if len(started_raw) > 16 else ""
+        updated_raw = wl.get("updated", "")
+        updated_formatted = ""
+        if updated_raw:
+            try:
+                updated_dt = datetime.fromisoformat(updated_raw.replace("Z", "+00:00").split("+")[0])
+                updated_formatted = updated_dt.strftime("%d-%m-%Y %H:%M")
+            except ValueError:
+                updated_formatted = updated_raw[:16] if len(updated_raw) > 16 else updated_raw
+        result.append((worklog_date, formatted_date, started_time, updated_formatted))
+    return result
+
+
+def with_formatter(timestamps: TimestampFormatter) -> Callable[[List[dict]], List[Formatted]]:
+    def run(worklogs: List[dict]) -> List[Formatted]:
+        result = []
+        for wl in worklogs:
+            started = wl["started"]
+            worklog_date, started_time = timestamps.local_parts(started) or (started[:10], started[11:16])
+            updated = wl.get("updated", "")
+            result.append((
+                worklog_date,
+                format_display_date(worklog_date),
+                started_time,
+                timestamps.display_datetime(updated) if updated else ""
+            ))
+        return result
+    return run
+
+
+def measure(name: str, run: Callable[[List[dict]], List[Formatted]], worklogs: List[dict], rounds: int) -> List[Formatted]:
+    best = float("inf")
+    for _ in range(rounds):
+        started = time.perf_counter()
+        result = run(worklogs)
+        best = min(best, time.perf_counter() - started)
+    print(f"{name:<24} {best * 1000:7.1f} ms  {best / len(worklogs) * 1e9:6.0f} ns/worklog")
+    return result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--worklogs", type=int, default=12000)
+    parser.add_argument("--time-zone", default="Europe/Berlin")
+    parser.add_argument("--rounds", type=int, default=7)
+    args = parser.parse_args()
+
+    pairs, _, _ = make_issue_worklogs(issues=max(1, args.worklogs // 24))
+    worklogs = [wl for _, issue_worklogs in pairs for wl in issue_worklogs]
+    print(f"{len(worklogs):,} worklogs")
+
+    baseline = measure("previous", previous, worklogs, args.rounds)
+    formatted = measure("formatter", with_formatter(TimestampFormatter()), worklogs, args.rounds)
+    assert formatted == baseline, "formatter output differs from the previous parsing"
+
+    converted = TimestampFormatter(args.time_zone)
+    if converted.time_zone is None:
+        parser.error(f"unknown time zone {args.time_zone!r}")
+    measure(f"formatter ({args.time_zone})", with_formatter(converted), worklogs, args.rounds)
+
+
+if __name__ == "__main__":
+    main()
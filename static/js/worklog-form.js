@@ -13,6 +13,7 @@ class WorklogForm {
         this.flatpickr = null;
         this.currentView = this.getStoredView() || 'card';
         this.currentData = null;
+        this.renderPending = false;
         this.init();
     }
     
@@ -78,7 +79,7 @@ class WorklogForm {
         
         if (serverDataScript) {
             try {
-                const data = JSON.parse(serverDataScript.textContent);
+                const data = this.expandSummary(JSON.parse(serverDataScript.textContent));
                 this.currentData = data;
                 
                 if (this.currentView === 'table') {
@@ -102,6 +103,30 @@ class WorklogForm {
         }
     }
     
+    expandSummary(payload) {
+        // Rebuild the nested day → issue → worklog shape from a format=normalized payload.
+        const people = payload.people || {};
+        const person = (accountId, fallback) => ({
+            accountId: accountId,
+            displayName: (accountId && people[accountId]?.displayName) || fallback
+        });
+        
+        return payload.days.map(day => ({
+            ...day,
+            issues: day.issues.map(ref => {
+                const issue = payload.issues[ref.issueKey];
+                return {
+                    ...issue,
+                    issueKey: ref.issueKey,
+                    reportedBy: person(issue.reportedBy, 'Unknown'),
+                    assignee: person(issue.assignee, 'Unassigned'),
+                    worklogSummary: ref.worklogSummary,
+                    worklogs: ref.worklogs.map(wl => ({ ...wl, author: person(wl.author, 'Unknown') }))
+                };
+            })
+        }));
+    }
+    
     initializeDateRangePicker() {
         const existingStart = this.startDateInput.value;
         const existingEnd = this.endDateInput.value;
@@ -302,10 +327,12 @@ class WorklogForm {
         if (loadingIndicator) loadingIndicator.classList.remove('hidden');
         if (loadingIndicator) loadingIndicator.classList.add('flex');
         if (errorContainer) errorContainer.style.display = 'none';
+        this.renderCompleteness(null);
+        this.renderFreshness(null);
         if (resultsContainer) resultsContainer.innerHTML = '';
         
         try {
-            const response = await fetch('/api/v1/jira-worklogs/summary', {
+            const response = await fetch('/api/v1/jira-worklogs/summary/stream', {
                 method: 'POST',
                 headers: {
                     'Content-Type': 'application/json',
@@ -321,9 +348,7 @@ class WorklogForm {
                 throw new Error(errorData.message || `HTTP error! status: ${response.status}`);
             }
             
-            const data = await response.json();
-            this.currentData = data;
-            this.renderResults(data);
+            await this.readSummaryStream(response, loadingIndicator);
         } catch (error) {
             console.error('Error fetching worklogs:', error);
             this.showError(error.message || 'Failed to fetch worklogs. Please try again.');
@@ -340,6 +365,103 @@ class WorklogForm {
         }
     }
     
+    async readSummaryStream(response, loadingIndicator) {
+        const reader = response.body.getReader();
+        const decoder = new TextDecoder();
+        const days = new Map();
+        let buffer = '';
+        this.currentData = [];
+        
+        while (true) {
+            const { value, done } = await reader.read();
+            if (done) break;
+            buffer += decoder.decode(value, { stream: true });
+            
+            let boundary;
+            while ((boundary = buffer.indexOf('\n\n')) !== -1) {
+                const event = this.parseStreamEvent(buffer.slice(0, boundary));
+                buffer = buffer.slice(boundary + 2);
+                if (!event) continue;
+                
+                if (event.type === 'fragment') {
+                    this.mergeFragment(days, event.data.days);
+                    if (days.size > 0 && loadingIndicator) {
+                        loadingIndicator.classList.add('hidden');
+                        loadingIndicator.classList.remove('flex');
+                    }
+                    this.scheduleRender(days);
+                } else if (event.type === 'totals') {
+                    for (const total of event.data.days) {
+                        const day = days.get(total.workDate);
+                        if (day) day.daySummary = total.daySummary;
+                    }
+                    this.currentData = this.sortedDays(days);
+                    this.renderCompleteness(event.data.completeness);
+                    this.renderFreshness(event.data.freshness);
+                    this.renderResults(this.currentData);
+                    return;
+                } else if (event.type === 'error') {
+                    throw new Error(event.data.message || 'Failed to fetch worklogs. Please try again.');
+                }
+            }
+        }
+        throw new Error('The summary stream ended before all worklogs were loaded.');
+    }
+    
+    parseStreamEvent(block) {
+        let type = 'message';
+        const dataLines = [];
+        for (const line of block.split('\n')) {
+            if (line.startsWith('event:')) {
+                type = line.slice(6).trim();
+            } else if (line.startsWith('data:')) {
+                dataLines.push(line.slice(5).trim());
+            }
+        }
+        if (dataLines.length === 0) return null;
+        return { type, data: JSON.parse(dataLines.join('\n')) };
+    }
+    
+    mergeFragment(days, fragment) {
+        for (const day of fragment) {
+            const existing = days.get(day.workDate);
+            if (!existing) {
+                days.set(day.workDate, { ...day, daySummary: { ...day.daySummary }, issues: [...day.issues] });
+                continue;
+            }
+            existing.issues.push(...day.issues);
+            const total = existing.daySummary.totalTimeSpentSeconds + day.daySummary.totalTimeSpentSeconds;
+            existing.daySummary = {
+                totalTimeSpentSeconds: total,
+                totalTimeSpentFormatted: this.formatSeconds(total)
+            };
+        }
+    }
+    
+    scheduleRender(days) {
+        // Fragments can arrive faster than the browser paints; render at most once per frame.
+        if (this.renderPending) return;
+        this.renderPending = true;
+        requestAnimationFrame(() => {
+            this.renderPending = false;
+            if (days.size === 0) return;
+            this.currentData = this.sortedDays(days);
+            this.renderResults(this.currentData);
+        });
+    }
+    
+    sortedDays(days) {
+        return [...days.values()].sort((a, b) => a.workDate.localeCompare(b.workDate));
+    }
+    
+    formatSeconds(seconds) {
+        const hours = Math.floor(seconds / 3600);
+        const minutes = Math.floor((seconds % 3600) / 60);
+        if (hours && minutes) return `${hours}h ${minutes}m`;
+        if (hours) return `${hours}h`;
+        return `${minutes}m`;
+    }
+    
     renderResults(data) {
         const resultsContainer = document.getElementById('resultsContainer');
         if (!resultsContainer) return;
@@ -654,6 +776,47 @@ class WorklogForm {
         });
     }
     
+    renderFreshness(freshness) {
+        const notice = document.getElementById('freshnessNotice');
+        if (!notice) return;
+        
+        if (!freshness || !freshness.stale) {
+            notice.textContent = '';
+            notice.style.display = 'none';
+            return;
+        }
+        
+        const minutes = Math.floor(freshness.ageSeconds / 60);
+        notice.textContent = `Showing a summary from ${minutes} min ago; it is being refreshed in the background.`;
+        notice.style.display = 'block';
+    }
+    
+    renderCompleteness(completeness) {
+        const notice = document.getElementById('completenessNotice');
+        if (!notice) return;
+        
+        if (!completeness || completeness.complete) {
+            notice.innerHTML = '';
+            notice.style.display = 'none';
+            return;
+        }
+        
+        const missing = [
+            ...completeness.failedIssues,
+            ...completeness.timedOutIssues,
+            ...completeness.skippedIssues
+        ];
+        const foundSoFar = completeness.truncated ? ' found so far' : '';
+        const missingText = missing.length > 0 ? ` Not loaded: ${this.escapeHtml(missing.join(', '))}.` : '';
+        notice.innerHTML = `
+            <div class="rounded-lg border border-yellow-200 bg-yellow-50 p-4 text-yellow-800">
+                <h3 class="text-sm font-semibold mb-1">Partial results</h3>
+                <p class="text-sm">Showing worklogs from ${completeness.issuesFetched} of ${completeness.issuesTotal} issues${foundSoFar}.${missingText}</p>
+            </div>
+        `;
+        notice.style.display = 'block';
+    }
+    
     showError(message) {
         const errorContainer = document.getElementById('errorContainer');
         if (errorContainer) {
@@ -0,0 +1,10 @@
+"""Shared test setup."""
+
+import os
+
+# app.core.config refuses to import without Jira settings; tests never talk to Jira.
+for _name in ("JIRA_DOMAIN", "JIRA_OAUTH_CLIENT_ID", "JIRA_OAUTH_CLIENT_SECRET"):
+    os.environ.setdefault(_name, "test")
+
+# Load the core package first, as app.main does; app.domain and app.core import each other.
+import app.core  # noqa: E402,F401
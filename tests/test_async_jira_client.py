@@ -0,0 +1,83 @@
+"""Tests for the guards around each ``AsyncJiraClient`` request."""
+
+import asyncio
+import time
+
+import httpx
+import pytest
+
+from app.core.deadline import Deadline, deadline_scope
+from app.core.exceptions import DeadlineExceededError
+from app.infrastructure.async_jira_client import AsyncJiraClient
+from app.infrastructure.circuit_breaker import CircuitBreakerRegistry, STATE_HALF_OPEN
+from app.infrastructure.concurrency import AdaptiveConcurrencyLimiter, OUTCOME_IGNORED
+from app.infrastructure.rate_limiter import JiraRateLimiter
+
+CLOUD_ID = "cloud"
+
+
+def ok(request: httpx.Request) -> httpx.Response:
+    return httpx.Response(200, json={})
+
+
+def make_client(**kwargs) -> AsyncJiraClient:
+    kwargs.setdefault("rate_limiter", JiraRateLimiter(rate=1000, burst=1000))
+    kwargs.setdefault("concurrency_limiter", AdaptiveConcurrencyLimiter(initial=1, floor=1, ceiling=1))
+    kwargs.setdefault("circuit_breakers", CircuitBreakerRegistry(failure_threshold=1, reset_timeout=0))
+    return AsyncJiraClient(
+        access_token="token",
+        cloud_id=CLOUD_ID,
+        http_client=httpx.AsyncClient(transport=httpx.MockTransport(ok)),
+        **kwargs
+    )
+
+
+def test_cancelled_probe_waiting_for_a_slot_frees_the_breaker() -> None:
+    concurrency = AdaptiveConcurrencyLimiter(initial=1, floor=1, ceiling=1)
+    client = make_client(concurrency_limiter=concurrency)
+    breaker = client._circuit_breaker
+    breaker.record_failure()
+
+    async def run() -> None:
+        assert concurrency.acquire(CLOUD_ID, 0)
+        probe = asyncio.create_task(client._get("https://jira.example/rest/api/3/myself"))
+        await asyncio.sleep(0.05)
+        assert breaker.state == STATE_HALF_OPEN
+        probe.cancel()
+        try:
+            await probe
+        except asyncio.CancelledError:
+            pass
+        concurrency.release(CLOUD_ID, 0.0, OUTCOME_IGNORED)
+
+        response = await client._get("https://jira.example/rest/api/3/myself")
+        assert response.status_code == 200
+
+    asyncio.run(run())
+    assert breaker.stats()["state"] == "closed"
+
+
+def test_rate_limit_pause_past_the_deadline_fails_fast() -> None:
+    rate_limiter = JiraRateLimiter(rate=1000, burst=1000)
+    rate_limiter.observe(CLOUD_ID, 429, {"Retry-After": "3"})
+    client = make_client(rate_limiter=rate_limiter)
+
+    async def run() -> None:
+        with deadline_scope(Deadline(0.5)):
+            await client._get("https://jira.example/rest/api/3/myself")
+
+    started = time.monotonic()
+    with pytest.raises(DeadlineExceededError):
+        asyncio.run(run())
+    assert time.monotonic() - started < 0.5
+    assert client._circuit_breaker.stats()["consecutiveFailures"] == 0
+
+
+def test_token_wait_past_the_deadline_does_not_take_a_token() -> None:
+    rate_limiter = JiraRateLimiter(rate=1, burst=1)
+    asyncio.run(rate_limiter.acquire_async(CLOUD_ID))
+
+    with pytest.raises(DeadlineExceededError):
+        asyncio.run(rate_limiter.acquire_async(CLOUD_ID, Deadline(0.5)))
+
+    assert rate_limiter.stats()[CLOUD_ID]["tokens"] >= 0
@@ -0,0 +1,52 @@
+"""Tests for the in-memory TTL cache."""
+
+from app.core.cache import TTLCache
+
+
+def make_cache(**kwargs) -> TTLCache:
+    return TTLCache(max_size=10, ttl=60, max_bytes=100, sizeof=len, **kwargs)
+
+
+def test_evicts_least_recently_used_entries_over_max_bytes() -> None:
+    cache = make_cache()
+    cache.set("a", "x" * 40)
+    cache.set("b", "x" * 40)
+    cache.get("a")
+
+    cache.set("c", "x" * 40)
+
+    assert cache.get("b") is None
+    assert cache.get("a") is not None and cache.get("c") is not None
+    assert cache.stats()["bytes"] == 80
+
+
+def test_does_not_store_a_value_larger_than_max_bytes() -> None:
+    cache = make_cache()
+    cache.set("a", "x" * 40)
+
+    cache.set("b", "x" * 101)
+
+    assert cache.get("b") is None
+    assert cache.get("a") is not None
+    assert cache.stats()["oversized"] == 1
+
+
+def test_replacing_and_deleting_entries_releases_their_size() -> None:
+    cache = make_cache()
+    cache.set("a", "x" * 40)
+    cache.set("a", "x" * 10)
+    assert cache.stats()["bytes"] == 10
+
+    cache.delete("a")
+
+    assert cache.stats()["bytes"] == 0
+
+
+def test_without_max_bytes_only_the_entry_count_is_bounded() -> None:
+    cache = TTLCache(max_size=2, ttl=60, sizeof=len)
+    cache.set("a", "x" * 1000)
+    cache.set("b", "x" * 1000)
+    cache.set("c", "x" * 1000)
+
+    assert cache.get("a") is None
+    assert cache.stats()["size"] == 2
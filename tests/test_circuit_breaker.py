@@ -0,0 +1,38 @@
+"""Tests for the per-site Jira circuit breaker."""
+
+import pytest
+
+from app.core.exceptions import CircuitOpenError
+from app.infrastructure.circuit_breaker import CircuitBreaker, STATE_HALF_OPEN
+
+
+def test_half_open_breaker_admits_a_single_probe() -> None:
+    breaker = CircuitBreaker("cloud", failure_threshold=1, reset_timeout=0)
+    breaker.record_failure()
+
+    assert breaker.before_call() is True
+    assert breaker.state == STATE_HALF_OPEN
+    with pytest.raises(CircuitOpenError):
+        breaker.before_call()
+
+
+def test_cancelled_probe_lets_the_next_probe_through() -> None:
+    breaker = CircuitBreaker("cloud", failure_threshold=1, reset_timeout=0)
+    breaker.record_failure()
+    probe = breaker.before_call()
+
+    breaker.record_cancelled(probe)
+
+    assert breaker.before_call() is True
+
+
+def test_cancelling_a_call_admitted_while_closed_keeps_the_probe_slot() -> None:
+    breaker = CircuitBreaker("cloud", failure_threshold=1, reset_timeout=0)
+    earlier_call = breaker.before_call()
+    breaker.record_failure()
+    assert breaker.before_call() is True
+
+    breaker.record_cancelled(earlier_call)
+
+    with pytest.raises(CircuitOpenError):
+        breaker.before_call()
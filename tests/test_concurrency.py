@@ -0,0 +1,108 @@
+"""Tests for the adaptive per-site Jira concurrency limit."""
+
+import threading
+import time
+
+from app.infrastructure.concurrency import (
+    AdaptiveConcurrencyLimiter,
+    OUTCOME_IGNORED,
+    OUTCOME_OK,
+    OUTCOME_OVERLOAD,
+    outcome_for_status
+)
+
+CLOUD_ID = "cloud"
+
+
+def fill(limiter: AdaptiveConcurrencyLimiter) -> int:
+    """Take every free slot and return how many were taken."""
+    taken = 0
+    while limiter.acquire(CLOUD_ID, 0):
+        taken += 1
+    return taken
+
+
+def limit(limiter: AdaptiveConcurrencyLimiter) -> int:
+    return limiter.stats()[CLOUD_ID]["limit"]
+
+
+def test_outcome_for_status_treats_throttling_as_overload() -> None:
+    assert outcome_for_status(429) == OUTCOME_OVERLOAD
+    assert outcome_for_status(503) == OUTCOME_OVERLOAD
+    assert outcome_for_status(500) == OUTCOME_IGNORED
+    assert outcome_for_status(502) == OUTCOME_IGNORED
+    assert outcome_for_status(200) == OUTCOME_OK
+    assert outcome_for_status(404) == OUTCOME_OK
+
+
+def test_overload_halves_the_limit_once_per_round_trip() -> None:
+    limiter = AdaptiveConcurrencyLimiter(initial=8, floor=1, ceiling=8)
+    assert fill(limiter) == 8
+
+    for _ in range(8):
+        limiter.release(CLOUD_ID, 0.01, OUTCOME_OVERLOAD)
+
+    assert limit(limiter) == 4
+    assert limiter.stats()[CLOUD_ID]["decreases"] == 1
+    assert fill(limiter) == 4
+
+
+def test_limit_never_drops_below_the_floor() -> None:
+    limiter = AdaptiveConcurrencyLimiter(initial=2, floor=2, ceiling=8)
+    fill(limiter)
+
+    limiter.release(CLOUD_ID, 0.01, OUTCOME_OVERLOAD)
+
+    assert limit(limiter) == 2
+
+
+def test_limit_grows_back_on_healthy_successes() -> None:
+    limiter = AdaptiveConcurrencyLimiter(initial=8, floor=1, ceiling=8)
+    fill(limiter)
+    for _ in range(8):
+        limiter.release(CLOUD_ID, 0.01, OUTCOME_OVERLOAD)
+    assert limit(limiter) == 4
+
+    for _ in range(50):
+        for _ in range(fill(limiter)):
+            limiter.release(CLOUD_ID, 0.01, OUTCOME_OK)
+
+    assert limit(limiter) == 8
+    assert limiter.stats()[CLOUD_ID]["increases"] == 4
+
+
+def test_ignored_outcomes_leave_the_limit_alone() -> None:
+    limiter = AdaptiveConcurrencyLimiter(initial=4, floor=1, ceiling=8)
+    for _ in range(20):
+        for _ in range(fill(limiter)):
+            limiter.release(CLOUD_ID, 0.01, OUTCOME_IGNORED)
+
+    assert limit(limiter) == 4
+
+
+def test_acquire_gives_up_after_its_timeout() -> None:
+    limiter = AdaptiveConcurrencyLimiter(initial=1, floor=1, ceiling=1)
+    assert limiter.acquire(CLOUD_ID, 0)
+
+    started = time.monotonic()
+    assert not limiter.acquire(CLOUD_ID, 0.1)
+    assert 0.1 <= time.monotonic() - started < 0.5
+    assert limiter.stats()[CLOUD_ID]["waiting"] == 0
+
+    limiter.release(CLOUD_ID, 0.01, OUTCOME_IGNORED)
+    assert limiter.stats()[CLOUD_ID]["inFlight"] == 0
+
+
+def test_released_slot_is_handed_to_a_waiter() -> None:
+    limiter = AdaptiveConcurrencyLimiter(initial=1, floor=1, ceiling=1)
+    assert limiter.acquire(CLOUD_ID, 0)
+    granted = []
+    waiter = threading.Thread(target=lambda: granted.append(limiter.acquire(CLOUD_ID, 2)))
+    waiter.start()
+    time.sleep(0.05)
+
+    limiter.release(CLOUD_ID, 0.01, OUTCOME_OK)
+    waiter.join()
+
+    assert granted == [True]
+    assert limiter.stats()[CLOUD_ID]["inFlight"] == 1
@@ -0,0 +1,130 @@
+"""Tests for carrying a request deadline to the Jira calls made for it."""
+
+import asyncio
+import contextvars
+import threading
+import time
+from typing import Any, AsyncGenerator, Generator, List, Optional
+
+import requests
+
+from app.core.deadline import Deadline, aiter_in_scope, current_deadline, deadline_scope, iter_in_scope
+from app.infrastructure.circuit_breaker import CircuitBreakerRegistry
+from app.infrastructure.concurrency import AdaptiveConcurrencyLimiter
+from app.infrastructure.jira_client import JiraClient
+from app.infrastructure.rate_limiter import JiraRateLimiter
+
+CLOUD_ID = "cloud"
+
+
+def seen_deadlines(count: int) -> Generator[Optional[Deadline], None, None]:
+    for _ in range(count):
+        yield current_deadline()
+
+
+async def aseen_deadlines(count: int) -> AsyncGenerator[Optional[Deadline], None]:
+    for _ in range(count):
+        yield current_deadline()
+
+
+def test_generator_runs_under_the_scope_but_its_consumer_does_not() -> None:
+    deadline = Deadline(5)
+    consumer = []
+
+    seen = []
+    for item in iter_in_scope(deadline, seen_deadlines(2)):
+        seen.append(item)
+        consumer.append(current_deadline())
+
+    assert seen == [deadline, deadline]
+    assert consumer == [None, None]
+
+
+def test_async_generator_runs_under_the_scope_but_its_consumer_does_not() -> None:
+    deadline = Deadline(5)
+
+    async def run() -> List[List[Optional[Deadline]]]:
+        seen, consumer = [], []
+        async for item in aiter_in_scope(deadline, aseen_deadlines(2)):
+            seen.append(item)
+            consumer.append(current_deadline())
+        return [seen, consumer]
+
+    assert asyncio.run(run()) == [[deadline, deadline], [None, None]]
+
+
+def test_scope_reaches_worker_threads_through_a_copied_context() -> None:
+    deadline = Deadline(5)
+    seen = []
+
+    with deadline_scope(deadline):
+        context = contextvars.copy_context()
+        plain = threading.Thread(target=lambda: seen.append(current_deadline()))
+        plain.start()
+        plain.join()
+
+        async def in_thread() -> Optional[Deadline]:
+            return await asyncio.to_thread(current_deadline)
+
+        from_to_thread = asyncio.run(in_thread())
+
+    copied = threading.Thread(target=lambda: seen.append(context.run(current_deadline)))
+    copied.start()
+    copied.join()
+
+    assert seen == [None, deadline]
+    assert from_to_thread is deadline
+    assert current_deadline() is None
+
+
+class ThrottledSession:
+    """Answers with ``503`` and a ``Retry-After`` of ``retry_after`` once, then ``200``."""
+
+    def __init__(self, retry_after: str):
+        self.retry_after = retry_after
+        self.calls = 0
+
+    def request(self, method: str, url: str, **kwargs: Any) -> requests.Response:
+        self.calls += 1
+        response = requests.Response()
+        response.status_code = 503 if self.calls == 1 else 200
+        if self.calls == 1:
+            response.headers["Retry-After"] = self.retry_after
+        response._content = b"{}"
+        response._content_consumed = True
+        return response
+
+
+def make_client(session: ThrottledSession) -> JiraClient:
+    return JiraClient(
+        access_token="token",
+        cloud_id=CLOUD_ID,
+        session=session,
+        rate_limiter=JiraRateLimiter(rate=1000, burst=1000, backoff_base=0),
+        concurrency_limiter=AdaptiveConcurrencyLimiter(initial=1, floor=1, ceiling=1),
+        circuit_breakers=CircuitBreakerRegistry(failure_threshold=5, reset_timeout=0)
+    )
+
+
+def test_retry_is_skipped_when_the_backoff_exceeds_the_remaining_budget() -> None:
+    session = ThrottledSession(retry_after="2")
+    client = make_client(session)
+
+    started = time.monotonic()
+    with deadline_scope(Deadline(0.5)):
+        response = client._request("GET", "https://jira.example/rest/api/3/myself")
+
+    assert response.status_code == 503
+    assert session.calls == 1
+    assert time.monotonic() - started < 0.5
+
+
+def test_retry_is_made_when_the_backoff_fits_the_remaining_budget() -> None:
+    session = ThrottledSession(retry_after="0.05")
+    client = make_client(session)
+
+    with deadline_scope(Deadline(5)):
+        response = client._request("GET", "https://jira.example/rest/api/3/myself")
+
+    assert response.status_code == 200
+    assert session.calls == 2
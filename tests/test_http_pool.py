@@ -0,0 +1,67 @@
+"""Tests for the pooled Jira HTTP transports."""
+
+import asyncio
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Iterator, List, Optional
+
+import pytest
+
+from app.infrastructure.http_pool import JiraTransportRegistry
+
+
+class CookieSettingHandler(BaseHTTPRequestHandler):
+    """Sets a session cookie on every response and records the cookies each request sent."""
+
+    received: List[Optional[str]] = []
+
+    def do_GET(self) -> None:
+        type(self).received.append(self.headers.get("Cookie"))
+        body = b"{}"
+        self.send_response(200)
+        self.send_header("Set-Cookie", "atlassian.xsrf.token=user-a; Path=/")
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args) -> None:
+        pass
+
+
+@pytest.fixture
+def server_url() -> Iterator[str]:
+    CookieSettingHandler.received = []
+    server = ThreadingHTTPServer(("127.0.0.1", 0), CookieSettingHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield f"http://127.0.0.1:{server.server_address[1]}/rest/api/3/myself"
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def test_pooled_session_does_not_carry_cookies_between_calls(server_url: str) -> None:
+    session = JiraTransportRegistry().get_session("cloud")
+
+    session.get(server_url, timeout=5)
+    session.get(server_url, timeout=5)
+
+    assert CookieSettingHandler.received == [None, None]
+    assert len(session.cookies) == 0
+
+
+def test_pooled_async_client_does_not_carry_cookies_between_calls(server_url: str) -> None:
+    registry = JiraTransportRegistry()
+
+    async def call_twice() -> int:
+        client = registry.get_async_client("cloud")
+        await client.get(server_url)
+        await client.get(server_url)
+        cookies = len(client.cookies.jar)
+        await registry.aclose()
+        return cookies
+
+    assert asyncio.run(call_twice()) == 0
+    assert CookieSettingHandler.received == [None, None]
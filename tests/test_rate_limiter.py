@@ -0,0 +1,95 @@
+"""Tests for per-site Jira request scheduling."""
+
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+
+import pytest
+
+from app.core.deadline import Deadline
+from app.core.exceptions import DeadlineExceededError
+from app.infrastructure.rate_limiter import JiraRateLimiter, TokenBucket, parse_retry_after, seconds_until
+
+CLOUD_ID = "cloud"
+
+
+def test_parse_retry_after_reads_delta_seconds() -> None:
+    assert parse_retry_after("3") == 3.0
+    assert parse_retry_after("-1") == 0.0
+    assert parse_retry_after(None) is None
+    assert parse_retry_after("soon") is None
+
+
+def test_parse_retry_after_reads_an_http_date() -> None:
+    retry_at = datetime.now(timezone.utc) + timedelta(seconds=30)
+
+    assert 28 <= parse_retry_after(format_datetime(retry_at, usegmt=True)) <= 30
+    assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0.0
+
+
+def test_seconds_until_reads_an_iso_timestamp() -> None:
+    reset_at = datetime.now(timezone.utc) + timedelta(seconds=30)
+
+    assert 28 <= seconds_until(reset_at.isoformat().replace("+00:00", "Z")) <= 30
+    assert seconds_until("not a timestamp") is None
+
+
+def test_reservations_queue_at_rate_after_a_pause() -> None:
+    bucket = TokenBucket(rate=10, capacity=1)
+    assert bucket.reserve() == 0
+
+    bucket.pause(1.0)
+
+    first, second = bucket.reserve(), bucket.reserve()
+    assert first == pytest.approx(1.1, abs=0.02)
+    assert second == pytest.approx(1.2, abs=0.02)
+
+
+def test_reserve_over_max_wait_takes_no_token() -> None:
+    bucket = TokenBucket(rate=1, capacity=1)
+
+    assert bucket.reserve(max_wait=0) == 0
+    assert bucket.reserve(max_wait=0.5) is None
+    assert bucket.reserve() == pytest.approx(1.0, abs=0.02)
+
+
+def test_acquire_raises_instead_of_waiting_past_the_deadline() -> None:
+    limiter = JiraRateLimiter(rate=1, burst=1)
+    limiter.acquire(CLOUD_ID)
+
+    with pytest.raises(DeadlineExceededError):
+        limiter.acquire(CLOUD_ID, Deadline(0.5))
+
+
+def test_acquire_raises_instead_of_pausing_past_the_deadline() -> None:
+    limiter = JiraRateLimiter(rate=1000, burst=1000)
+    assert limiter.observe(CLOUD_ID, 429, {"Retry-After": "3"}) == 3.0
+
+    with pytest.raises(DeadlineExceededError):
+        limiter.acquire(CLOUD_ID, Deadline(0.5))
+    assert limiter.stats()[CLOUD_ID]["throttled"] == 1
+
+
+def test_observe_pauses_until_the_rate_limit_resets() -> None:
+    limiter = JiraRateLimiter()
+    reset_at = (datetime.now(timezone.utc) + timedelta(seconds=5)).isoformat()
+
+    retry_after = limiter.observe(CLOUD_ID, 200, {"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": reset_at})
+
+    assert 4 <= retry_after <= 5
+    assert limiter.stats()[CLOUD_ID]["pausedForSeconds"] > 4
+
+
+def test_observe_drains_the_burst_near_the_limit() -> None:
+    limiter = JiraRateLimiter(rate=10, burst=20)
+
+    assert limiter.observe(CLOUD_ID, 200, {"X-RateLimit-NearLimit": "true"}) is None
+    assert limiter.stats()[CLOUD_ID]["tokens"] <= 0
+
+
+def test_backoff_is_jittered_and_capped() -> None:
+    limiter = JiraRateLimiter(backoff_base=1, backoff_max=4)
+
+    for attempt in range(6):
+        assert 0 <= limiter.backoff(attempt) <= min(4, 2 ** attempt)
+    assert 3 <= limiter.backoff(0, retry_after=3) <= 4
+    assert 4 <= limiter.backoff(0, retry_after=60) <= 5
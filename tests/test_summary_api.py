@@ -0,0 +1,113 @@
+"""Tests for conditional requests on the summary API."""
+
+from datetime import date, timedelta
+from typing import Any, AsyncIterator, Dict, List, Optional
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.core.cache import TTLCache
+from app.core.dependencies import AuthenticatedUser, get_current_user
+from app.domain.repositories.async_worklog_repository import AsyncWorklogRepository
+from app.domain.services.worklog_service import AsyncWorklogService
+from app.presentation.api.v1.worklogs import get_worklog_service, router
+
+ACCOUNT_ID = "me"
+WORK_DATE = (date.today() - timedelta(days=2)).isoformat()
+SUMMARY_URL = "/api/v1/jira-worklogs/summary"
+QUERY = {"startDate": WORK_DATE, "endDate": WORK_DATE}
+
+
+class FakeAsyncJiraClient:
+    """Serves one issue with one worklog of ``seconds``."""
+
+    def __init__(self):
+        self.seconds = 600
+
+    async def search_issues(self, jql: str, fields: List[str], max_results: int = 100) -> AsyncIterator[List[Dict[str, Any]]]:
+        yield [{"id": "1", "key": "P-1", "fields": {"summary": "Issue"}}]
+
+    async def get_issue_worklogs(
+        self,
+        issue_key: str,
+        started_after: Optional[int] = None,
+        started_before: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        return [{
+            "id": "1",
+            "author": {"accountId": ACCOUNT_ID, "displayName": "Me"},
+            "started": f"{WORK_DATE}T10:00:00.000+0000",
+            "updated": f"{WORK_DATE}T10:00:00.000+0000",
+            "timeSpentSeconds": self.seconds
+        }]
+
+
+@pytest.fixture
+def jira() -> FakeAsyncJiraClient:
+    return FakeAsyncJiraClient()
+
+
+@pytest.fixture
+def client(jira: FakeAsyncJiraClient) -> TestClient:
+    service = AsyncWorklogService(
+        AsyncWorklogRepository(jira),
+        user_account_id=ACCOUNT_ID,
+        summary_cache=TTLCache(max_size=10, ttl=60)
+    )
+    app = FastAPI()
+    app.include_router(router)
+    app.dependency_overrides[get_current_user] = lambda: AuthenticatedUser(ACCOUNT_ID, "Me", "", "token")
+    app.dependency_overrides[get_worklog_service] = lambda: service
+    return TestClient(app)
+
+
+def test_unchanged_summary_is_answered_with_304_on_get(client: TestClient) -> None:
+    first = client.get(SUMMARY_URL, params=QUERY)
+    etag = first.headers["ETag"]
+
+    second = client.get(SUMMARY_URL, params=QUERY, headers={"If-None-Match": etag})
+
+    assert first.status_code == 200
+    assert etag.startswith('W/"')
+    assert second.status_code == 304
+    assert second.content == b""
+    assert second.headers["ETag"] == etag
+
+
+def test_unchanged_summary_is_answered_with_304_on_post(client: TestClient) -> None:
+    etag = client.post(SUMMARY_URL, json=QUERY).headers["ETag"]
+
+    response = client.post(SUMMARY_URL, json=QUERY, headers={"If-None-Match": etag})
+
+    assert response.status_code == 304
+    assert response.headers["ETag"] == etag
+
+
+def test_formats_and_envelopes_have_distinct_etags(client: TestClient) -> None:
+    variants = [
+        {},
+        {"format": "normalized"},
+        {"envelope": "true"},
+        {"format": "normalized", "envelope": "true"}
+    ]
+    etags = [client.get(SUMMARY_URL, params={**QUERY, **variant}).headers["ETag"] for variant in variants]
+
+    assert len(set(etags)) == len(variants)
+    plain = client.get(SUMMARY_URL, params=QUERY, headers={"If-None-Match": etags[1]})
+    assert plain.status_code == 200
+
+
+def test_changed_worklog_changes_the_version(client: TestClient, jira: FakeAsyncJiraClient) -> None:
+    before = client.get(SUMMARY_URL, params={**QUERY, "envelope": "true"})
+
+    jira.seconds = 1200
+    after = client.get(
+        SUMMARY_URL,
+        params={**QUERY, "envelope": "true", "refresh": "true"},
+        headers={"If-None-Match": before.headers["ETag"]}
+    )
+
+    assert after.status_code == 200
+    assert after.json()["version"] != before.json()["version"]
+    assert after.headers["ETag"] != before.headers["ETag"]
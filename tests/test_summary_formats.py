@@ -0,0 +1,35 @@
+"""Tests for summary content versions."""
+
+from typing import Any, Dict, List
+
+from app.domain.summary_formats import summary_version
+
+
+def issue(issue_key: str, seconds: int) -> Dict[str, Any]:
+    return {"issueKey": issue_key, "issueSummary": issue_key, "worklogSummary": {"totalTimeSpentSeconds": seconds}}
+
+
+def day(work_date: str, issues: List[Dict[str, Any]]) -> Dict[str, Any]:
+    return {"workDate": work_date, "daySummary": {"totalTimeSpentSeconds": 0}, "issues": issues}
+
+
+COMPLETENESS = {"complete": False, "timedOutIssues": ["P-10", "P-2"]}
+
+
+def test_version_does_not_depend_on_fetch_order() -> None:
+    fetched = [day("2026-01-01", [issue("P-2", 60), issue("P-10", 60)]), day("2026-01-02", [issue("P-9", 60)])]
+    streamed = [
+        day("2026-01-02", [issue("P-9", 60)]),
+        {"issues": [issue("P-10", 60), issue("P-2", 60)], "daySummary": {"totalTimeSpentSeconds": 0}, "workDate": "2026-01-01"}
+    ]
+
+    assert summary_version(fetched, COMPLETENESS) == summary_version(
+        streamed,
+        {"timedOutIssues": ["P-2", "P-10"], "complete": False}
+    )
+
+
+def test_version_changes_with_content() -> None:
+    days = [day("2026-01-01", [issue("P-2", 60)])]
+
+    assert summary_version(days, COMPLETENESS) != summary_version([day("2026-01-01", [issue("P-2", 120)])], COMPLETENESS)
@@ -0,0 +1,72 @@
+"""Tests for bucketing Jira worklog timestamps into a user's days."""
+
+from datetime import datetime, timedelta, timezone
+
+from app.domain.aggregation import WorklogAggregator
+from app.utils.timestamps import TimestampFormatter, parse_jira_timestamp, resolve_time_zone
+
+ACCOUNT_ID = "me"
+
+
+def test_parse_jira_timestamp_reads_jira_offsets() -> None:
+    parsed = parse_jira_timestamp("2026-01-15T09:30:00.000+0530")
+
+    assert parsed == datetime(2026, 1, 15, 4, 0, tzinfo=timezone.utc)
+    assert parsed.utcoffset() == timedelta(hours=5, minutes=30)
+    assert parse_jira_timestamp("2026-01-15T04:00:00Z") == parsed
+    assert parse_jira_timestamp("yesterday") is None
+
+
+def test_utc_evening_lands_on_the_next_day_in_kolkata() -> None:
+    formatter = TimestampFormatter("Asia/Kolkata")
+
+    assert formatter.work_date("2026-01-15T20:00:00.000+0000") == "2026-01-16"
+    assert formatter.local_parts("2026-01-15T18:29:00.000+0000") == ("2026-01-15", "23:59")
+    assert formatter.display_datetime("2026-01-15T20:00:00.000+0000") == "16-01-2026 01:30"
+
+
+def test_offset_date_is_kept_without_a_time_zone() -> None:
+    formatter = TimestampFormatter()
+
+    assert formatter.time_zone is None
+    assert formatter.work_date("2026-01-15T20:00:00.000+0000") == "2026-01-15"
+    assert formatter.work_date("2026-01-16T01:30:00.000+0530") == "2026-01-16"
+
+
+def test_unknown_time_zone_falls_back_to_the_offset_date() -> None:
+    formatter = TimestampFormatter("Mars/Olympus_Mons")
+
+    assert resolve_time_zone("Mars/Olympus_Mons") is None
+    assert formatter.time_zone is None
+    assert formatter.work_date("2026-01-15T20:00:00.000+0000") == "2026-01-15"
+
+
+def test_days_follow_daylight_saving_transitions() -> None:
+    formatter = TimestampFormatter("America/New_York")
+
+    # 04:30 UTC is just after midnight under EDT (-4) but still the previous evening under EST (-5).
+    assert formatter.local_parts("2026-10-31T04:30:00.000+0000") == ("2026-10-31", "00:30")
+    assert formatter.local_parts("2026-11-02T04:30:00.000+0000") == ("2026-11-01", "23:30")
+    # Clocks jump from 02:00 EST to 03:00 EDT at 07:00 UTC on 8 March 2026.
+    assert formatter.local_parts("2026-03-08T06:30:00.000+0000") == ("2026-03-08", "01:30")
+    assert formatter.local_parts("2026-03-08T07:30:00.000+0000") == ("2026-03-08", "03:30")
+
+
+def test_aggregator_counts_a_worklog_on_the_viewers_day() -> None:
+    issue = {"key": "P-1", "fields": {"summary": "Night shift"}}
+    worklogs = [{
+        "id": "1",
+        "author": {"accountId": ACCOUNT_ID, "displayName": "Me"},
+        "started": "2026-01-15T20:00:00.000+0000",
+        "timeSpentSeconds": 3600
+    }]
+
+    in_kolkata = list(WorklogAggregator("Asia/Kolkata").worklog_records(
+        issue, worklogs, ACCOUNT_ID, "2026-01-16", "2026-01-16"
+    ))
+    in_jira_offset = list(WorklogAggregator().worklog_records(
+        issue, worklogs, ACCOUNT_ID, "2026-01-16", "2026-01-16"
+    ))
+
+    assert [record["workDate"] for record in in_kolkata] == ["2026-01-16"]
+    assert in_jira_offset == []
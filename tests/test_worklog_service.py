@@ -0,0 +1,63 @@
+"""Tests for the summaries built by ``AsyncWorklogService``."""
+
+import asyncio
+from datetime import date, timedelta
+from typing import Any, AsyncIterator, Dict, List, Optional
+
+from app.core.cache import TTLCache
+from app.domain.repositories.async_worklog_repository import AsyncWorklogRepository
+from app.domain.services.worklog_service import AsyncWorklogService
+
+ACCOUNT_ID = "me"
+WORK_DATE = (date.today() - timedelta(days=2)).isoformat()
+# Search order, deliberately neither key order nor the order fetches finish in.
+ISSUE_KEYS = ["P-10", "P-2", "P-9"]
+
+
+class FakeAsyncJiraClient:
+    """Returns each issue's worklogs after a delay, so later search results can finish first."""
+
+    def __init__(self, delays: Dict[str, float]):
+        self.delays = delays
+
+    async def search_issues(self, jql: str, fields: List[str], max_results: int = 100) -> AsyncIterator[List[Dict[str, Any]]]:
+        yield [{"id": key, "key": key, "fields": {"summary": key}} for key in ISSUE_KEYS]
+
+    async def get_issue_worklogs(
+        self,
+        issue_key: str,
+        started_after: Optional[int] = None,
+        started_before: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        await asyncio.sleep(self.delays[issue_key])
+        return [{
+            "id": issue_key,
+            "author": {"accountId": ACCOUNT_ID, "displayName": "Me"},
+            "started": f"{WORK_DATE}T10:00:00.000+0000",
+            "updated": f"{WORK_DATE}T10:00:00.000+0000",
+            "timeSpentSeconds": 600
+        }]
+
+
+def make_service(delays: Dict[str, float]) -> AsyncWorklogService:
+    repository = AsyncWorklogRepository(FakeAsyncJiraClient(delays), max_workers=len(ISSUE_KEYS))
+    return AsyncWorklogService(repository, user_account_id=ACCOUNT_ID, summary_cache=TTLCache(max_size=10, ttl=60))
+
+
+def test_streamed_summary_is_cached_in_the_same_order_as_a_fetched_one() -> None:
+    streamed = make_service({"P-10": 0.03, "P-2": 0.02, "P-9": 0.01})
+    fetched = make_service({"P-10": 0.01, "P-2": 0.02, "P-9": 0.03})
+
+    async def run() -> List[Dict[str, Any]]:
+        async for _ in streamed.stream_worklog_summary(ACCOUNT_ID, WORK_DATE, WORK_DATE):
+            pass
+        return [
+            await streamed.get_worklog_summary_envelope(ACCOUNT_ID, WORK_DATE, WORK_DATE),
+            await fetched.get_worklog_summary_envelope(ACCOUNT_ID, WORK_DATE, WORK_DATE)
+        ]
+
+    from_stream, from_fetch = asyncio.run(run())
+
+    assert [issue["issueKey"] for issue in from_fetch["days"][0]["issues"]] == ["P-2", "P-9", "P-10"]
+    assert from_stream["days"] == from_fetch["days"]
+    assert from_stream["version"] == from_fetch["version"]
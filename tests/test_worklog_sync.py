@@ -0,0 +1,244 @@
+"""Tests for the local worklog store sync and the repositories reading from it."""
+
+import asyncio
+import time
+from datetime import date, timedelta
+from typing import Any, AsyncIterator, Dict, Iterator, List, Optional
+
+import pytest
+
+from app.core.deadline import Deadline, current_deadline
+from app.core.exceptions import ExternalServiceError
+from app.core.singleflight import AsyncSingleFlight
+from app.domain.repositories.async_worklog_repository import AsyncWorklogRepository
+from app.domain.repositories.local_worklog_repository import AsyncLocalWorklogRepository, LocalWorklogRepository
+from app.domain.services.worklog_service import AsyncWorklogService
+from app.domain.services.worklog_sync_service import WorklogSyncService
+from app.infrastructure.worklog_store import SqliteWorklogStore
+
+CLOUD_ID = "cloud"
+ACCOUNT_ID = "me"
+WORK_DATE = (date.today() - timedelta(days=2)).isoformat()
+# Feed cursors handed out by the fake client, later than any real sync start.
+FIRST_UNTIL = 10 ** 13
+
+
+def worklog(worklog_id: int, issue_id: str) -> Dict[str, Any]:
+    return {
+        "id": str(worklog_id),
+        "issueId": issue_id,
+        "author": {"accountId": ACCOUNT_ID, "displayName": "Me"},
+        "started": f"{WORK_DATE}T10:00:00.000+0000",
+        "updated": f"{WORK_DATE}T10:00:00.000+0000",
+        "timeSpentSeconds": 3600
+    }
+
+
+class FakeJiraClient:
+    """Serves the worklog feeds from ``pages``, optionally failing after ``fail_after`` of them.
+
+    Each feed page takes ``delay`` seconds to arrive.
+    """
+
+    def __init__(self, pages: List[List[Dict[str, Any]]], fail_after: int = -1, delay: float = 0):
+        self.pages = pages
+        self.fail_after = fail_after
+        self.delay = delay
+        self.summaries: Dict[str, str] = {}
+        self.searches: List[str] = []
+
+    def iter_updated_worklogs(self, since: int) -> Iterator[Dict[str, Any]]:
+        for index, page in enumerate(self.pages):
+            until = FIRST_UNTIL + index
+            if until <= since:
+                continue
+            if index == self.fail_after:
+                raise ExternalServiceError("Jira unavailable", "Jira")
+            time.sleep(self.delay)
+            yield {"values": [{"worklogId": wl["id"]} for wl in page], "until": until}
+
+    def iter_deleted_worklogs(self, since: int) -> Iterator[Dict[str, Any]]:
+        yield {"values": [], "until": since}
+
+    def get_worklogs_by_ids(self, worklog_ids: List[Any]) -> List[Dict[str, Any]]:
+        worklogs = {wl["id"]: wl for page in self.pages for wl in page}
+        return [worklogs[worklog_id] for worklog_id in worklog_ids]
+
+    def search_issues(self, jql: str, fields: List[str], max_results: int = 100) -> Iterator[List[Dict[str, Any]]]:
+        self.searches.append(jql)
+        if jql.startswith("id in ("):
+            issue_ids = jql[len("id in ("):-1].split(",")
+        else:
+            issue_ids = list(self.summaries)
+        yield [
+            {"id": issue_id, "key": f"P-{issue_id}", "fields": {"summary": self.summaries.get(issue_id, "Original")}}
+            for issue_id in issue_ids
+        ]
+
+
+@pytest.fixture
+def store(tmp_path) -> SqliteWorklogStore:
+    return SqliteWorklogStore(str(tmp_path / "worklogs.db"))
+
+
+def make_sync(client: FakeJiraClient, store: SqliteWorklogStore) -> WorklogSyncService:
+    return WorklogSyncService(client, store, CLOUD_ID, ACCOUNT_ID, lookback_days=30, min_interval=0, max_age=60)
+
+
+class LiveJira:
+    async def get_worklogs_by_date_range(self, *args, **kwargs) -> str:
+        return "live"
+
+
+class SlowAsyncJiraClient:
+    """Live Jira whose per-issue worklog fetches take ``delay`` seconds."""
+
+    def __init__(self, delay: float):
+        self.delay = delay
+
+    async def search_issues(self, jql: str, fields: List[str], max_results: int = 100) -> AsyncIterator[List[Dict[str, Any]]]:
+        yield [{"id": "10", "key": "P-10", "fields": {"summary": "Slow"}}]
+
+    async def get_issue_worklogs(
+        self,
+        issue_key: str,
+        started_after: Optional[int] = None,
+        started_before: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        await asyncio.sleep(self.delay)
+        return [worklog(1, "10")]
+
+
+async def finish_syncs(single_flight: AsyncSingleFlight) -> None:
+    while single_flight.stats()["inFlight"]:
+        await asyncio.sleep(0.01)
+
+
+def test_interrupted_sync_keeps_the_cursor_of_each_finished_page(store: SqliteWorklogStore) -> None:
+    client = FakeJiraClient([[worklog(1, "10")], [worklog(2, "11")]], fail_after=1)
+    sync = make_sync(client, store)
+
+    with pytest.raises(ExternalServiceError):
+        sync.sync()
+
+    state = store.get_sync_state(CLOUD_ID, ACCOUNT_ID)
+    assert state["updatedSince"] == FIRST_UNTIL
+    assert state["syncedAt"] == 0
+    assert not sync.covers(WORK_DATE)
+
+    client.fail_after = -1
+    assert sync.sync()["updated"] == 1
+    assert sync.covers(WORK_DATE)
+
+
+def test_store_is_not_served_until_a_sync_completes(store: SqliteWorklogStore) -> None:
+    client = FakeJiraClient([[worklog(1, "10")]], fail_after=0)
+    repository = LocalWorklogRepository(store, make_sync(client, store), CLOUD_ID, ACCOUNT_ID)
+    single_flight = AsyncSingleFlight()
+    adapter = AsyncLocalWorklogRepository(repository, fallback=LiveJira(), single_flight=single_flight)
+
+    async def run() -> None:
+        assert await adapter.get_worklogs_by_date_range(ACCOUNT_ID, WORK_DATE, WORK_DATE) == "live"
+        await finish_syncs(single_flight)
+        assert await adapter.get_worklogs_by_date_range(ACCOUNT_ID, WORK_DATE, WORK_DATE) == "live"
+        await finish_syncs(single_flight)
+
+        client.fail_after = -1
+        assert await adapter.get_worklogs_by_date_range(ACCOUNT_ID, WORK_DATE, WORK_DATE) == "live"
+        await finish_syncs(single_flight)
+        days = await adapter.get_worklogs_by_date_range(ACCOUNT_ID, WORK_DATE, WORK_DATE)
+        assert days[0]["daySummary"]["totalTimeSpentSeconds"] == 3600
+
+    asyncio.run(run())
+
+
+def test_requests_do_not_wait_for_a_store_sync(store: SqliteWorklogStore) -> None:
+    client = FakeJiraClient([[worklog(1, "10")]], delay=0.5)
+    repository = LocalWorklogRepository(store, make_sync(client, store), CLOUD_ID, ACCOUNT_ID)
+    single_flight = AsyncSingleFlight()
+    adapter = AsyncLocalWorklogRepository(repository, fallback=LiveJira(), single_flight=single_flight)
+
+    async def run() -> None:
+        started = time.monotonic()
+        results = await asyncio.gather(*(
+            adapter.get_worklogs_by_date_range(ACCOUNT_ID, WORK_DATE, WORK_DATE) for _ in range(3)
+        ))
+        assert results == ["live"] * 3
+        assert time.monotonic() - started < 0.5
+        assert single_flight.stats()["executions"] == 1
+        await finish_syncs(single_flight)
+
+    asyncio.run(run())
+    assert repository.is_current(ACCOUNT_ID, WORK_DATE)
+
+
+def test_slow_sync_does_not_hold_a_request_past_its_deadline(store: SqliteWorklogStore) -> None:
+    client = FakeJiraClient([[worklog(1, "10")]], delay=1)
+    repository = LocalWorklogRepository(store, make_sync(client, store), CLOUD_ID, ACCOUNT_ID)
+    single_flight = AsyncSingleFlight()
+    live = AsyncWorklogRepository(SlowAsyncJiraClient(delay=1))
+    adapter = AsyncLocalWorklogRepository(repository, fallback=live, single_flight=single_flight)
+    service = AsyncWorklogService(adapter, user_account_id=ACCOUNT_ID, cloud_id=CLOUD_ID)
+
+    async def run() -> Dict[str, Any]:
+        started = time.monotonic()
+        envelope = await service.get_worklog_summary_envelope(
+            ACCOUNT_ID, WORK_DATE, WORK_DATE, deadline=Deadline(0.3)
+        )
+        assert time.monotonic() - started < 0.6
+        await finish_syncs(single_flight)
+        return envelope
+
+    envelope = asyncio.run(run())
+    assert envelope["completeness"]["complete"] is False
+    assert envelope["completeness"]["timedOutIssues"] == ["P-10"]
+
+
+def test_local_reads_run_under_the_request_deadline(store: SqliteWorklogStore) -> None:
+    repository = LocalWorklogRepository(store, make_sync(FakeJiraClient([[worklog(1, "10")]]), store), CLOUD_ID, ACCOUNT_ID)
+    repository.sync_if_stale()
+    seen = []
+    is_current = repository.is_current
+
+    def recording_is_current(account_id: str, start_date: str) -> bool:
+        seen.append(current_deadline())
+        return is_current(account_id, start_date)
+
+    repository.is_current = recording_is_current
+    adapter = AsyncLocalWorklogRepository(repository, fallback=LiveJira())
+    deadline = Deadline(5)
+
+    days = asyncio.run(adapter.get_worklogs_by_date_range(ACCOUNT_ID, WORK_DATE, WORK_DATE, deadline=deadline))
+
+    assert days[0]["daySummary"]["totalTimeSpentSeconds"] == 3600
+    assert seen == [deadline]
+
+
+def test_store_is_not_served_once_its_last_sync_is_too_old(store: SqliteWorklogStore) -> None:
+    sync = make_sync(FakeJiraClient([[worklog(1, "10")]]), store)
+    sync.sync()
+    state = store.get_sync_state(CLOUD_ID, ACCOUNT_ID)
+    store.set_sync_state(
+        CLOUD_ID,
+        ACCOUNT_ID,
+        updated_since=state["updatedSince"],
+        deleted_since=state["deletedSince"],
+        issues_since=state["issuesSince"],
+        horizon_date=state["horizonDate"],
+        synced_at=time.time() - 61
+    )
+
+    assert not sync.covers(WORK_DATE)
+
+
+def test_issue_metadata_is_refreshed_without_worklog_changes(store: SqliteWorklogStore) -> None:
+    client = FakeJiraClient([[worklog(1, "10")]])
+    sync = make_sync(client, store)
+    sync.sync()
+
+    client.summaries["10"] = "Renamed"
+    sync.sync()
+
+    [(issue, _)] = store.get_worklogs_by_date_range(CLOUD_ID, ACCOUNT_ID, WORK_DATE, WORK_DATE)
+    assert issue["fields"]["summary"] == "Renamed"
+    assert any("updated >=" in jql for jql in client.searches)